@@ -0,0 +1,313 @@
+from PaAPI import *
+import asyncio
+import ssl
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote, urlsplit
+class AsyncPaAPI(PaAPI):
+    '''
+    Class for communicating with the PaloAlto from an asyncio event loop (requires Python 3.7 or newer)
+
+    Every method that talks to the PaloAlto is a coroutine and uses non-blocking sockets, so a single event loop
+    can drive many concurrent API calls.  The URLs, the XML parsing and the Rules/Reports objects are the ones of PaAPI.
+    Connections are kept open and reused between requests, see close.
+    The methods built on blocking requests (change sets, rule watchers) can not be used from an event loop, use a PaAPI object.
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    ##### Global Variables #####
+    maxConnections = 10 # Upper bound of concurrent connections to the PaloAlto
+    sslContext = None
+    eventLoop = None # Event loop the connection slots and the idle connections belong to
+    connectionSlots = None # Bounds the concurrent requests of the event loop (asyncio.Semaphore)
+    idleConnections = [] # Open connections waiting for the next request: list of (StreamReader, StreamWriter)
+    rateLimitWaiters = None # Threads waiting for the rate limit shared with the blocking PaAPI objects (ThreadPoolExecutor)
+
+    ##### Public Methods #####
+    '''
+    Constructor: Will setup the connection to the PaloAlto, the rules are NOT loaded (see connect and loadFireWallRules)
+
+        Constructor args:
+            apiKeyFile => file name containing the PaloAlto API configs (string)
+            retryPolicy => retry policy used for idempotent requests, overrides the config file (RetryPolicy object)
+            maxConnections => upper bound of concurrent connections to the PaloAlto (int)
+    '''
+    def __init__(self, apiKeyFile, retryPolicy=None, maxConnections=10):
+        PaAPI.__init__(self, apiKeyFile, retryPolicy, False)
+        if type(maxConnections) is not int:
+            raise TypeError("Type must be an int")
+        self.maxConnections = maxConnections
+        self.sslContext = ssl.create_default_context()
+        self.eventLoop = None
+        self.connectionSlots = None
+        self.idleConnections = []
+        self.rateLimitWaiters = None
+
+    '''
+    connect: will create an AsyncPaAPI object and load the firewall rules, the asyncio version of PaAPI(apiKeyFile)
+
+        connect args:
+            apiKeyFile => file name containing the PaloAlto API configs (string)
+            retryPolicy => retry policy used for idempotent requests, overrides the config file (RetryPolicy object)
+            maxConnections => upper bound of concurrent connections to the PaloAlto (int)
+    '''
+    @classmethod
+    async def connect(cls, apiKeyFile, retryPolicy=None, maxConnections=10):
+        pa = cls(apiKeyFile, retryPolicy, maxConnections)
+        await pa.loadFireWallRules()
+        return pa
+
+    '''
+    close: will close the connections kept open to the PaloAlto, they are opened again by the next request
+    (from any event loop)
+    '''
+    async def close(self):
+        while self.idleConnections:
+            reader, writer = self.idleConnections.pop()
+            writer.close()
+        self.eventLoop = None
+        self.connectionSlots = None
+        if self.rateLimitWaiters is not None:
+            self.rateLimitWaiters.shutdown(False)
+            self.rateLimitWaiters = None
+
+    ### Methods for FireWall Rules ###
+    '''
+    loadFireWallRules: will (re)load the firewall rules from the PaloAlto and return them as a list of Rule objects
+    '''
+    async def loadFireWallRules(self):
+        paRules = await self.__readWebPage(self.getFireWallRulesURL(), True)
+        self.setFireWallRules(self.parseFireWallRules(paRules))
+        return self.rules
+
+    '''
+    writeFireWallRule: will create and submit the URL for writing a PaloAlto FireWall Rule
+
+        writeFireWallRule args:
+            rule => rule you want to write (rule object)
+    '''
+    async def writeFireWallRule(self, rule):
+        if self.ruleValidator:
+            self.ruleValidator.checkRules([rule])
+        paResponse = await self.__readWebPage(self.getWriteFireWallRuleURL(rule))
+        paMsg = self.parseWriteResponse(paResponse)
+        self.storeWrittenRules([rule])
+        return paMsg
+
+    '''
+    deleteFireWallRule: will create and submit the URL for deleting a PaloAlto FireWall Rule
+
+        deleteFireWallRule args:
+            rule => rule you want to delete (rule object)
+    '''
+    async def deleteFireWallRule(self, rule):
+        paResponse = await self.__readWebPage(self.getDeleteFireWallRuleURL(rule), True)
+        paMsg = self.parseDeleteResponse(paResponse)
+        self.forgetDeletedRules([rule])
+        return paMsg
+
+    '''
+    commitFireWallConfiguration: will create and submit the URL for committing changes to the PaloAlto
+    '''
+    async def commitFireWallConfiguration(self):
+        while True:
+            paResponse = await self.__readWebPage(self.getCommitURL())
+            commitMsg = self.parseCommitResponse(paResponse)
+            if commitMsg:
+                return commitMsg
+            await asyncio.sleep(5)
+
+    '''
+    requestCommit: will ask for a commit shared with the other callers asking for one at about the same time
+    (see PaAPI.requestCommit), the commit job is followed from a thread so the event loop is not blocked
+    '''
+    async def requestCommit(self):
+        return await asyncio.get_running_loop().run_in_executor(None, PaAPI.requestCommit, self)
+
+    '''
+    createChangeSet: can not be used from an event loop, the changes of a ChangeSet are sent with blocking requests
+    '''
+    def createChangeSet(self):
+        raise NotImplementedError("ChangeSet sends blocking requests, use a PaAPI object")
+
+    '''
+    createRuleWatcher: can not be used from an event loop, a RuleWatcher reloads the rules with blocking requests
+    from its own thread
+    '''
+    def createRuleWatcher(self, interval=30.0, snapshotPath=None):
+        raise NotImplementedError("RuleWatcher sends blocking requests, use a PaAPI object")
+
+    ### Methods for getting reports from the PaloAlto ###
+    '''
+    getReport: will return a predefined report as a list of Reports objects
+
+        getReport args:
+            reportName => name of the predefined report (string)
+    '''
+    async def getReport(self, reportName):
+        paReport = await self.__readWebPage(self.getReportURL(reportName), True)
+        return self.parseReport(reportName, paReport)
+
+    '''
+    getDynamicReport: will return a dynamic report as a list of Reports objects
+
+        getDynamicReport args:
+            reportName => name of the dynamic report (string)
+            period => period of the report, '' to use the PaloAlto default (string)
+            topN => number of entries of the report, '' to use the PaloAlto default (string)
+    '''
+    async def getDynamicReport(self, reportName, period, topN):
+        paReport = await self.__readWebPage(self.getDynamicReportURL(reportName, period, topN), True)
+        return self.parseReport(reportName, paReport)
+
+    '''
+    recordDynamicReport: will read a dynamic report, append it to a local report store and return it
+
+        recordDynamicReport args:
+            store => store keeping the pulled reports (ReportStore object)
+            reportName => name of the dynamic report (string)
+            period => period of the report, e.g. 'last-15-minutes' (string)
+            topN => number of entries of the report, '' to use the PaloAlto default (string)
+    '''
+    async def recordDynamicReport(self, store, reportName, period, topN):
+        report = await self.getDynamicReport(reportName, period, topN)
+        store.append(reportName, period, report)
+        return report
+
+    ### Methods for reading WebPages ###
+    # This method will return the body of a provided url, with the same retry and circuit breaker rules as PaAPI
+    async def __readWebPage(self, queryPage, idempotent=False):
+        self.__useRunningLoop()
+        attempt = 0
+        while True:
+            if not self.circuitBreaker.allowRequest():
+                raise CircuitOpenError("The PaloAlto at '" + self.baseURL + "' is not responding, request refused by the circuit breaker")
+            recorded = False
+            try:
+                async with self.connectionSlots:
+                    await self.__acquireRateLimit()
+                    html = await self.__fetch(queryPage)
+                self.circuitBreaker.recordSuccess()
+                recorded = True
+                return html
+            except (httplib.HTTPException, IOError, asyncio.IncompleteReadError) as e:
+                if isinstance(e, HTTPError) and e.code < 500:
+                    self.circuitBreaker.recordSuccess()
+                    recorded = True
+                    raise
+                self.circuitBreaker.recordFailure()
+                recorded = True
+                attempt = attempt + 1
+                if not idempotent or not self.retryPolicy.shouldRetry(attempt):
+                    raise
+                await asyncio.sleep(self.retryPolicy.getDelay(attempt))
+            finally:
+                # A cancelled request or a response that can not be decompressed must not leave a trial request running
+                if not recorded:
+                    self.circuitBreaker.releaseTrial()
+
+    # This method will bind the connection slots and the idle connections to the running event loop, the ones of another
+    # loop (asyncio.run called once more...) can not be used from it and are dropped
+    def __useRunningLoop(self):
+        loop = asyncio.get_running_loop()
+        if self.eventLoop is not loop:
+            self.eventLoop = loop
+            self.connectionSlots = asyncio.Semaphore(self.maxConnections)
+            self.idleConnections = []
+
+    # This method will wait for the rate limit shared with the blocking PaAPI objects without blocking the event loop
+    # Only requests holding a connection slot wait, so a thread of their own is always free for each of them
+    async def __acquireRateLimit(self):
+        if self.requestScheduler.rate > 0:
+            if self.rateLimitWaiters is None:
+                self.rateLimitWaiters = ThreadPoolExecutor(self.maxConnections)
+            await asyncio.get_running_loop().run_in_executor(self.rateLimitWaiters, self.requestScheduler.acquire, self.requestPriority, self.requestJob)
+        else:
+            self.requestScheduler.acquire(self.requestPriority, self.requestJob)
+
+    # This method will send a single HTTP/1.1 GET request and return the body of the response, raises an HTTPError
+    # when the status of the response is not 2xx
+    async def __fetch(self, queryPage):
+        url = urlsplit(quote(queryPage, self.urlSafeChars))
+        secure = url.scheme == "https"
+        port = url.port or (443 if secure else 80)
+        path = url.path or "/"
+        if url.query:
+            path = path + "?" + url.query
+        request = "GET " + path + " HTTP/1.1\r\nHost: " + url.netloc + "\r\n"
+        if self.compression:
+            request = request + "Accept-Encoding: gzip\r\n"
+        request = (request + "\r\n").encode("utf-8")
+
+        reader = writer = None
+        keepAlive = False
+        try:
+            # The PaloAlto may have closed an idle connection since its last request, the request is then sent on another one
+            statusLine = b""
+            while not statusLine and self.idleConnections:
+                reader, writer = self.idleConnections.pop()
+                try:
+                    statusLine = await self.__sendRequest(reader, writer, request)
+                except IOError:
+                    statusLine = b""
+                if not statusLine:
+                    writer.close()
+                    writer = None
+            if not statusLine:
+                reader, writer = await asyncio.open_connection(url.hostname, port, ssl=self.sslContext if secure else None)
+                statusLine = await self.__sendRequest(reader, writer, request)
+
+            status = statusLine.split(None, 2)
+            if len(status) < 2 or not status[1].isdigit():
+                raise httplib.BadStatusLine(statusLine)
+            headers = await self.__readHeaders(reader)
+
+            if headers.get("transfer-encoding", "").lower() == "chunked":
+                chunks = []
+                while True:
+                    size = int((await reader.readline()).split(b";")[0], 16)
+                    if size == 0:
+                        break
+                    chunks.append(await reader.readexactly(size))
+                    await reader.readexactly(2)
+                await self.__readHeaders(reader)
+                body = b"".join(chunks)
+                keepAlive = True
+            elif "content-length" in headers:
+                body = await reader.readexactly(int(headers["content-length"]))
+                keepAlive = True
+            else:
+                body = await reader.read()
+            keepAlive = keepAlive and status[0] == b"HTTP/1.1" and headers.get("connection", "").lower() != "close"
+        finally:
+            if writer is not None:
+                if keepAlive:
+                    self.idleConnections.append((reader, writer))
+                else:
+                    writer.close()
+
+        code = int(status[1])
+        if code < 200 or code >= 300:
+            raise HTTPError(queryPage, code, "The PaloAlto answered with HTTP status " + str(code), headers, None)
+        if headers.get("content-encoding", "").lower() == "gzip":
+            return GzipReader.decompress(body)
+        return body
+
+    # This method will send a request on a connection and return the status line of the response (empty when the connection was closed)
+    async def __sendRequest(self, reader, writer, request):
+        writer.write(request)
+        await writer.drain()
+        return await reader.readline()
+
+    # This method will read the header lines of a response (or the trailer of a chunked body) into a dictionary with lowercase names
+    async def __readHeaders(self, reader):
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                return headers
+            key, value = line.decode("latin-1").split(":", 1)
+            headers[key.strip().lower()] = value.strip()
\ No newline at end of file
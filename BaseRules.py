@@ -0,0 +1,274 @@
+class BaseRules:
+    '''
+    This class holds what the NAT and Policy Based Forwarding (PBF) Rule objects have in common: the name, the from
+    zones, the sources and destinations, the disabled status and the description of the rule, their XML and the
+    methods used to check the arguments and to read the entries returned by the PaloAlto.
+    Every kind of rule provides genRuleMembersXML (the content of its entry), parseEntry and the TAGS it writes.
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+    rulebase = "" # Rulebase holding the rule
+    name = "" # Rule name
+    memFrom = [] # Rule From members
+    src = [] # Rule Source
+    dst = [] # Rule Destination
+    disable = "" # Rule Disable (yes or no)
+    desc = "" # Rule Description
+    TAGS = [] # Children of a rulebase entry written by the Rule, see ownsChild
+
+    '''
+    Constructor: will check and set the attributes every rule has
+
+        Constructor args:
+            name => name of the rule (string)
+            memFrom => from members of the rule (list of strings => zones)
+            src => sources of the rule (list of strings)
+            dst => destination of the rule (list of strings)
+            disable => disable the rule (string => 'yes' or 'no')
+            desc => description of the rule (string)
+    '''
+    def __init__(self, name, memFrom, src, dst, disable, desc):
+        self.setRuleName(name)
+        self.setRuleFromMembers(memFrom)
+        self.setRuleSource(src)
+        self.setRuleDestination(dst)
+        self.setRuleDisabled(disable)
+        self.setRuleDescription(desc)
+
+
+    ### Methods for checking arguments ###
+    '''
+    checkString: will raise a TypeError if the value is not a string
+
+        checkString args:
+            value => value to check
+    '''
+    @staticmethod
+    def checkString(value):
+        if type(value) is not str:
+            raise TypeError("Type must be a string")
+
+    '''
+    checkList: will raise a TypeError if the value is not a list
+
+        checkList args:
+            value => value to check
+    '''
+    @staticmethod
+    def checkList(value):
+        if type(value) is not list:
+            raise TypeError("Type must be a list")
+
+    '''
+    checkYesNo: will raise a TypeError if the value is not a string and a ValueError if it is not 'yes' or 'no'
+
+        checkYesNo args:
+            value => value to check
+    '''
+    @staticmethod
+    def checkYesNo(value):
+        BaseRules.checkString(value)
+        if value != "yes" and value != "no":
+            raise ValueError("Value must be a 'yes' or a 'no'")
+
+
+    ### Methods for reading the entries returned by the PaloAlto ###
+    '''
+    parseMembers: will return the members found at a path of a rule entry (e.g. 'source' => ['10.0.0.0/8'])
+
+        parseMembers args:
+            root => entry of the rule (Element object)
+            path => path of the members (string)
+    '''
+    @staticmethod
+    def parseMembers(root, path):
+        return [member.text for member in root.findall(path + '/member')]
+
+    '''
+    parseText: will return the text found at a path of a rule entry, or a default value when there is none
+
+        parseText args:
+            root => entry of the rule (Element object)
+            path => path of the text (string)
+            default => value returned when there is no text (string)
+    '''
+    @staticmethod
+    def parseText(root, path, default):
+        attr = root.find(path)
+        if attr is not None and attr.text:
+            return attr.text
+        return default
+
+
+    ### Generate Methods ###
+    '''
+    genRuleXML: will return an XML string version of the whole Rule as a rulebase entry
+    '''
+    def genRuleXML(self):
+        return "<entry name='" + self.name + "'>" + self.genRuleMembersXML() + "</entry>"
+
+    '''
+    ownsChild: will return True if a child of the Rule's entry on the PaloAlto is written by the Rule, the children the Rule
+    does not write are kept by PaAPI.editFireWallRule
+
+        ownsChild args:
+            child => child of the entry of the rule on the PaloAlto (Element object)
+    '''
+    def ownsChild(self, child):
+        return child.tag in self.TAGS
+
+    '''
+    genRuleNameXML: will return an XML string version of the Rule's name
+    '''
+    def genRuleNameXML(self):
+        return "[@name='" + self.name + "']"
+
+    '''
+    genRuleSourceXML: will return an XML string version of the Rule's sources (if any exist)
+    '''
+    def genRuleSourceXML(self):
+        return self.genMembersXML("source", self.src)
+
+    '''
+    genRuleDestinationXML: will return an XML string version of the Rule's destinations (if any exist)
+    '''
+    def genRuleDestinationXML(self):
+        return self.genMembersXML("destination", self.dst)
+
+    '''
+    genRuleDisabledXML: will return an XML string version of the Rule's disabled status (defaults to yes)
+    '''
+    def genRuleDisabledXML(self):
+        if self.disable:
+            return "<disabled>" + self.disable + "</disabled>"
+        else:
+            return "<disabled>yes</disabled>"
+
+    '''
+    genRuleDescriptionXML: will return an XML string version of the Rule's description (if it exists)
+    '''
+    def genRuleDescriptionXML(self):
+        if self.desc:
+            return "<description>" + self.desc + "</description>"
+        else:
+            return ""
+
+    '''
+    genMembersXML: will return the XML of a list of members inside a tag, or nothing when the list is empty
+
+        genMembersXML args:
+            tag => tag holding the members (string)
+            members => members (list of strings)
+    '''
+    def genMembersXML(self, tag, members):
+        if members:
+            retStr = "<" + tag + ">"
+            for attr in members:
+                retStr = retStr + "<member>" + attr + "</member>"
+            retStr = retStr + "</" + tag + ">"
+            return retStr
+        else:
+            return ""
+
+
+    ### Get Methods ###
+    '''
+    getRuleName: will return the Rule's name
+    '''
+    def getRuleName(self):
+        return self.name
+
+    '''
+    getRuleFromMembers: will return a list of the Rule's from members
+    '''
+    def getRuleFromMembers(self):
+        return self.memFrom
+
+    '''
+    getRuleSource: will return a list of the Rule's sources
+    '''
+    def getRuleSource(self):
+        return self.src
+
+    '''
+    getRuleDestination: will return a list of the Rule's destinations
+    '''
+    def getRuleDestination(self):
+        return self.dst
+
+    '''
+    getRuleDisabled: will return the Rule's disabled status
+    '''
+    def getRuleDisabled(self):
+        return self.disable
+
+    '''
+    getRuleDescription: will return the Rule's description
+    '''
+    def getRuleDescription(self):
+        return self.desc
+
+
+    ### Set Methods ###
+    '''
+    setRuleName: will set the Rule's name
+
+        setRuleName args:
+            name => name of the Rule (string)
+    '''
+    def setRuleName(self, name):
+        self.checkString(name)
+        self.name = name
+
+    '''
+    setRuleFromMembers: will set the Rule's from members
+
+        setRuleFromMembers args:
+            memFrom => from members of the rule (list of strings => zones)
+    '''
+    def setRuleFromMembers(self, memFrom):
+        self.checkList(memFrom)
+        self.memFrom = memFrom
+
+    '''
+    setRuleSource: will set the Rule's sources
+
+        setRuleSource args:
+            src => sources of the rule (list of strings)
+    '''
+    def setRuleSource(self, src):
+        self.checkList(src)
+        self.src = src
+
+    '''
+    setRuleDestination: will set the Rule's destinations
+
+        setRuleDestination args:
+            dst => destinations of the rule (list of strings)
+    '''
+    def setRuleDestination(self, dst):
+        self.checkList(dst)
+        self.dst = dst
+
+    '''
+    setRuleDisabled: will set the Rule's disabled status
+
+        setRuleDisabled args:
+            disable => disable the rule (string => 'yes' or 'no')
+    '''
+    def setRuleDisabled(self, disable):
+        self.checkYesNo(disable)
+        self.disable = disable
+
+    '''
+    setRuleDescription: will set the Rule's description
+
+        setRuleDescription args:
+            desc => description of the rule (string)
+    '''
+    def setRuleDescription(self, desc):
+        self.checkString(desc)
+        self.desc = desc
@@ -0,0 +1,180 @@
+from collections import OrderedDict
+from RuleOrder import *
+class ChangeSet:
+    '''
+    This class will be used to group changes to the PaloAlto FireWall Rules and commit them all at once
+
+    Changes are only collected until commit is called, they are then sent with as few requests as possible
+    (one per batch of creates, one per batch of deletes, one per update and one per move) and committed once.
+    If anything fails the candidate config is reverted to the running config and the rules are reloaded.
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    pa = None # PaAPI object the changes are sent to
+    changes = None # Latest change of every rule: rule name => (operation, rule)
+    moves = [] # Moves in the order they were asked for: (rule, where, dst)
+
+    '''
+    Constructor: will create and return an empty ChangeSet object
+
+        Constructor args:
+            pa => connection to the PaloAlto the changes are sent to (PaAPI object)
+    '''
+    def __init__(self, pa):
+        self.pa = pa
+        self.changes = OrderedDict()
+        self.moves = []
+
+    ### Methods for collecting changes ###
+    '''
+    createRule: will add a new rule to the change set
+
+        createRule args:
+            rule => rule you want to create (rule object)
+    '''
+    def createRule(self, rule):
+        previous = self.changes.get(rule.getRuleName())
+        if previous and previous[0] in ("delete", "update"):
+            # Deleting then creating a rule with the same name replaces it
+            self.changes[rule.getRuleName()] = ("update", rule)
+        else:
+            self.changes[rule.getRuleName()] = ("create", rule)
+
+    '''
+    updateRule: will add a change replacing an existing rule to the change set
+
+        updateRule args:
+            rule => rule you want to replace (rule object)
+    '''
+    def updateRule(self, rule):
+        previous = self.changes.get(rule.getRuleName())
+        if previous and previous[0] == "create":
+            self.changes[rule.getRuleName()] = ("create", rule)
+        else:
+            self.changes[rule.getRuleName()] = ("update", rule)
+
+    '''
+    deleteRule: will add a deleted rule to the change set
+
+        deleteRule args:
+            rule => rule you want to delete (rule object)
+    '''
+    def deleteRule(self, rule):
+        previous = self.changes.get(rule.getRuleName())
+        if previous and previous[0] == "create":
+            # The rule never reached the PaloAlto
+            del self.changes[rule.getRuleName()]
+        else:
+            self.changes[rule.getRuleName()] = ("delete", rule)
+        self.moves = [move for move in self.moves if move[0].getRuleName() != rule.getRuleName() and move[2] != rule.getRuleName()]
+
+    '''
+    moveRule: will add a move of a rule inside the rulebase to the change set, moves are sent after every other change
+
+        moveRule args:
+            rule => rule you want to move (rule object)
+            where => where to move the rule (string => 'top', 'bottom', 'before' or 'after')
+            dst => name of the rule to move before or after, only used with 'before' and 'after' (string)
+    '''
+    def moveRule(self, rule, where, dst=None):
+        if where not in ("top", "bottom", "before", "after"):
+            raise ValueError("Value must be 'top', 'bottom', 'before' or 'after'")
+        if where in ("before", "after") and not dst:
+            raise ValueError("A destination rule is needed to move a rule '" + where + "' it")
+        self.moves.append((rule, where, dst))
+
+    '''
+    reorderRules: will add the fewest moves putting the rules in the given order to the change set
+
+    The order is computed from the rules of the PaloAlto once the deletes and creates of the change set are applied
+    (new rules are added at the bottom of the rulebase)
+
+        reorderRules args:
+            ruleNames => names of every rule in the order they must have (list of strings)
+    '''
+    def reorderRules(self, ruleNames):
+        rulesByName = OrderedDict()
+        for rule in self.pa.getFireWallRules():
+            rulesByName[rule.getRuleName()] = rule
+        for rule in self.getDeletes():
+            rulesByName.pop(rule.getRuleName(), None)
+        for rule in self.getCreates():
+            rulesByName[rule.getRuleName()] = rule
+        for move in RuleOrder(list(rulesByName.keys())).getMoves(ruleNames):
+            self.moveRule(rulesByName[move[0]], move[1], move[2])
+
+    ### Get Methods ###
+    '''
+    getCreates: will return the list of rules that will be created
+    '''
+    def getCreates(self):
+        return [change[1] for change in self.changes.values() if change[0] == "create"]
+
+    '''
+    getUpdates: will return the list of rules that will be replaced
+    '''
+    def getUpdates(self):
+        return [change[1] for change in self.changes.values() if change[0] == "update"]
+
+    '''
+    getDeletes: will return the list of rules that will be deleted
+    '''
+    def getDeletes(self):
+        return [change[1] for change in self.changes.values() if change[0] == "delete"]
+
+    '''
+    getMoves: will return the list of moves as (rule name, where, dst) tuples
+    '''
+    def getMoves(self):
+        return [(move[0].getRuleName(), move[1], move[2]) for move in self.moves]
+
+    '''
+    isEmpty: will return True if the change set holds no change
+    '''
+    def isEmpty(self):
+        return not self.changes and not self.moves
+
+    ### Methods for sending the changes to the PaloAlto ###
+    '''
+    commit: will send every change to the PaloAlto and commit them, the change set is emptied when the commit succeeded
+
+    The created and updated rules are checked first when the PaAPI object has a rule validator (see PaAPI.loadRuleValidator),
+    nothing is sent if one of them is not valid.
+    The commit job is followed until it is finished (see PaAPI.commitAndWait), a job that fails is a failed commit.
+    If a change or the commit fails the candidate config is reverted, the rules are reloaded and the error is raised again
+    (even when the revert or the reload fails too)
+    '''
+    def commit(self):
+        if self.pa.ruleValidator:
+            self.pa.ruleValidator.checkRules(self.getCreates() + self.getUpdates())
+        try:
+            self.__sendChanges()
+            commitMsg = self.pa.commitAndWait()
+        except Exception as e:
+            # A rollback that fails too must not hide why the changes failed, the loaded rules are reloaded anyway
+            for rollback in (self.pa.revertFireWallConfiguration, self.pa.loadFireWallRules):
+                try:
+                    rollback()
+                except Exception:
+                    pass
+            raise e
+        self.changes = OrderedDict()
+        self.moves = []
+        return commitMsg
+
+    # This method will send every change to the PaloAlto without committing them
+    def __sendChanges(self):
+        deletes = self.getDeletes()
+        if deletes:
+            self.pa.deleteFireWallRules(deletes)
+        creates = self.getCreates()
+        if creates:
+            self.pa.writeFireWallRules(creates)
+        for rule in self.getUpdates():
+            self.pa.editFireWallRule(rule)
+        for move in self.moves:
+            self.pa.moveFireWallRule(move[0], move[1], move[2])
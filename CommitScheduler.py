@@ -0,0 +1,109 @@
+import threading
+import time
+class CommitScheduler:
+    '''
+    This class will be used to merge the commits asked for by many callers into as few PaloAlto commits as possible
+
+    A commit request waits until no other request arrived for 'window' seconds (but never more than 'maxDelay'
+    seconds after the first request of the batch), then a single commit is run for the whole batch, by the commit
+    function of the first request, and every caller of the batch gets its outcome.  Requests arriving while a commit is running start the next batch, the changes
+    they are committing may have been made after the running commit started.
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    window = 5.0 # Seconds without a new request before the batch is committed
+    maxDelay = 60.0 # Upper bound of the seconds between the first request of a batch and its commit
+    pending = None # Batch still taking requests: first, last, requests, done, result, error (dictionary)
+    running = False # True while a commit is running
+    requestCount = 0 # Number of commit requests
+    commitCount = 0 # Number of commits run
+
+    '''
+    Constructor: will create and return a CommitScheduler object
+
+        Constructor args:
+            window => seconds without a new request before the batch is committed (float)
+            maxDelay => upper bound of the seconds between the first request of a batch and its commit (float)
+    '''
+    def __init__(self, window=5.0, maxDelay=60.0):
+        if window < 0 or maxDelay < 0:
+            raise ValueError("Value must be 0 or greater")
+        self.window = float(window)
+        self.maxDelay = float(maxDelay)
+        self.pending = None
+        self.running = False
+        self.requestCount = 0
+        self.commitCount = 0
+        self.condition = threading.Condition()
+
+    '''
+    requestCommit: will wait for the commit of the batch the request joins and return its message,
+    raises the error of the commit if it failed
+
+        requestCommit args:
+            commit => function running one commit until it is done and returning its message, only the function
+                      of the first request of a batch is run, e.g. PaAPI.commitAndWait of the caller (function)
+    '''
+    def requestCommit(self, commit):
+        with self.condition:
+            now = time.time()
+            leader = self.pending is None
+            if leader:
+                self.pending = {"first": now, "last": now, "requests": 0, "done": False, "result": None, "error": None}
+            batch = self.pending
+            batch["last"] = now
+            batch["requests"] = batch["requests"] + 1
+            self.requestCount = self.requestCount + 1
+            self.condition.notify_all()
+
+            if not leader:
+                while not batch["done"]:
+                    self.condition.wait()
+            else:
+                self.__waitForWindow(batch)
+                self.pending = None
+                self.running = True
+                self.condition.release()
+                try:
+                    batch["result"] = commit()
+                except Exception as e:
+                    batch["error"] = e
+                finally:
+                    self.condition.acquire()
+                    self.running = False
+                    self.commitCount = self.commitCount + 1
+                    batch["done"] = True
+                    self.condition.notify_all()
+
+            if batch["error"] is not None:
+                raise batch["error"]
+            return batch["result"]
+
+    # This method will wait (holding the condition) until the batch can be committed
+    def __waitForWindow(self, batch):
+        while True:
+            deadline = min(batch["last"] + self.window, batch["first"] + self.maxDelay)
+            now = time.time()
+            if not self.running and now >= deadline:
+                return
+            if self.running:
+                self.condition.wait()
+            else:
+                self.condition.wait(deadline - now)
+
+    ### Get Methods ###
+    '''
+    getRequestCount: will return the number of commit requests
+    '''
+    def getRequestCount(self):
+        return self.requestCount
+
+    '''
+    getCommitCount: will return the number of commits run
+    '''
+    def getCommitCount(self):
+        return self.commitCount
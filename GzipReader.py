@@ -0,0 +1,74 @@
+import zlib
+class GzipReader:
+    '''
+    This class will be used to read a gzip compressed response of the PaloAlto as it is downloaded
+
+    The response is read chunkSize compressed bytes at a time and never more than the asked size is decompressed,
+    only the compressed bytes not decompressed yet are kept, so a report can be parsed incrementally (see PaAPI.iterReportEntries) without
+    the compressed or the decompressed body ever being held whole.
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    chunkSize = 65536 # Number of compressed bytes read from the response at a time
+
+    '''
+    Constructor: will create and return a GzipReader object
+
+        Constructor args:
+            stream => gzip compressed response (file-like object)
+    '''
+    def __init__(self, stream):
+        self.stream = stream
+        # 16 + MAX_WBITS: the data has a gzip header and trailer
+        self.decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        self.done = False
+
+    '''
+    decompress: will return the decompressed content of a whole gzip compressed body
+
+        decompress args:
+            data => gzip compressed body (bytes)
+    '''
+    @staticmethod
+    def decompress(data):
+        return zlib.decompress(data, 16 + zlib.MAX_WBITS)
+
+    '''
+    read: will return at most size decompressed bytes, b'' once everything was read
+
+        read args:
+            size => upper bound of the number of bytes, everything left when not given (int)
+    '''
+    def read(self, size=-1):
+        if size is None or size < 0:
+            chunks = []
+            while not self.done:
+                chunks.append(self.__decompress(0))
+            return b"".join(chunks)
+        chunks = []
+        while size > 0 and not self.done:
+            data = self.__decompress(size)
+            chunks.append(data)
+            size = size - len(data)
+        return b"".join(chunks)
+
+    '''
+    close: will close the response
+    '''
+    def close(self):
+        self.stream.close()
+
+    # This method will decompress at most size bytes (everything it can when size is 0), the compressed bytes left
+    # over are kept by the decompressor (unconsumed_tail) and used before the next chunk of the response is read
+    def __decompress(self, size):
+        data = self.decompressor.unconsumed_tail
+        if not data:
+            data = self.stream.read(self.chunkSize)
+            if not data:
+                self.done = True
+                return self.decompressor.flush()
+        return self.decompressor.decompress(data, size)
@@ -0,0 +1,320 @@
+from BaseRules import *
+class NatRules(BaseRules):
+    '''
+    This class will be used in the creation of NAT Rule objects, see BaseRules for the attributes every rule has
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+    rulebase = "nat" # Rulebase holding the rule
+    memTo = [] # Rule To members
+    srv = "" # Rule Service
+    toInterface = "" # Rule Destination Interface
+    srcTransType = "" # Rule Source Translation type ('none', 'dynamic-ip-and-port', 'dynamic-ip' or 'static-ip')
+    srcTransAddr = [] # Rule Source Translation translated addresses (the address of srcTransInterface when it is used)
+    srcTransInterface = "" # Rule Source Translation interface whose address is used (dynamic-ip-and-port only)
+    srcTransBiDirectional = "" # Rule Source Translation also used for the connections to the source (static-ip only, yes or no)
+    dstTransAddr = "" # Rule Destination Translation translated address
+    dstTransPort = "" # Rule Destination Translation translated port
+    TAGS = [
+            "from", "to", "source", "destination", "service", "to-interface", "source-translation", "destination-translation",
+            "disabled", "description"
+            ] # Children of a rulebase entry written by the Rule, see ownsChild
+
+    '''
+    Constructor: will create and return a NAT Rule object
+
+        Constructor args:
+            name => name of the rule (string)
+            memFrom => from members of the rule (list of strings => zones)
+            memTo => to members of the rule (list of strings => zones)
+            src => sources of the rule (list of strings)
+            dst => destination of the rule (list of strings)
+            srv => service of the rule (string)
+            toInterface => destination interface of the rule, '' for any (string)
+            srcTransType => source translation of the rule (string => 'none', 'dynamic-ip-and-port', 'dynamic-ip' or 'static-ip')
+            srcTransAddr => addresses the sources are translated to, one for 'static-ip', at most one (the address of
+                            the interface, optional) with srcTransInterface (list of strings)
+            dstTransAddr => address the destination is translated to, '' for no destination translation (string)
+            dstTransPort => port the destination is translated to, '' to keep the port (string)
+            disable => disable the rule (string => 'yes' or 'no')
+            desc => description of the rule (string)
+            srcTransInterface => interface whose address the sources are translated to, only with 'dynamic-ip-and-port' (string)
+            srcTransBiDirectional => translate the connections to the source too, only with 'static-ip' (string => 'yes', 'no' or '')
+    '''
+    def __init__(self, name, memFrom, memTo, src, dst, srv, toInterface, srcTransType, srcTransAddr, dstTransAddr, dstTransPort, disable, desc, srcTransInterface="", srcTransBiDirectional=""):
+        BaseRules.__init__(self, name, memFrom, src, dst, disable, desc)
+        self.setRuleToMembers(memTo)
+        self.setRuleService(srv)
+        self.setRuleToInterface(toInterface)
+        self.setRuleSourceTranslation(srcTransType, srcTransAddr, srcTransInterface, srcTransBiDirectional)
+        self.setRuleDestinationTranslation(dstTransAddr, dstTransPort)
+
+    '''
+    parseEntry: will return a NAT Rule object built from a rule entry returned by the PaloAlto
+
+        parseEntry args:
+            root => entry of the rule (Element object)
+    '''
+    @staticmethod
+    def parseEntry(root):
+        srcTransType = "none"
+        srcTransAddr = []
+        srcTransInterface = ""
+        srcTransBiDirectional = ""
+        for transType in ("dynamic-ip-and-port", "dynamic-ip", "static-ip"):
+            trans = root.find('source-translation/' + transType)
+            if trans is not None:
+                srcTransType = transType
+                srcTransInterface = BaseRules.parseText(trans, 'interface-address/interface', "")
+                if srcTransInterface:
+                    if BaseRules.parseText(trans, 'interface-address/ip', ""):
+                        srcTransAddr = [BaseRules.parseText(trans, 'interface-address/ip', "")]
+                else:
+                    srcTransAddr = BaseRules.parseMembers(trans, 'translated-address')
+                    if not srcTransAddr and BaseRules.parseText(trans, 'translated-address', ""):
+                        srcTransAddr = [BaseRules.parseText(trans, 'translated-address', "")]
+                srcTransBiDirectional = BaseRules.parseText(trans, 'bi-directional', "")
+                break
+        return NatRules(
+                        root.get('name'),
+                        BaseRules.parseMembers(root, 'from'),
+                        BaseRules.parseMembers(root, 'to'),
+                        BaseRules.parseMembers(root, 'source'),
+                        BaseRules.parseMembers(root, 'destination'),
+                        BaseRules.parseText(root, 'service', "any"),
+                        BaseRules.parseText(root, 'to-interface', ""),
+                        srcTransType,
+                        srcTransAddr,
+                        BaseRules.parseText(root, 'destination-translation/translated-address', ""),
+                        BaseRules.parseText(root, 'destination-translation/translated-port', ""),
+                        BaseRules.parseText(root, 'disabled', "no"),
+                        BaseRules.parseText(root, 'description', ""),
+                        srcTransInterface,
+                        srcTransBiDirectional
+                        )
+
+
+    ### Generate Methods ###
+    '''
+    genRuleMembersXML: will return an XML string version of every attribute of the Rule (the content of its entry)
+    '''
+    def genRuleMembersXML(self):
+        retStr = self.genRuleFromMembersXML()
+        retStr = retStr + self.genRuleToMembersXML()
+        retStr = retStr + self.genRuleSourceXML()
+        retStr = retStr + self.genRuleDestinationXML()
+        retStr = retStr + self.genRuleServiceXML()
+        retStr = retStr + self.genRuleToInterfaceXML()
+        retStr = retStr + self.genRuleSourceTranslationXML()
+        retStr = retStr + self.genRuleDestinationTranslationXML()
+        retStr = retStr + self.genRuleDisabledXML()
+        retStr = retStr + self.genRuleDescriptionXML()
+        return retStr
+
+    '''
+    genRuleFromMembersXML: will return an XML string version of the Rule's 'from' members (if any exist)
+    '''
+    def genRuleFromMembersXML(self):
+        return self.genMembersXML("from", self.memFrom)
+
+    '''
+    genRuleToMembersXML: will return an XML string version of the Rule's 'to' members (if any exist)
+    '''
+    def genRuleToMembersXML(self):
+        return self.genMembersXML("to", self.memTo)
+
+    '''
+    genRuleServiceXML: will return an XML string version of the Rule's service (defaults to any)
+    '''
+    def genRuleServiceXML(self):
+        if self.srv:
+            return "<service>" + self.srv + "</service>"
+        else:
+            return "<service>any</service>"
+
+    '''
+    genRuleToInterfaceXML: will return an XML string version of the Rule's destination interface (if it exists)
+    '''
+    def genRuleToInterfaceXML(self):
+        if self.toInterface:
+            return "<to-interface>" + self.toInterface + "</to-interface>"
+        else:
+            return ""
+
+    '''
+    genRuleSourceTranslationXML: will return an XML string version of the Rule's source translation (if it exists)
+    '''
+    def genRuleSourceTranslationXML(self):
+        if self.srcTransType == "static-ip":
+            retStr = "<source-translation><static-ip><translated-address>" + self.srcTransAddr[0] + "</translated-address>"
+            if self.srcTransBiDirectional:
+                retStr = retStr + "<bi-directional>" + self.srcTransBiDirectional + "</bi-directional>"
+            retStr = retStr + "</static-ip></source-translation>"
+            return retStr
+        elif self.srcTransType in ("dynamic-ip-and-port", "dynamic-ip"):
+            retStr = "<source-translation><" + self.srcTransType + ">"
+            if self.srcTransInterface:
+                retStr = retStr + "<interface-address><interface>" + self.srcTransInterface + "</interface>"
+                if self.srcTransAddr:
+                    retStr = retStr + "<ip>" + self.srcTransAddr[0] + "</ip>"
+                retStr = retStr + "</interface-address>"
+            else:
+                retStr = retStr + self.genMembersXML("translated-address", self.srcTransAddr)
+            retStr = retStr + "</" + self.srcTransType + "></source-translation>"
+            return retStr
+        else:
+            return ""
+
+    '''
+    genRuleDestinationTranslationXML: will return an XML string version of the Rule's destination translation (if it exists)
+    '''
+    def genRuleDestinationTranslationXML(self):
+        if self.dstTransAddr:
+            retStr = "<destination-translation><translated-address>" + self.dstTransAddr + "</translated-address>"
+            if self.dstTransPort:
+                retStr = retStr + "<translated-port>" + self.dstTransPort + "</translated-port>"
+            retStr = retStr + "</destination-translation>"
+            return retStr
+        else:
+            return ""
+
+
+    ### Get Methods ###
+    '''
+    getRuleToMembers: will return a list of the Rule's to members
+    '''
+    def getRuleToMembers(self):
+        return self.memTo
+
+    '''
+    getRuleService: will return the Rule's service
+    '''
+    def getRuleService(self):
+        return self.srv
+
+    '''
+    getRuleToInterface: will return the Rule's destination interface
+    '''
+    def getRuleToInterface(self):
+        return self.toInterface
+
+    '''
+    getRuleSourceTranslationType: will return the Rule's source translation type
+    '''
+    def getRuleSourceTranslationType(self):
+        return self.srcTransType
+
+    '''
+    getRuleSourceTranslationAddress: will return a list of the addresses the Rule's sources are translated to
+    '''
+    def getRuleSourceTranslationAddress(self):
+        return self.srcTransAddr
+
+    '''
+    getRuleSourceTranslationInterface: will return the interface whose address the Rule's sources are translated to
+    '''
+    def getRuleSourceTranslationInterface(self):
+        return self.srcTransInterface
+
+    '''
+    getRuleSourceTranslationBiDirectional: will return whether the Rule's source translation is bi-directional ('' when not set)
+    '''
+    def getRuleSourceTranslationBiDirectional(self):
+        return self.srcTransBiDirectional
+
+    '''
+    getRuleDestinationTranslationAddress: will return the address the Rule's destination is translated to
+    '''
+    def getRuleDestinationTranslationAddress(self):
+        return self.dstTransAddr
+
+    '''
+    getRuleDestinationTranslationPort: will return the port the Rule's destination is translated to
+    '''
+    def getRuleDestinationTranslationPort(self):
+        return self.dstTransPort
+
+
+    ### Set Methods ###
+    '''
+    setRuleToMembers: will set the Rule's to members
+
+        setRuleToMembers args:
+            memTo => to members of the rule (list of strings => zones)
+    '''
+    def setRuleToMembers(self, memTo):
+        self.checkList(memTo)
+        self.memTo = memTo
+
+    '''
+    setRuleService: will set the Rule's service
+
+        setRuleService args:
+            srv => service of the rule (string)
+    '''
+    def setRuleService(self, srv):
+        self.checkString(srv)
+        self.srv = srv
+
+    '''
+    setRuleToInterface: will set the Rule's destination interface
+
+        setRuleToInterface args:
+            toInterface => destination interface of the rule, '' for any (string)
+    '''
+    def setRuleToInterface(self, toInterface):
+        self.checkString(toInterface)
+        self.toInterface = toInterface
+
+    '''
+    setRuleSourceTranslation: will set the Rule's source translation
+
+        setRuleSourceTranslation args:
+            srcTransType => source translation of the rule (string => 'none', 'dynamic-ip-and-port', 'dynamic-ip' or 'static-ip')
+            srcTransAddr => addresses the sources are translated to, one for 'static-ip', at most one (the address of
+                            the interface, optional) with srcTransInterface (list of strings)
+            srcTransInterface => interface whose address the sources are translated to, only with 'dynamic-ip-and-port' (string)
+            srcTransBiDirectional => translate the connections to the source too, only with 'static-ip' (string => 'yes', 'no' or '')
+    '''
+    def setRuleSourceTranslation(self, srcTransType, srcTransAddr, srcTransInterface="", srcTransBiDirectional=""):
+        self.checkString(srcTransType)
+        if srcTransType not in ("none", "dynamic-ip-and-port", "dynamic-ip", "static-ip"):
+            raise ValueError("Value must be 'none', 'dynamic-ip-and-port', 'dynamic-ip' or 'static-ip'")
+        self.checkList(srcTransAddr)
+        self.checkString(srcTransInterface)
+        if srcTransInterface and srcTransType != "dynamic-ip-and-port":
+            raise ValueError("Only a 'dynamic-ip-and-port' source translation can use the address of an interface")
+        if srcTransType == "none" and srcTransAddr:
+            raise ValueError("A rule without source translation can not have translated addresses")
+        if srcTransType == "static-ip" and len(srcTransAddr) != 1:
+            raise ValueError("A 'static-ip' source translation needs exactly one translated address")
+        if srcTransType in ("dynamic-ip-and-port", "dynamic-ip") and not srcTransInterface and not srcTransAddr:
+            raise ValueError("A '" + srcTransType + "' source translation needs a translated address")
+        if srcTransInterface and len(srcTransAddr) > 1:
+            raise ValueError("The address of an interface is a single address")
+        if srcTransBiDirectional:
+            self.checkYesNo(srcTransBiDirectional)
+            if srcTransType != "static-ip":
+                raise ValueError("Only a 'static-ip' source translation can be bi-directional")
+        else:
+            self.checkString(srcTransBiDirectional)
+        self.srcTransType = srcTransType
+        self.srcTransAddr = srcTransAddr
+        self.srcTransInterface = srcTransInterface
+        self.srcTransBiDirectional = srcTransBiDirectional
+
+    '''
+    setRuleDestinationTranslation: will set the Rule's destination translation
+
+        setRuleDestinationTranslation args:
+            dstTransAddr => address the destination is translated to, '' for no destination translation (string)
+            dstTransPort => port the destination is translated to, '' to keep the port (string)
+    '''
+    def setRuleDestinationTranslation(self, dstTransAddr, dstTransPort):
+        self.checkString(dstTransAddr)
+        self.checkString(dstTransPort)
+        self.dstTransAddr = dstTransAddr
+        self.dstTransPort = dstTransPort
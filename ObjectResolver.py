@@ -0,0 +1,288 @@
+import binascii
+import socket
+class ObjectResolver:
+    '''
+    This class will be used to turn the address and service names used by Rule objects into IP and port ranges
+
+    Address groups and service groups are expanded recursively (a group that contains itself raises a ValueError),
+    every expansion is memoized and only the expansions depending on an object are thrown away when it changes.
+
+    IP ranges are (version, first, last) tuples where first and last are integers (version is 4 or 6),
+    port ranges are (protocol, first, last) tuples where protocol is 'tcp' or 'udp'.
+    Names that cannot be turned into ranges (fqdn objects, dynamic groups, unknown names, 'application-default')
+    are returned separately as unresolved names.
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    # Services known by every PaloAlto without being configured
+    PREDEFINED_SERVICES = {
+                           "service-http": [("tcp", 80, 80), ("tcp", 8080, 8080)],
+                           "service-https": [("tcp", 443, 443)],
+                           "any": [("tcp", 0, 65535), ("udp", 0, 65535)]
+                           }
+    ANY_ADDRESS = [(4, 0, 2 ** 32 - 1), (6, 0, 2 ** 128 - 1)]
+
+    addresses = {} # address name => list of IP ranges, or None when it cannot be resolved
+    addressGroups = {} # address group name => list of member names, or None for dynamic groups
+    services = {} # service name => list of port ranges
+    serviceGroups = {} # service group name => list of member names
+
+    '''
+    Constructor: will create and return an empty ObjectResolver object
+    '''
+    def __init__(self):
+        self.addresses = {}
+        self.addressGroups = {}
+        self.services = {}
+        self.serviceGroups = {}
+        self.addressCache = {}
+        self.serviceCache = {}
+        self.parents = {} # member name => names of the groups containing it
+
+    ### Methods for changing objects ###
+    '''
+    setAddress: will add or replace an address object
+
+        setAddress args:
+            name => name of the address object (string)
+            addressType => type of the address (string => 'ip-netmask', 'ip-range', 'fqdn' or 'ip-wildcard')
+            value => value of the address, e.g. '10.0.0.0/24' or '10.0.0.1-10.0.0.9' (string)
+    '''
+    def setAddress(self, name, addressType, value):
+        if addressType in ("ip-netmask", "ip-range"):
+            self.addresses[name] = [self.parseAddress(value)]
+        else:
+            self.addresses[name] = None
+        self.__invalidate(name, self.addressCache)
+
+    '''
+    setAddressGroup: will add or replace an address group
+
+        setAddressGroup args:
+            name => name of the address group (string)
+            members => names of the members, None for a dynamic group (list of strings)
+    '''
+    def setAddressGroup(self, name, members):
+        self.__setGroupMembers(name, self.addressGroups.get(name), members)
+        self.addressGroups[name] = members
+        self.__invalidate(name, self.addressCache)
+
+    '''
+    setService: will add or replace a service object
+
+        setService args:
+            name => name of the service object (string)
+            protocol => protocol of the service (string => 'tcp' or 'udp')
+            ports => destination ports, e.g. '80,8080-8090' (string)
+    '''
+    def setService(self, name, protocol, ports):
+        portRanges = []
+        for port in ports.split(","):
+            port = port.strip()
+            if "-" in port:
+                first, last = port.split("-", 1)
+                portRanges.append((protocol, int(first), int(last)))
+            elif port:
+                portRanges.append((protocol, int(port), int(port)))
+        self.services[name] = portRanges
+        self.__invalidate(name, self.serviceCache)
+
+    '''
+    setServiceGroup: will add or replace a service group
+
+        setServiceGroup args:
+            name => name of the service group (string)
+            members => names of the members (list of strings)
+    '''
+    def setServiceGroup(self, name, members):
+        self.__setGroupMembers(name, self.serviceGroups.get(name), members)
+        self.serviceGroups[name] = members
+        self.__invalidate(name, self.serviceCache)
+
+    '''
+    removeObject: will remove an address, address group, service or service group
+
+        removeObject args:
+            name => name of the object (string)
+    '''
+    def removeObject(self, name):
+        self.addresses.pop(name, None)
+        self.services.pop(name, None)
+        if name in self.addressGroups:
+            self.__setGroupMembers(name, self.addressGroups.pop(name), None)
+        if name in self.serviceGroups:
+            self.__setGroupMembers(name, self.serviceGroups.pop(name), None)
+        self.__invalidate(name, self.addressCache)
+        self.__invalidate(name, self.serviceCache)
+
+    ### Methods for resolving objects ###
+    '''
+    resolveAddresses: will return the merged IP ranges of a list of address names and the names that could not be resolved
+
+        resolveAddresses args:
+            names => address objects, address groups, 'any' or IP literals (list of strings)
+    '''
+    def resolveAddresses(self, names):
+        ranges = []
+        unresolved = set()
+        for name in names:
+            expansion = self.__expandAddress(name, [])
+            ranges.extend(expansion[0])
+            unresolved.update(expansion[1])
+        return (self.__mergeRanges(ranges), sorted(unresolved))
+
+    '''
+    resolveServices: will return the merged port ranges of a list of service names and the names that could not be resolved
+
+        resolveServices args:
+            names => service objects, service groups, 'any' or 'application-default' (list of strings)
+    '''
+    def resolveServices(self, names):
+        ranges = []
+        unresolved = set()
+        for name in names:
+            expansion = self.__expandService(name, [])
+            ranges.extend(expansion[0])
+            unresolved.update(expansion[1])
+        return (self.__mergeRanges(ranges), sorted(unresolved))
+
+    '''
+    resolveRule: will return the resolved sources, destinations and services of a rule
+
+    The result is a dictionary with the keys 'src', 'dst' and 'srv', each holding a (ranges, unresolved names) tuple
+
+        resolveRule args:
+            rule => rule to resolve (rule object)
+    '''
+    def resolveRule(self, rule):
+        return {
+                "src": self.resolveAddresses(rule.getRuleSource()),
+                "dst": self.resolveAddresses(rule.getRuleDestination()),
+                "srv": self.resolveServices(rule.getRuleService())
+                }
+
+    '''
+    parseAddress: will return the IP range of an IP, a network ('10.0.0.0/8') or an IP range ('10.0.0.1-10.0.0.9')
+
+        parseAddress args:
+            value => IP literal (string)
+    '''
+    def parseAddress(self, value):
+        if "-" in value:
+            first, last = value.split("-", 1)
+            firstIP = self.__parseIP(first.strip())
+            lastIP = self.__parseIP(last.strip())
+            if firstIP[0] != lastIP[0]:
+                raise ValueError("IP range '" + value + "' mixes IPv4 and IPv6")
+            return (firstIP[0], firstIP[1], lastIP[1])
+        if "/" in value:
+            address, length = value.split("/", 1)
+            ip = self.__parseIP(address)
+            bits = 32 if ip[0] == 4 else 128
+            hostBits = bits - int(length)
+            if hostBits < 0 or hostBits > bits:
+                raise ValueError("'" + value + "' has an invalid netmask")
+            first = (ip[1] >> hostBits) << hostBits
+            return (ip[0], first, first + (1 << hostBits) - 1)
+        ip = self.__parseIP(value)
+        return (ip[0], ip[1], ip[1])
+
+    # This method will return (ranges, unresolved names) of an address name, memoized
+    def __expandAddress(self, name, visiting):
+        if name in self.addressCache:
+            return self.addressCache[name]
+        if name in visiting:
+            raise ValueError("Address group cycle: " + " -> ".join(visiting + [name]))
+
+        if name == "any":
+            expansion = (list(self.ANY_ADDRESS), ())
+        elif name in self.addressGroups:
+            if self.addressGroups[name] is None:
+                expansion = ([], (name,))
+            else:
+                ranges = []
+                unresolved = set()
+                for member in self.addressGroups[name]:
+                    memberExpansion = self.__expandAddress(member, visiting + [name])
+                    ranges.extend(memberExpansion[0])
+                    unresolved.update(memberExpansion[1])
+                expansion = (self.__mergeRanges(ranges), tuple(sorted(unresolved)))
+        elif name in self.addresses:
+            if self.addresses[name] is None:
+                expansion = ([], (name,))
+            else:
+                expansion = (self.addresses[name], ())
+        else:
+            try:
+                expansion = ([self.parseAddress(name)], ())
+            except (ValueError, socket.error):
+                expansion = ([], (name,))
+        self.addressCache[name] = expansion
+        return expansion
+
+    # This method will return (ranges, unresolved names) of a service name, memoized
+    def __expandService(self, name, visiting):
+        if name in self.serviceCache:
+            return self.serviceCache[name]
+        if name in visiting:
+            raise ValueError("Service group cycle: " + " -> ".join(visiting + [name]))
+
+        if name in self.serviceGroups:
+            ranges = []
+            unresolved = set()
+            for member in self.serviceGroups[name]:
+                memberExpansion = self.__expandService(member, visiting + [name])
+                ranges.extend(memberExpansion[0])
+                unresolved.update(memberExpansion[1])
+            expansion = (self.__mergeRanges(ranges), tuple(sorted(unresolved)))
+        elif name in self.services:
+            expansion = (self.services[name], ())
+        elif name in self.PREDEFINED_SERVICES:
+            expansion = (self.PREDEFINED_SERVICES[name], ())
+        else:
+            expansion = ([], (name,))
+        self.serviceCache[name] = expansion
+        return expansion
+
+    # This method will keep track of which groups contain which members, so that changes can be propagated
+    def __setGroupMembers(self, name, oldMembers, newMembers):
+        for member in oldMembers or []:
+            self.parents.get(member, set()).discard(name)
+        for member in newMembers or []:
+            self.parents.setdefault(member, set()).add(name)
+
+    # This method will throw away the expansion of an object and of every group containing it
+    def __invalidate(self, name, cache):
+        pending = [name]
+        seen = set()
+        while pending:
+            current = pending.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+            cache.pop(current, None)
+            pending.extend(self.parents.get(current, ()))
+
+    # This method will return (version, integer) of an IPv4 or IPv6 address
+    def __parseIP(self, value):
+        if ":" in value:
+            return (6, int(binascii.hexlify(socket.inet_pton(socket.AF_INET6, value)), 16))
+        parts = value.split(".")
+        if len(parts) != 4 or not all([part.isdigit() and int(part) < 256 for part in parts]):
+            raise ValueError("'" + value + "' is not an IP address")
+        return (4, (int(parts[0]) << 24) + (int(parts[1]) << 16) + (int(parts[2]) << 8) + int(parts[3]))
+
+    # This method will sort ranges and merge the ones that overlap or touch
+    def __mergeRanges(self, ranges):
+        merged = []
+        for current in sorted(ranges):
+            if merged and merged[-1][0] == current[0] and current[1] <= merged[-1][2] + 1:
+                if current[2] > merged[-1][2]:
+                    merged[-1] = (current[0], merged[-1][1], current[2])
+            else:
+                merged.append(current)
+        return merged
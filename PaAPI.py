@@ -1,8 +1,40 @@
 from Rules import *
+from NatRules import *
+from PbfRules import *
 from Reports import *
-import urllib
-import httplib
+from RetryPolicy import *
+from ChangeSet import *
+from RuleOrder import *
+from Snapshot import *
+from ObjectResolver import *
+from RuleIndex import *
+from ReportStore import *
+from RuleImporter import *
+from RuleFingerprint import *
+from RuleDecoder import *
+from CommitScheduler import *
+from UserIDBuffer import *
+from RequestScheduler import *
+from SingleFlight import *
+from RuleValidator import *
+from RuleWatcher import *
+from GzipReader import *
+try:
+    from urllib import urlopen, urlencode, quote, FancyURLopener
+    from urllib2 import HTTPError
+    import httplib
+    Request = None # Python 2's urllib sends extra headers through an opener
+except ImportError:
+    from urllib.request import urlopen, Request
+    from urllib.parse import urlencode, quote
+    from urllib.error import HTTPError
+    import http.client as httplib
+from collections import OrderedDict
+from io import BytesIO
 from time import sleep
+import time
+import re
+from multiprocessing.pool import ThreadPool
 class PaAPI:
     '''
     Class for communicating with the PaloALto
@@ -17,7 +49,34 @@ class PaAPI:
     apiKey = ""
     baseURL = ""
     rules = []
+    vsys = "" # Virtual system used by every request, '' to use the only vsys of single vsys PaloAltos
+    vsysRules = {} # Rules loaded from each vsys: vsys name => list of Rule objects
+    ruleIndex = None # Index of the members of the loaded firewall rules, see findFireWallRules (RuleIndex object)
+    ruleFingerprint = None # Fingerprint of the rules of the PaloAlto at the last refresh and their names, see refreshFireWallRules (tuple)
+    natRules = [] # NAT rules of the current vsys, see loadNatRules (list of NatRules objects)
+    natRuleIndex = None # Index of the members of the loaded NAT rules, see findFireWallRules (RuleIndex object)
+    pbfRules = [] # Policy Based Forwarding rules of the current vsys, see loadPbfRules (list of PbfRules objects)
+    pbfRuleIndex = None # Index of the members of the loaded PBF rules, see findFireWallRules (RuleIndex object)
     report = []
+    objects = None # Address and service objects, see loadFireWallObjects (ObjectResolver object)
+    ruleValidator = None # Names the members of the rules are checked against before they are written, see loadRuleValidator
+    retryPolicy = None
+    circuitBreaker = None
+    circuitBreakers = {} # Circuit breakers shared by every PaAPI object, keyed by baseURL
+    commitScheduler = None
+    commitSchedulers = {} # Commit schedulers shared by every PaAPI object, keyed by baseURL
+    requestScheduler = None
+    requestSchedulers = {} # Request schedulers (rate limits) shared by every PaAPI object, keyed by baseURL
+    singleFlight = None
+    singleFlights = {} # Reads in flight shared by every PaAPI object, keyed by baseURL (see SingleFlight)
+    requestPriority = "interactive" # Priority of the requests of this object, see setRequestPriority
+    requestJob = None # Job the requests of this object belong to, see setRequestPriority
+    urlSafeChars = "%/:=&?~#+!$,;'@()*[]|" # Characters left alone when a URL is quoted (the same as Python 2's urllib)
+    maxXPathLength = 4096 # Upper bound of the length of an xpath naming many rules at once
+    batchSize = 500 # Number of rules sent in a single bulk request
+    jobPollInterval = 2.0 # Seconds between two looks at a job of the PaloAlto, see waitForJob
+    compression = True # Ask the PaloAlto to gzip its responses, they are decompressed while they are read (see GzipReader)
+    decodeProcesses = 1 # Number of processes decoding the rulebase when the rules are loaded, see RuleDecoder
  
     ##### Public Methods #####
     '''
@@ -25,15 +84,31 @@ class PaAPI:
     
         Constructor args:
             apiKeyFile => file name containing the PaloAlto API configs (string)
+            retryPolicy => retry policy used for idempotent requests, overrides the config file (RetryPolicy object)
+            loadRules => load the firewall rules from the PaloAlto right away (boolean)
     '''
-    def __init__(self, apiKeyFile):
+    def __init__(self, apiKeyFile, retryPolicy=None, loadRules=True):
+        self.retryPolicy = RetryPolicy()
+        self.vsysRules = {}
+        self.ruleIndex = RuleIndex()
+        self.__setNatRules([])
+        self.__setPbfRules([])
         self.__importConfigFile(apiKeyFile)
-        self.__loadFireWallRules()
+        if retryPolicy:
+            self.retryPolicy = retryPolicy
+        if loadRules:
+            self.__loadFireWallRules()
         
     ### Methods for establishing a connection with the PaloAlto ###
     # This method will import the PaloAlto API key so the XMLAPI can be used
     def __importConfigFile (self, apiKeyFile):
         myFile = open(apiKeyFile, 'r')
+        breakerThreshold = 5
+        breakerReset = 30.0
+        commitWindow = 5.0
+        commitMaxDelay = 60.0
+        rateLimit = 0.0
+        rateBurst = 10
         
         for line in myFile:
             if line.startswith("baseurl"):
@@ -42,42 +117,134 @@ class PaAPI:
                     self.baseURL = self.baseURL + "/"
             elif line.startswith("apikey"):
                 self.apiKey = line.split("=")[1].rstrip()# + "=="
+            elif line.startswith("vsys"):
+                self.vsys = line.split("=")[1].strip()
+            elif line.startswith("retries"):
+                self.retryPolicy.retries = int(line.split("=")[1])
+            elif line.startswith("backoff"):
+                self.retryPolicy.backoff = float(line.split("=")[1])
+            elif line.startswith("maxbackoff"):
+                self.retryPolicy.maxBackoff = float(line.split("=")[1])
+            elif line.startswith("breakerthreshold"):
+                breakerThreshold = int(line.split("=")[1])
+            elif line.startswith("breakerreset"):
+                breakerReset = float(line.split("=")[1])
+            elif line.startswith("ratelimit"):
+                rateLimit = float(line.split("=")[1])
+            elif line.startswith("rateburst"):
+                rateBurst = int(line.split("=")[1])
+            elif line.startswith("commitwindow"):
+                commitWindow = float(line.split("=")[1])
+            elif line.startswith("commitmaxdelay"):
+                commitMaxDelay = float(line.split("=")[1])
+            elif line.startswith("compression"):
+                self.compression = line.split("=")[1].strip() == "yes"
+            elif line.startswith("decodeprocesses"):
+                self.decodeProcesses = int(line.split("=")[1])
+        myFile.close()
+        
+        # Every PaAPI object talking to the same PaloAlto shares one circuit breaker
+        if self.baseURL not in self.circuitBreakers:
+            self.circuitBreakers[self.baseURL] = CircuitBreaker(breakerThreshold, breakerReset)
+        self.circuitBreaker = self.circuitBreakers[self.baseURL]
+        # The same goes for the commit scheduler, commits are for the whole PaloAlto
+        if self.baseURL not in self.commitSchedulers:
+            self.commitSchedulers[self.baseURL] = CommitScheduler(commitWindow, commitMaxDelay)
+        self.commitScheduler = self.commitSchedulers[self.baseURL]
+        # and for the rate limit, the PaloAlto throttles every caller together
+        if self.baseURL not in self.requestSchedulers:
+            self.requestSchedulers[self.baseURL] = RequestScheduler(rateLimit, rateBurst)
+        self.requestScheduler = self.requestSchedulers[self.baseURL]
+        # and for the reads in flight, the same rules or report asked for at the same moment are only read once
+        if self.baseURL not in self.singleFlights:
+            self.singleFlights[self.baseURL] = SingleFlight()
+        self.singleFlight = self.singleFlights[self.baseURL]
+    
+    '''
+    setRequestPriority: will set the priority of every request sent by this object, interactive requests go before
+    bulk requests when the rate limit is reached and the jobs of a priority take turns (see RequestScheduler)
+    
+        setRequestPriority args:
+            priority => priority of the requests (string => 'interactive' or 'bulk')
+            job => name of the job the requests belong to, e.g. 'nightly-import' (string)
+    '''
+    def setRequestPriority(self, priority, job=None):
+        if priority not in RequestScheduler.PRIORITIES:
+            raise ValueError("Value must be 'interactive' or 'bulk'")
+        self.requestPriority = priority
+        self.requestJob = job
+    
+    '''
+    getRequestMetrics: will return the queue depth and wait times of the requests sent to the PaloAlto, see RequestScheduler.getMetrics
+    '''
+    def getRequestMetrics(self):
+        return self.requestScheduler.getMetrics()
     
     
     ### Methods for importing and instantiating pre-existing FireWall Rules from the PaloAlto as Rule objects ###
     # getFireWallRulesALL: will return a dictionary of all of the current PaloAlto firewall rules
     def __loadFireWallRules(self):
-        root = self.__getFireWallRulesRoot()
-        self.rules = []
-        for child in root.iter('entry'):
-            self.rules.append(
-                    Rules(
-                        self.__getRuleName(child), 
-                        self.__getRuleFrom(child), 
-                        self.__getRuleTo(child), 
-                        self.__getRuleSource(child), 
-                        self.__getRuleDestination(child), 
-                        self.__getRuleService(child), 
-                        self.__getRuleApplication(child),
-                        self.__getRuleAction(child),
-                        self.__getRuleSourceUser(child),
-                        self.__getRuleDisableServerResponse(child),
-                        self.__getRuleNegateSource(child),
-                        self.__getRuleNegateDestination(child),
-                        self.__getRuleDisabled(child), 
-                        self.__getRuleGroup(child), 
-                        self.__getRuleHipProfile(child), 
-                        self.__getRuleLogStart(child), 
-                        self.__getRuleLogEnd(child),
-                        self.__getRuleDescription(child),
-                        )
-                    )
+        if self.decodeProcesses > 1:
+            self.setFireWallRules(RuleDecoder(self.decodeProcesses).decodeRules(self.__getFireWallRulesXML()))
+        else:
+            self.setFireWallRules(self.parseFireWallRules(self.__getFireWallRulesXML()))
+    
+    '''
+    setFireWallRules: will replace the loaded firewall rules of the current vsys with the given rules and index them
+    
+        setFireWallRules args:
+            rules => rules read from the PaloAlto (list of Rule objects)
+    '''
+    def setFireWallRules(self, rules):
+        self.rules = rules
+        self.ruleIndex = RuleIndex(rules)
+        if self.vsys:
+            self.vsysRules[self.vsys] = rules
+    
+    # This method will replace the NAT rules of the current vsys and index them
+    def __setNatRules(self, rules):
+        self.natRules = rules
+        self.natRuleIndex = RuleIndex(rules, RuleIndex.NAT_FIELDS)
+    
+    # This method will replace the PBF rules of the current vsys and index them
+    def __setPbfRules(self, rules):
+        self.pbfRules = rules
+        self.pbfRuleIndex = RuleIndex(rules, RuleIndex.PBF_FIELDS)
+
+    '''
+    loadFireWallRules: will reload the firewall rules from the PaloAlto and return them as a list of Rule objects
+    '''
+    def loadFireWallRules(self):
+        self.__loadFireWallRules()
+        return self.rules
 
+    '''
+    parseFireWallRules: will return a list of Rule objects built from the XML returned by the PaloAlto
     
+        parseFireWallRules args:
+            paRules => response of the PaloAlto to the URL returned by getFireWallRulesURL (string)
     '''
-    getFireWallRules: will return a list of all of the Rule objects
+    def parseFireWallRules(self, paRules):
+        import xml.etree.ElementTree as ET
+        return self.__parseFireWallRuleEntries(ET.fromstring(paRules))
+    
+    # This method will return a Rule object for every entry under root
+    def __parseFireWallRuleEntries(self, root):
+        return [Rules.parseEntry(child) for child in root.iter('entry')]
+
+    
+    '''
+    getFireWallRules: will return a list of all of the Rule objects, raises a ValueError if the rules of the vsys
+    were not loaded (see loadAllFireWallRules and setVsys)
+    
+        getFireWallRules args:
+            vsys => name of the vsys, the current vsys when not given (string)
     '''
-    def getFireWallRules(self):
+    def getFireWallRules(self, vsys=None):
+        if vsys and vsys != self.vsys:
+            if vsys not in self.vsysRules:
+                raise ValueError("The rules of vsys '" + vsys + "' are not loaded")
+            return self.vsysRules[vsys]
         return self.rules
 
         
@@ -93,16 +260,350 @@ class PaAPI:
                 return rule
         raise ValueError("Object does not exist")
     
-    # This method will return the root of the PaloALto firewall rules for parsing the XML file provided by __getFireWallRulesXML
-    def __getFireWallRulesRoot(self):
-        paRules = self.__getFireWallRulesXML()
-        import xml.etree.ElementTree as ET
-        return ET.fromstring(paRules)
+    '''
+    findFireWallRules: will return the loaded rules matching a query on their members, sorted by name (see RuleIndex.find)
+    
+        findFireWallRules args:
+            query => (field, member) or ('and' / 'or', query, query, ...), e.g. ("and", ("src", "web"), ("app", "ssh")) (tuple)
+            rulebase => rulebase of the rules, see RuleIndex for the fields of each (string => 'security', 'nat' or 'pbf')
+    '''
+    def findFireWallRules(self, query, rulebase="security"):
+        return self.__getRuleIndex(rulebase).findRules(query)
+    
+    '''
+    findFireWallRulePositions: will return the positions (starting at 0) of the loaded rules matching a query on their members,
+    in rulebase order (see RuleIndex.findPositions)
+    
+        findFireWallRulePositions args:
+            query => (field, member) or ('and' / 'or', query, query, ...), e.g. ("and", ("src", "web"), ("app", "ssh")) (tuple)
+            rulebase => rulebase of the rules, see RuleIndex for the fields of each (string => 'security', 'nat' or 'pbf')
+    '''
+    def findFireWallRulePositions(self, query, rulebase="security"):
+        return self.__getRuleIndex(rulebase).findPositions(query, self.__getRulebaseRules(rulebase))
+    
+    '''
+    findFireWallRulesUsing: will return the loaded rules using a member (address, zone, application, user...) in any field
+    
+        findFireWallRulesUsing args:
+            member => name of the member (string)
+            rulebase => rulebase of the rules (string => 'security', 'nat' or 'pbf')
+    '''
+    def findFireWallRulesUsing(self, member, rulebase="security"):
+        ruleIndex = self.__getRuleIndex(rulebase)
+        return [ruleIndex.rules[ruleName] for ruleName in sorted(ruleIndex.findMember(member))]
+    
+    '''
+    saveSnapshot: will save the loaded firewall rules to a compact binary snapshot file (see Snapshot)
+    
+        saveSnapshot args:
+            path => name of the snapshot file (string)
+    '''
+    def saveSnapshot(self, path):
+        Snapshot.save(path, self.rules)
+    
+    '''
+    loadSnapshot: will replace the loaded firewall rules with the rules of a snapshot file and return them
+    
+        loadSnapshot args:
+            path => name of the snapshot file (string)
+    '''
+    def loadSnapshot(self, path):
+        snapshot = Snapshot(path)
+        try:
+            self.setFireWallRules(snapshot.getRules())
+        finally:
+            snapshot.close()
+        return self.rules
     
     # This method will return the PaloALto firewall rules in XML format
     def __getFireWallRulesXML (self):
-        paRules = self.__readWebPage(self.baseURL + "api/?type=config&action=show&key=" + self.apiKey + "&xpath=/config/devices/entry/vsys/entry/rulebase/security/rules")
+        url = self.getFireWallRulesURL()
+        paRules = self.singleFlight.do(url, lambda: self.__readWebPage(url, True))
         return paRules
+    
+    '''
+    getFireWallRulesURL: will return the URL used to read the PaloAlto firewall rules
+    
+        getFireWallRulesURL args:
+            vsys => name of the vsys, the current vsys when not given (string)
+            rulebase => rulebase to read (string => 'security', 'nat' or 'pbf')
+    '''
+    def getFireWallRulesURL(self, vsys=None, rulebase="security"):
+        return self.baseURL + "api/?type=config&action=show&key=" + self.apiKey + "&xpath=" + self.getRulesXPath(vsys, rulebase)
+    
+    
+    ### Methods for keeping the loaded FireWall Rules up to date ###
+    '''
+    getFireWallRuleNames: will return the names of the firewall rules in rulebase order without downloading the rules
+    
+    The names are read from the running configuration like the rules themselves (action=show), names only in the
+    candidate configuration of an admin who did not commit yet are left out.
+    '''
+    def getFireWallRuleNames(self):
+        import xml.etree.ElementTree as ET
+        url = self.baseURL + "api/?type=config&action=show&key=" + self.apiKey + "&xpath=" + self.getRulesXPath() + "/entry/@name"
+        root = ET.fromstring(self.__readWebPage(url, True))
+        return [entry.get('name') for entry in root.iter('entry')]
+    
+    '''
+    fetchFireWallRules: will download the given rules, naming as many rules in one request as maxXPathLength allows,
+    merge them into the loaded rules and return them (loaded rules missing from the PaloAlto are removed)
+    
+        fetchFireWallRules args:
+            ruleNames => names of the rules to download (list of strings)
+    '''
+    def fetchFireWallRules(self, ruleNames):
+        fetched = []
+        for predicate in self.__getRuleNamePredicates(ruleNames):
+            params = {"type": "config", "action": "show", "key": self.apiKey, "xpath": self.getRulesXPath() + "/entry" + predicate}
+            fetched.extend(self.parseFireWallRules(self.__readWebPage(self.baseURL + "api/", True, params)))
+        
+        # Downloaded rules replace the loaded copy, new ones are added at the bottom like the PaloAlto does
+        positions = {}
+        for position in range(len(self.rules)):
+            positions[self.rules[position].getRuleName()] = position
+        for rule in fetched:
+            if rule.getRuleName() in positions:
+                self.rules[positions[rule.getRuleName()]] = rule
+            else:
+                positions[rule.getRuleName()] = len(self.rules)
+                self.rules.append(rule)
+            self.ruleIndex.addRule(rule)
+        
+        missingNames = set(ruleNames) - set([rule.getRuleName() for rule in fetched])
+        if missingNames:
+            self.rules[:] = [rule for rule in self.rules if rule.getRuleName() not in missingNames]
+            for ruleName in missingNames:
+                self.ruleIndex.removeRule(ruleName)
+        return fetched
+    
+    '''
+    getFireWallRulesSliceURL: will return the URL used to read the firewall rules between two positions of the rulebase
+    
+        getFireWallRulesSliceURL args:
+            first => position of the first rule, starting at 1 (int)
+            last => position of the last rule, included (int)
+    '''
+    def getFireWallRulesSliceURL(self, first, last):
+        return self.getFireWallRulesURL() + "/entry[position()>=" + str(first) + " and position()<=" + str(last) + "]"
+    
+    '''
+    loadFireWallRulesParallel: will (re)load the firewall rules by downloading slices of sliceSize rules at the same time
+    (at most maxConnections at once) and return them as a list of Rule objects
+    
+    The number of rules is read first (names only), every slice is decoded on its own and the slices are put back in order.
+    If the rulebase changes while it is downloaded the rules are loaded again with a single request.
+    
+        loadFireWallRulesParallel args:
+            maxConnections => upper bound of concurrent requests (int)
+            sliceSize => number of rules of every slice (int)
+    '''
+    def loadFireWallRulesParallel(self, maxConnections=8, sliceSize=500):
+        names = self.getFireWallRuleNames()
+        slices = [(first, min(first + sliceSize - 1, len(names))) for first in range(1, len(names) + 1, sliceSize)]
+        if len(slices) < 2:
+            self.__loadFireWallRules()
+            return self.rules
+        pool = ThreadPool(min(len(slices), maxConnections))
+        try:
+            results = pool.map(lambda ruleSlice: self.parseFireWallRules(self.__readWebPage(self.getFireWallRulesSliceURL(ruleSlice[0], ruleSlice[1]), True)), slices)
+        finally:
+            pool.close()
+        rules = []
+        for result in results:
+            rules.extend(result)
+        
+        if [rule.getRuleName() for rule in rules] == names:
+            self.setFireWallRules(rules)
+        else:
+            self.__loadFireWallRules()
+        return self.rules
+    
+    '''
+    refreshFireWallRules: will bring the loaded rules up to date by downloading only the position ranges that changed 
+    on the PaloAlto since the last refresh and return those ranges as (first, last) tuples (positions start at 0)
+    
+    The PaloAlto does not hash its rules, the fingerprint of every position is built from the rule name and the
+    rule-modification-timestamp of the rule hit counts (one request each), so only committed changes are seen.
+    The first refresh, or a refresh after the loaded rules were changed locally, downloads every rule.
+    '''
+    def refreshFireWallRules(self):
+        names = self.getFireWallRuleNames()
+        hitCounts = self.getFireWallRuleHitCounts()
+        signatures = []
+        for name in names:
+            signatures.append(name + "@" + str(hitCounts.get(name, {}).get('rule-modification-timestamp', "")))
+        fingerprint = RuleFingerprint(signatures)
+        
+        ranges = None
+        if self.ruleFingerprint is not None and self.ruleFingerprint[1] == [rule.getRuleName() for rule in self.rules]:
+            ranges = self.ruleFingerprint[0].getChangedRanges(fingerprint)
+            rules = self.rules[:len(names)] + [None] * (len(names) - len(self.rules))
+            for first, last in ranges:
+                changed = self.parseFireWallRules(self.__readWebPage(self.getFireWallRulesSliceURL(first + 1, last + 1), True))
+                if len(changed) != last - first + 1:
+                    # The rulebase changed again while it was being read
+                    ranges = None
+                    break
+                rules[first:last + 1] = changed
+        if ranges is None:
+            self.__loadFireWallRules()
+            ranges = [(0, len(self.rules) - 1)] if self.rules else []
+        else:
+            self.setFireWallRules(rules)
+        
+        if [rule.getRuleName() for rule in self.rules] == names:
+            self.ruleFingerprint = (fingerprint, names)
+        else:
+            self.ruleFingerprint = None
+        return ranges
+    
+    
+    '''
+    sortFireWallRules: will put the loaded rules in the order of the given names (e.g. after rules were moved on the PaloAlto),
+    loaded rules that are not named are removed and names that are not loaded are left out
+    
+        sortFireWallRules args:
+            ruleNames => names of the rules in rulebase order, see getFireWallRuleNames (list of strings)
+    '''
+    def sortFireWallRules(self, ruleNames):
+        loaded = {}
+        for rule in self.rules:
+            loaded[rule.getRuleName()] = rule
+        self.setFireWallRules([loaded[ruleName] for ruleName in ruleNames if ruleName in loaded])
+        return self.rules
+    
+    '''
+    getConfigLogs: will return the entries of the config log (changes and commits of the configuration) as
+    {'seqno' (int), 'cmd', 'path', 'admin', 'time'} dictionaries sorted by seqno
+    
+        getConfigLogs args:
+            afterSeqno => only return the oldest entries after this sequence number, the newest entries when not given (int)
+            nlogs => upper bound of the number of entries (int)
+    '''
+    def getConfigLogs(self, afterSeqno=None, nlogs=100):
+        import xml.etree.ElementTree as ET
+        params = {"type": "log", "log-type": "config", "key": self.apiKey, "nlogs": str(nlogs)}
+        if afterSeqno is not None:
+            # Entries come newest first by default, the oldest entries after afterSeqno would be left out
+            params["query"] = "(seqno geq " + str(afterSeqno + 1) + ")"
+            params["dir"] = "forward"
+        root = ET.fromstring(self.__readWebPage(self.baseURL + "api/", True, params))
+        job = root.find('result/job')
+        if job is None:
+            raise ValueError(" ".join([line.text for line in root.iter('line') if line.text]) or "The PaloAlto did not start the log query")
+        
+        # Log queries are jobs, the entries are read once the job is finished
+        params = {"type": "log", "action": "get", "job-id": job.text, "key": self.apiKey}
+        while True:
+            root = ET.fromstring(self.__readWebPage(self.baseURL + "api/", True, params))
+            status = root.find('result/job/status')
+            if status is None or status.text == "FIN":
+                break
+            sleep(0.5)
+        
+        entries = []
+        for entry in root.iter('entry'):
+            if entry.findtext('seqno'):
+                entries.append({
+                                "seqno": int(entry.findtext('seqno')), "cmd": entry.findtext('cmd', ""), "path": entry.findtext('path', ""),
+                                "admin": entry.findtext('admin', ""), "time": entry.findtext('receive_time', "")
+                                })
+        entries.sort(key=lambda entry: entry["seqno"])
+        return entries
+    
+    '''
+    createRuleWatcher: will return a RuleWatcher keeping the loaded rules up to date with the changes committed 
+    on the PaloAlto (see RuleWatcher), the rules should be loaded first
+    
+        createRuleWatcher args:
+            interval => seconds between two looks at the config log (float)
+            snapshotPath => snapshot file saved after every refresh for worker processes sharing it (see SharedRulebase) (string)
+    '''
+    def createRuleWatcher(self, interval=30.0, snapshotPath=None):
+        return RuleWatcher(self, interval, snapshotPath)
+    
+    
+    ### Methods for PaloAltos with many virtual systems (vsys) ###
+    '''
+    getVsysXPath: will return the xpath of a vsys
+    
+        getVsysXPath args:
+            vsys => name of the vsys, the current vsys when not given (string)
+    '''
+    def getVsysXPath(self, vsys=None):
+        if not vsys:
+            vsys = self.vsys
+        if vsys:
+            return "/config/devices/entry/vsys/entry[@name='" + vsys + "']"
+        return "/config/devices/entry/vsys/entry"
+    
+    '''
+    getRulesXPath: will return the xpath of the rules of a rulebase of a vsys
+    
+        getRulesXPath args:
+            vsys => name of the vsys, the current vsys when not given (string)
+            rulebase => name of the rulebase (string => 'security', 'nat' or 'pbf')
+    '''
+    def getRulesXPath(self, vsys=None, rulebase="security"):
+        return self.getVsysXPath(vsys) + "/rulebase/" + rulebase + "/rules"
+    
+    '''
+    getVsysNames: will return the names of every vsys of the PaloAlto
+    '''
+    def getVsysNames(self):
+        import xml.etree.ElementTree as ET
+        url = self.baseURL + "api/?type=config&action=get&key=" + self.apiKey + "&xpath=/config/devices/entry/vsys/entry/@name"
+        root = ET.fromstring(self.__readWebPage(url, True))
+        return [entry.get('name') for entry in root.iter('entry')]
+    
+    '''
+    setVsys: will make every following request use a vsys, its rules are loaded the first time it is used
+    
+        setVsys args:
+            vsys => name of the vsys (string)
+    '''
+    def setVsys(self, vsys):
+        self.vsys = vsys
+        self.objects = None
+        self.ruleValidator = None
+        self.ruleFingerprint = None
+        self.__setNatRules([])
+        self.__setPbfRules([])
+        if vsys in self.vsysRules:
+            self.setFireWallRules(self.vsysRules[vsys])
+        else:
+            self.__loadFireWallRules()
+    
+    '''
+    getVsys: will return the name of the vsys used by every request ('' when none was chosen)
+    '''
+    def getVsys(self):
+        return self.vsys
+    
+    '''
+    loadAllFireWallRules: will load the firewall rules of every vsys at the same time (one connection per vsys, at most
+    maxConnections) and return a dictionary of vsys name => list of Rule objects
+    
+        loadAllFireWallRules args:
+            maxConnections => upper bound of concurrent requests (int)
+    '''
+    def loadAllFireWallRules(self, maxConnections=8):
+        vsysNames = self.getVsysNames()
+        if not vsysNames:
+            return self.vsysRules
+        pool = ThreadPool(min(len(vsysNames), maxConnections))
+        try:
+            results = pool.map(lambda vsys: self.parseFireWallRules(self.__readWebPage(self.getFireWallRulesURL(vsys), True)), vsysNames)
+        finally:
+            pool.close()
+        for index in range(len(vsysNames)):
+            self.vsysRules[vsysNames[index]] = results[index]
+        if not self.vsys:
+            self.vsys = vsysNames[0]
+        if self.vsys in self.vsysRules:
+            self.setFireWallRules(self.vsysRules[self.vsys])
+        return self.vsysRules
 
 
 
@@ -132,6 +633,7 @@ class PaAPI:
     def createFireWallRule(self, name, memFrom, memTo, src, dst, srv, app, act, srcUsr, disRsp, negSrc, negDst, disable, group, hipProf, logStart, logEnd, desc):
         newRule = Rules(name, memFrom, memTo, src, dst, srv, app, act, srcUsr, disRsp, negSrc, negDst, disable, group, hipProf, logStart, logEnd, desc)
         self.rules.append(newRule)
+        self.ruleIndex.addRule(newRule)
         return newRule
     
     
@@ -143,9 +645,29 @@ class PaAPI:
             rule => rule you want to delete (rule object)
     '''
     def deleteFireWallRule(self, rule):
+        paResponse = self.__readWebPage(self.getDeleteFireWallRuleURL(rule), True)
+        paMsg = self.parseDeleteResponse(paResponse)
+        self.forgetDeletedRules([rule])
+        return paMsg
+    
+    '''
+    getDeleteFireWallRuleURL: will return the URL used to delete a PaloAlto FireWall Rule
+    
+        getDeleteFireWallRuleURL args:
+            rule => rule you want to delete (rule object)
+    '''
+    def getDeleteFireWallRuleURL(self, rule):
         url = self.baseURL + "api/?type=config&action=delete&key=" + self.apiKey
-        url = url + "&xpath=/config/devices/entry/vsys/entry/rulebase/security/rules/entry[@name='"+ rule.getRuleName() + "']"
-        paResponse = self.__readWebPage(url)
+        url = url + "&xpath=" + self.getRulesXPath(None, rule.rulebase) + "/entry[@name='"+ rule.getRuleName() + "']"
+        return url
+    
+    '''
+    parseDeleteResponse: will return the message of the PaloAlto when a delete succeeded, raises a ValueError otherwise
+    
+        parseDeleteResponse args:
+            paResponse => response of the PaloAlto to the URL returned by getDeleteFireWallRuleURL (string)
+    '''
+    def parseDeleteResponse(self, paResponse):
         paRoot = self.__getWriteResponseRoot(paResponse)
         
         for subRoot in paRoot.iter('response'):
@@ -161,8 +683,81 @@ class PaAPI:
     commitFireWallConfiguration: will create and submit the URL for committing changes to the PaloAlto
     '''
     def commitFireWallConfiguration(self):
-        url = self.baseURL + "api/?type=commit&key=" + self.apiKey + "&cmd=<commit></commit>"
-        paResponse = self.__readWebPage(url)
+        while True:
+            paResponse = self.__readWebPage(self.getCommitURL())
+            commitMsg = self.parseCommitResponse(paResponse)
+            if commitMsg:
+                return commitMsg
+            print(".")
+            sleep(5)
+    
+    '''
+    commitAndWait: will commit the changes to the PaloAlto, wait for the commit job to finish and return its message,
+    raises a ValueError with the details of the PaloAlto if the commit failed
+    '''
+    def commitAndWait(self):
+        # PaAPI's methods are used even from subclasses, AsyncPaAPI's are coroutines
+        commitMsg = PaAPI.commitFireWallConfiguration(self)
+        jobId = re.search(r"jobid (\d+)", commitMsg)
+        if jobId is None:
+            return commitMsg
+        return PaAPI.waitForJob(self, jobId.group(1))
+    
+    '''
+    requestCommit: will ask for a commit shared with the other callers asking for one at about the same time
+    (see CommitScheduler), wait for the shared commit job to finish and return its message, 
+    raises a ValueError with the details of the PaloAlto if the commit failed
+    '''
+    def requestCommit(self):
+        return self.commitScheduler.requestCommit(self.commitAndWait)
+    
+    '''
+    waitForJob: will poll a job of the PaloAlto (commit...) until it is finished and return its message,
+    raises a ValueError with the details of the PaloAlto if the job failed
+    
+        waitForJob args:
+            jobId => id of the job (string)
+    '''
+    def waitForJob(self, jobId):
+        params = {"type": "op", "key": self.apiKey, "cmd": "<show><jobs><id>" + str(jobId) + "</id></jobs></show>"}
+        while True:
+            job = self.parseJobResponse(self.__readWebPage(self.baseURL + "api/", True, params))
+            if job["status"] == "FIN":
+                break
+            sleep(self.jobPollInterval)
+        if job["result"] != "OK":
+            raise ValueError("Job " + str(jobId) + " failed: " + (job["details"] or job["result"]))
+        return job["details"] or "Job " + str(jobId) + " finished"
+    
+    '''
+    parseJobResponse: will return the 'status' (e.g. 'ACT' or 'FIN'), 'result' (e.g. 'OK' or 'FAIL') and 'details' 
+    (the lines of the job joined) of a job, raises a ValueError when the job is not known
+    
+        parseJobResponse args:
+            paResponse => response of the PaloAlto to the show jobs op command (string)
+    '''
+    def parseJobResponse(self, paResponse):
+        paRoot = self.__getWriteResponseRoot(paResponse)
+        job = paRoot.find('result/job')
+        if paRoot.get('status') != "success" or job is None:
+            raise ValueError(" ".join([line.text for line in paRoot.iter('line') if line.text]) or "The PaloAlto does not know the job")
+        details = [line.text.strip() for line in job.iter('line') if line.text and line.text.strip()]
+        return {"status": job.findtext('status', ""), "result": job.findtext('result', ""), "details": "\n".join(details)}
+    
+    '''
+    getCommitURL: will return the URL used to commit changes to the PaloAlto
+    '''
+    def getCommitURL(self):
+        return self.baseURL + "api/?type=commit&key=" + self.apiKey + "&cmd=<commit></commit>"
+    
+    '''
+    parseCommitResponse: will return the message of the PaloAlto when a commit was accepted, 
+    None when another commit is still running (the commit has to be sent again) and raises a ValueError otherwise
+    
+        parseCommitResponse args:
+            paResponse => response of the PaloAlto to the URL returned by getCommitURL (string)
+    '''
+    def parseCommitResponse(self, paResponse):
         paRoot = self.__getWriteResponseRoot(paResponse)
         
         # Parsing the XML Response to confirm whether the commit took place or not
@@ -171,14 +766,13 @@ class PaAPI:
                 return msg[0].text
             
             elif msg[0][0].text and "Another commit" in msg[0][0].text:
-                print(".")
-                sleep(5)
-                self.commitFireWallConfiguration()
+                return None
             elif msg[0][0][0].text and"Commit job" in msg[0][0][0].text:
                 return msg[0][0][0].text
             
             else:
                 raise ValueError(msg[0].text)
+        raise ValueError("The PaloAlto did not answer the commit request")
     
     ### Methods for writing a FireWall Rule to the PaloAlto ###
     '''
@@ -188,9 +782,20 @@ class PaAPI:
             rule => rule you want to write (rule object)
     '''
     def writeFireWallRule(self, rule):
-        url = self.__buildFireWallRulesXML(rule)
-        paResponse = self.__readWebPage(url)
-        
+        if self.ruleValidator:
+            self.ruleValidator.checkRules([rule])
+        paResponse = self.__readWebPage(self.getWriteFireWallRuleURL(rule))
+        paMsg = self.parseWriteResponse(paResponse)
+        self.storeWrittenRules([rule])
+        return paMsg
+    
+    '''
+    parseWriteResponse: will return the message of the PaloAlto when a write succeeded, raises a ValueError otherwise
+    
+        parseWriteResponse args:
+            paResponse => response of the PaloAlto to the URL returned by getWriteFireWallRuleURL (string)
+    '''
+    def parseWriteResponse(self, paResponse):
         paRoot = self.__getWriteResponseRoot(paResponse)
         
         # Parsing the XML Response to confirm whether the commit took place or not
@@ -198,45 +803,622 @@ class PaAPI:
             for msg in subRoot:
                 if msg.text == "command succeeded":
                     return msg.text
-                else:
+                elif len(msg):
                     raise ValueError(msg[0].text)
+                else:
+                    raise ValueError(msg.text)
         
         return paRoot
 
-    # This method will create XML to be used to generate a PaloALto firewall rule
-    def __buildFireWallRulesXML (self, rule):
+    '''
+    getWriteFireWallRuleURL: will return the URL (containing the rule's XML) used to write a PaloAlto FireWall Rule
+    
+        getWriteFireWallRuleURL args:
+            rule => rule you want to write (rule object)
+    '''
+    def getWriteFireWallRuleURL(self, rule):
         url = self.baseURL + "api/?type=config&action=set&key=" + self.apiKey
-        url = url + "&xpath=/config/devices/entry/vsys/entry/rulebase/security/rules/entry" + rule.genRuleNameXML()
+        url = url + "&xpath=" + self.getRulesXPath(None, rule.rulebase) + "/entry" + rule.genRuleNameXML()
         url = url + "&element="
-        url = url + rule.genRuleFromMembersXML()
-        url = url + rule.genRuleToMembersXML()
-        url = url + rule.genRuleSourceXML()
-        url = url + rule.genRuleDestinationXML()
-        url = url + rule.genRuleServiceXML()
-        url = url + rule.genRuleApplicationXML()
-        url = url + rule.genRuleActionXML()
-        url = url + rule.genRuleSourceUserXML()
-        url = url + rule.genRuleDisableServerResponseXML()
-        url = url + rule.genRuleNegateSourceXML()
-        url = url + rule.genRuleNegateDestinationXML()
-        url = url + rule.genRuleDisabledXML()
-        url = url + rule.genRuleGroupsXML()
-        url = url + rule.genRuleHipProfilesXML()
-        url = url + rule.genRuleLogStartXML()
-        url = url + rule.genRuleLogEndXML()
-        url = url + rule.genRuleDescriptionXML()
+        url = url + rule.genRuleMembersXML()
         return url
     
     
+    ### Methods for changing many FireWall Rules at once ###
+    '''
+    createChangeSet: will return an empty ChangeSet used to send many changes and commit them at once
+    '''
+    def createChangeSet(self):
+        return ChangeSet(self)
+    
+    '''
+    writeFireWallRules: will write many PaloAlto FireWall Rules using one request for every batchSize rules
+    
+    New rules are added at the bottom of their rulebase, members of existing rules are merged (like writeFireWallRule).
+    Security, NAT and PBF rules can be mixed, each rulebase gets its own requests.
+    
+        writeFireWallRules args:
+            rules => rules you want to write (list of Rules, NatRules or PbfRules objects)
+    '''
+    def writeFireWallRules(self, rules):
+        if self.ruleValidator:
+            self.ruleValidator.checkRules(rules)
+        for rulebase, rulebaseRules in self.__groupByRulebase(rules):
+            for start in range(0, len(rulebaseRules), self.batchSize):
+                element = ""
+                for rule in rulebaseRules[start:start + self.batchSize]:
+                    element = element + rule.genRuleXML()
+                params = {"type": "config", "action": "set", "key": self.apiKey, "xpath": self.getRulesXPath(None, rulebase), "element": element}
+                self.parseWriteResponse(self.__readWebPage(self.baseURL + "api/", False, params))
+            self.storeWrittenRules(rulebaseRules)
+        return "command succeeded"
+    
+    '''
+    storeWrittenRules: will update the loaded rules and their indexes once rules were written to the PaloAlto, rules written 
+    for the first time are added at the bottom of their rulebase (like the PaloAlto does), rewritten rules replace the loaded copy
+    
+        storeWrittenRules args:
+            rules => rules that were written (list of Rules, NatRules or PbfRules objects)
+    '''
+    def storeWrittenRules(self, rules):
+        for rulebase, rulebaseRules in self.__groupByRulebase(rules):
+            localRules = self.__getRulebaseRules(rulebase)
+            positions = {}
+            for position in range(len(localRules)):
+                positions[localRules[position].getRuleName()] = position
+            for rule in rulebaseRules:
+                if rule.getRuleName() in positions:
+                    localRules[positions[rule.getRuleName()]] = rule
+                else:
+                    positions[rule.getRuleName()] = len(localRules)
+                    localRules.append(rule)
+                self.__getRuleIndex(rulebase).addRule(rule)
+    
+    '''
+    forgetDeletedRules: will remove rules deleted from the PaloAlto from the loaded rules and their indexes
+    
+        forgetDeletedRules args:
+            rules => rules that were deleted (list of Rules, NatRules or PbfRules objects)
+    '''
+    def forgetDeletedRules(self, rules):
+        for rulebase, rulebaseRules in self.__groupByRulebase(rules):
+            deletedNames = set([rule.getRuleName() for rule in rulebaseRules])
+            localRules = self.__getRulebaseRules(rulebase)
+            localRules[:] = [rule for rule in localRules if rule.getRuleName() not in deletedNames]
+            for ruleName in deletedNames:
+                self.__getRuleIndex(rulebase).removeRule(ruleName)
+    
+    '''
+    importFireWallRules: will read the rules of a CSV or YAML file, check every row and write them to the PaloAlto in batches,
+    returns the number of rules written (see RuleImporter for the file format)
+    
+    Nothing is written when a row is not valid, the ValueError raised lists every invalid row with its line number
+    
+        importFireWallRules args:
+            path => name of the CSV or YAML file (string)
+    '''
+    def importFireWallRules(self, path):
+        return RuleImporter(path).importRules(self)
+    
+    '''
+    editFireWallRule: will replace a PaloAlto FireWall Rule with the given rule (members missing from the rule are removed)
+    
+    The rule objects do not hold everything a rule can have (tags, schedule, log forwarding...), the children of the entry
+    the rule does not write (see ownsChild) are read from the candidate config and sent back along with the rule
+    
+        editFireWallRule args:
+            rule => rule you want to write (rule object)
+    '''
+    def editFireWallRule(self, rule):
+        if self.ruleValidator:
+            self.ruleValidator.checkRules([rule])
+        xpath = self.getRulesXPath(None, rule.rulebase) + "/entry" + rule.genRuleNameXML()
+        element = "<entry name='" + rule.getRuleName() + "'>" + rule.genRuleMembersXML() + self.__getKeptChildrenXML(rule, xpath) + "</entry>"
+        params = {"type": "config", "action": "edit", "key": self.apiKey, "xpath": xpath, "element": element}
+        paMsg = self.parseWriteResponse(self.__readWebPage(self.baseURL + "api/", False, params))
+        
+        localRules = self.__getRulebaseRules(rule.rulebase)
+        for position in range(len(localRules)):
+            if localRules[position].getRuleName() == rule.getRuleName():
+                localRules[position] = rule
+                self.__getRuleIndex(rule.rulebase).updateRule(rule)
+        return paMsg
+    
+    '''
+    deleteFireWallRules: will delete many PaloAlto FireWall Rules, naming as many rules in one request as maxXPathLength allows
+    
+        deleteFireWallRules args:
+            rules => rules you want to delete (list of rule objects)
+    '''
+    def deleteFireWallRules(self, rules):
+        for rulebase, rulebaseRules in self.__groupByRulebase(rules):
+            for predicate in self.__getRuleNamePredicates([rule.getRuleName() for rule in rulebaseRules]):
+                params = {"type": "config", "action": "delete", "key": self.apiKey, "xpath": self.getRulesXPath(None, rulebase) + "/entry" + predicate}
+                self.parseWriteResponse(self.__readWebPage(self.baseURL + "api/", True, params))
+            self.forgetDeletedRules(rulebaseRules)
+        return "command succeeded"
+    
+    '''
+    moveFireWallRule: will move a PaloAlto FireWall Rule inside the rulebase
+    
+        moveFireWallRule args:
+            rule => rule you want to move (rule object)
+            where => where to move the rule (string => 'top', 'bottom', 'before' or 'after')
+            dst => name of the rule to move before or after, only used with 'before' and 'after' (string)
+    '''
+    def moveFireWallRule(self, rule, where, dst=None):
+        if where not in ("top", "bottom", "before", "after"):
+            raise ValueError("Value must be 'top', 'bottom', 'before' or 'after'")
+        if where in ("before", "after") and not dst:
+            raise ValueError("A destination rule is needed to move a rule '" + where + "' it")
+        params = {"type": "config", "action": "move", "key": self.apiKey, "xpath": self.getRulesXPath(None, rule.rulebase) + "/entry" + rule.genRuleNameXML(), "where": where}
+        if dst:
+            params["dst"] = dst
+        paMsg = self.parseWriteResponse(self.__readWebPage(self.baseURL + "api/", False, params))
+        
+        # Keeping the local rulebase in the same order as the PaloAlto
+        localRules = self.__getRulebaseRules(rule.rulebase)
+        moved = [localRule for localRule in localRules if localRule.getRuleName() == rule.getRuleName()]
+        if moved:
+            localRules.remove(moved[0])
+            if where == "top":
+                localRules.insert(0, moved[0])
+            elif where == "bottom":
+                localRules.append(moved[0])
+            else:
+                position = [localRule.getRuleName() for localRule in localRules].index(dst)
+                if where == "after":
+                    position = position + 1
+                localRules.insert(position, moved[0])
+        return paMsg
+    
+    '''
+    getFireWallRuleMoves: will return the fewest moves, as (rule name, where, dst) tuples, putting the rules in the given order
+    
+        getFireWallRuleMoves args:
+            ruleNames => names of every rule in the order they must have (list of strings)
+    '''
+    def getFireWallRuleMoves(self, ruleNames):
+        return RuleOrder([rule.getRuleName() for rule in self.rules]).getMoves(ruleNames)
+    
+    '''
+    reorderFireWallRules: will put the PaloAlto FireWall Rules in the given order using the fewest moves, returns the moves
+    
+        reorderFireWallRules args:
+            ruleNames => names of every rule in the order they must have (list of strings)
+    '''
+    def reorderFireWallRules(self, ruleNames):
+        moves = self.getFireWallRuleMoves(ruleNames)
+        rulesByName = {}
+        for rule in self.rules:
+            rulesByName[rule.getRuleName()] = rule
+        for move in moves:
+            self.moveFireWallRule(rulesByName[move[0]], move[1], move[2])
+        return moves
+    
+    '''
+    revertFireWallConfiguration: will throw away every uncommitted change by loading the running config into the candidate config
+    
+    This also throws away uncommitted changes made by other administrators
+    '''
+    def revertFireWallConfiguration(self):
+        params = {"type": "op", "key": self.apiKey, "cmd": "<load><config><from>running-config.xml</from></config></load>"}
+        paRoot = self.__getWriteResponseRoot(self.__readWebPage(self.baseURL + "api/", False, params))
+        if paRoot.get('status') != "success":
+            raise ValueError("The PaloAlto could not revert the candidate configuration")
+        return "Configuration reverted"
+    
+    # This method will return the XML of the children of a rule's entry in the candidate config that the rule does not write
+    def __getKeptChildrenXML(self, rule, xpath):
+        import xml.etree.ElementTree as ET
+        params = {"type": "config", "action": "get", "key": self.apiKey, "xpath": xpath}
+        entry = ET.fromstring(self.__readWebPage(self.baseURL + "api/", True, params)).find('.//entry')
+        if entry is None:
+            return ""
+        kept = ""
+        for child in entry:
+            if not rule.ownsChild(child):
+                child.tail = None
+                childXML = ET.tostring(child)
+                if not isinstance(childXML, str):
+                    childXML = childXML.decode('utf-8')
+                kept = kept + childXML
+        return kept
+    
+    # This method will return xpath predicates ("[@name='a' or @name='b']") naming the given rules, each shorter than maxXPathLength
+    def __getRuleNamePredicates(self, ruleNames):
+        predicates = []
+        predicate = ""
+        for ruleName in ruleNames:
+            term = "@name='" + ruleName + "'"
+            if predicate and len(predicate) + len(term) + 6 > self.maxXPathLength:
+                predicates.append("[" + predicate + "]")
+                predicate = ""
+            if predicate:
+                predicate = predicate + " or " + term
+            else:
+                predicate = term
+        if predicate:
+            predicates.append("[" + predicate + "]")
+        return predicates
+    
+    # This method will split rules by rulebase, keeping their order: [(rulebase, rules), ...]
+    def __groupByRulebase(self, rules):
+        groups = OrderedDict()
+        for rule in rules:
+            groups.setdefault(rule.rulebase, []).append(rule)
+        return list(groups.items())
+    
+    # This method will return the loaded rules of a rulebase ('security', 'nat' or 'pbf')
+    def __getRulebaseRules(self, rulebase):
+        if rulebase == "nat":
+            return self.natRules
+        elif rulebase == "pbf":
+            return self.pbfRules
+        return self.rules
+    
+    # This method will return the index of the loaded rules of a rulebase ('security', 'nat' or 'pbf')
+    def __getRuleIndex(self, rulebase):
+        if rulebase == "nat":
+            return self.natRuleIndex
+        elif rulebase == "pbf":
+            return self.pbfRuleIndex
+        return self.ruleIndex
+    
+    
+    ### Methods for NAT and Policy Based Forwarding (PBF) rules ###
+    '''
+    loadNatRules: will (re)load the NAT rules of the current vsys from the PaloAlto and return them as a list of NatRules objects
+    '''
+    def loadNatRules(self):
+        self.__setNatRules(self.parseNatRules(self.__readWebPage(self.getFireWallRulesURL(None, "nat"), True)))
+        return self.natRules
+    
+    '''
+    loadPbfRules: will (re)load the PBF rules of the current vsys from the PaloAlto and return them as a list of PbfRules objects
+    '''
+    def loadPbfRules(self):
+        self.__setPbfRules(self.parsePbfRules(self.__readWebPage(self.getFireWallRulesURL(None, "pbf"), True)))
+        return self.pbfRules
+    
+    '''
+    loadAllRulebases: will (re)load the security, NAT and PBF rules of the current vsys with a single request 
+    and return them as a (security rules, NAT rules, PBF rules) tuple
+    '''
+    def loadAllRulebases(self):
+        import xml.etree.ElementTree as ET
+        url = self.baseURL + "api/?type=config&action=show&key=" + self.apiKey + "&xpath=" + self.getVsysXPath() + "/rulebase"
+        root = ET.fromstring(self.__readWebPage(url, True))
+        self.setFireWallRules(self.__parseFireWallRuleEntries(self.__findRulebase(root, "security")))
+        self.__setNatRules(self.__parseNatRuleEntries(self.__findRulebase(root, "nat")))
+        self.__setPbfRules(self.__parsePbfRuleEntries(self.__findRulebase(root, "pbf")))
+        return (self.rules, self.natRules, self.pbfRules)
+    
+    '''
+    parseNatRules: will return a list of NatRules objects built from the XML returned by the PaloAlto
+    
+        parseNatRules args:
+            paRules => response of the PaloAlto to the URL returned by getFireWallRulesURL for the 'nat' rulebase (string)
+    '''
+    def parseNatRules(self, paRules):
+        import xml.etree.ElementTree as ET
+        return self.__parseNatRuleEntries(ET.fromstring(paRules))
+    
+    '''
+    parsePbfRules: will return a list of PbfRules objects built from the XML returned by the PaloAlto
+    
+        parsePbfRules args:
+            paRules => response of the PaloAlto to the URL returned by getFireWallRulesURL for the 'pbf' rulebase (string)
+    '''
+    def parsePbfRules(self, paRules):
+        import xml.etree.ElementTree as ET
+        return self.__parsePbfRuleEntries(ET.fromstring(paRules))
+    
+    '''
+    getNatRules: will return a list of all of the NatRules objects
+    '''
+    def getNatRules(self):
+        return self.natRules
+    
+    '''
+    getNatRule: will return a NatRules object based on the rules name
+    
+        getNatRule args:
+            ruleName => name of the rule (string)
+    '''
+    def getNatRule(self, ruleName):
+        for rule in self.natRules:
+            if rule.name == ruleName:
+                return rule
+        raise ValueError("Object does not exist")
+    
+    '''
+    getPbfRules: will return a list of all of the PbfRules objects
+    '''
+    def getPbfRules(self):
+        return self.pbfRules
+    
+    '''
+    getPbfRule: will return a PbfRules object based on the rules name
+    
+        getPbfRule args:
+            ruleName => name of the rule (string)
+    '''
+    def getPbfRule(self, ruleName):
+        for rule in self.pbfRules:
+            if rule.name == ruleName:
+                return rule
+        raise ValueError("Object does not exist")
+    
+    # This method will return the 'rules' element of a rulebase inside the response to a whole rulebase (empty when it has no rules)
+    def __findRulebase(self, root, rulebase):
+        import xml.etree.ElementTree as ET
+        rules = root.find('.//' + rulebase + '/rules')
+        if rules is None:
+            return ET.Element('rules')
+        return rules
+    
+    
+    ### Methods for finding unused FireWall Rules ###
+    '''
+    getFireWallRuleHitCounts: will return the hit counts of every rule of a rulebase of the current vsys using a single op command,
+    as a dictionary of rule name => {'hit-count', 'last-hit-timestamp', 'first-hit-timestamp', 'rule-creation-timestamp', ...} (ints)
+    
+        getFireWallRuleHitCounts args:
+            rulebase => rulebase to read (string => 'security', 'nat' or 'pbf')
+    '''
+    def getFireWallRuleHitCounts(self, rulebase="security"):
+        vsys = self.vsys or "vsys1"
+        cmd = "<show><rule-hit-count><vsys><vsys-name><entry name='" + vsys + "'><rule-base><entry name='" + rulebase + "'>"
+        cmd = cmd + "<rules><all/></rules></entry></rule-base></entry></vsys-name></vsys></rule-hit-count></show>"
+        params = {"type": "op", "key": self.apiKey, "cmd": cmd}
+        return self.parseRuleHitCounts(self.__readWebPage(self.baseURL + "api/", True, params))
+    
+    '''
+    parseRuleHitCounts: will return the hit counts of the rules as a dictionary of rule name => {counter name => value (int)}
+    
+        parseRuleHitCounts args:
+            paResponse => response of the PaloAlto to the rule-hit-count op command (string)
+    '''
+    def parseRuleHitCounts(self, paResponse):
+        import xml.etree.ElementTree as ET
+        root = ET.fromstring(paResponse)
+        if root.get('status') != "success":
+            raise ValueError("The PaloAlto could not read the rule hit counts")
+        hitCounts = {}
+        for rules in root.iter('rules'):
+            for entry in rules.findall('entry'):
+                counters = {}
+                for counter in entry:
+                    if counter.text and counter.text.isdigit():
+                        counters[counter.tag] = int(counter.text)
+                hitCounts[entry.get('name')] = counters
+        return hitCounts
+    
+    '''
+    getUnusedFireWallRules: will return the loaded rules that never matched any traffic and the ones that did not match any
+    for staleDays days as a (zero hit rules, stale rules) tuple, rules missing from the hit counts (not committed yet) are left out
+    
+        getUnusedFireWallRules args:
+            staleDays => number of days without a hit after which a rule is stale (int)
+            hitCounts => hit counts returned by getFireWallRuleHitCounts, read from the PaloAlto when not given (dictionary)
+    '''
+    def getUnusedFireWallRules(self, staleDays=90, hitCounts=None):
+        if hitCounts is None:
+            hitCounts = self.getFireWallRuleHitCounts()
+        staleSince = time.time() - staleDays * 86400
+        zeroHit = []
+        stale = []
+        for rule in self.rules:
+            counters = hitCounts.get(rule.getRuleName())
+            if counters is None:
+                continue
+            if counters.get('hit-count', 0) == 0:
+                zeroHit.append(rule)
+            elif counters.get('last-hit-timestamp', 0) < staleSince:
+                stale.append(rule)
+        return (zeroHit, stale)
+    
+    
+    ### Methods for User-ID (IP address tags for dynamic address groups and user mappings) ###
+    '''
+    createUserIDBuffer: will return a UserIDBuffer sending many User-ID changes in a few big requests (see UserIDBuffer),
+    it has to be closed once every change was added
+    
+        createUserIDBuffer args:
+            maxEntries => upper bound of the number of changes sent in a single request (int)
+            maxDelay => upper bound of the seconds a change waits before it is sent (float)
+            maxPending => number of waiting changes that makes the callers adding changes wait (int)
+    '''
+    def createUserIDBuffer(self, maxEntries=1000, maxDelay=1.0, maxPending=10000):
+        return UserIDBuffer(self, maxEntries, maxDelay, maxPending)
+    
+    '''
+    sendUserIDMessage: will send a uid-message to the PaloAlto and return the status of the response
+    
+        sendUserIDMessage args:
+            message => uid-message XML, see UserIDBuffer.genMessageXML (string)
+    '''
+    def sendUserIDMessage(self, message):
+        params = {"type": "user-id", "key": self.apiKey, "cmd": message}
+        if self.vsys:
+            params["vsys"] = self.vsys
+        return self.parseUserIDResponse(self.__readWebPage(self.baseURL + "api/", False, params))
+    
+    '''
+    parseUserIDResponse: will return the status of the response to a uid-message ('success') and raises a ValueError otherwise
+    
+        parseUserIDResponse args:
+            paResponse => response of the PaloAlto to a uid-message (string)
+    '''
+    def parseUserIDResponse(self, paResponse):
+        paRoot = self.__getWriteResponseRoot(paResponse)
+        if paRoot.get('status') == "success":
+            return paRoot.get('status')
+        lines = [line.text for line in paRoot.iter('line') if line.text]
+        if not lines:
+            lines = [msg.text for msg in paRoot.iter('msg') if msg.text]
+        raise ValueError(" ".join(lines) or "The PaloAlto refused the uid-message")
+    
+    
+    ### Methods for address and service objects ###
+    '''
+    loadFireWallObjects: will load every address, address group, service and service group of the PaloAlto, shared ones and
+    those of the current vsys (one request each), and return the ObjectResolver used to turn rule members into IP and port ranges
+    
+    Like the PaloAlto, an object of the vsys hides a shared object with the same name
+    '''
+    def loadFireWallObjects(self):
+        import xml.etree.ElementTree as ET
+        objects = ObjectResolver()
+        
+        # name => (method of the ObjectResolver, arguments), the objects of the vsys are read last and replace the shared ones
+        # Addresses and services have their own names, an address and a service can have the same name
+        addresses = OrderedDict()
+        services = OrderedDict()
+        for xpath in ("/config/shared", self.getVsysXPath()):
+            root = ET.fromstring(self.__readWebPage(self.__getObjectsURL(xpath, "address"), True))
+            for entry in root.iter('entry'):
+                for attr in entry:
+                    if attr.tag in ("ip-netmask", "ip-range", "fqdn", "ip-wildcard"):
+                        addresses[entry.get('name')] = (objects.setAddress, (attr.tag, attr.text))
+            
+            root = ET.fromstring(self.__readWebPage(self.__getObjectsURL(xpath, "address-group"), True))
+            for entry in root.iter('entry'):
+                if entry.find('dynamic') is not None:
+                    addresses[entry.get('name')] = (objects.setAddressGroup, (None,))
+                else:
+                    addresses[entry.get('name')] = (objects.setAddressGroup, ([member.text for member in entry.iter('member')],))
+            
+            root = ET.fromstring(self.__readWebPage(self.__getObjectsURL(xpath, "service"), True))
+            for entry in root.iter('entry'):
+                for protocol in entry.iter('protocol'):
+                    for attr in protocol:
+                        if attr.tag in ("tcp", "udp") and attr.find('port') is not None:
+                            services[entry.get('name')] = (objects.setService, (attr.tag, attr.find('port').text))
+            
+            root = ET.fromstring(self.__readWebPage(self.__getObjectsURL(xpath, "service-group"), True))
+            for entry in root.iter('entry'):
+                services[entry.get('name')] = (objects.setServiceGroup, ([member.text for member in entry.iter('member')],))
+        
+        for definitions in (addresses, services):
+            for name in definitions:
+                setObject, args = definitions[name]
+                setObject(name, *args)
+        self.objects = objects
+        return self.objects
+    
+    '''
+    resolveFireWallRule: will return the IP and port ranges of a rule (see ObjectResolver.resolveRule), 
+    the objects are loaded from the PaloAlto the first time
+    
+        resolveFireWallRule args:
+            rule => rule to resolve (rule object)
+    '''
+    def resolveFireWallRule(self, rule):
+        if self.objects is None:
+            self.loadFireWallObjects()
+        return self.objects.resolveRule(rule)
+    
+    '''
+    loadRuleValidator: will load the names of the zones, addresses, applications, services, security profile groups
+    and HIP profiles of the PaloAlto (one request per kind) and check the members of every rule written from now on
+    against them without any request (see RuleValidator), set ruleValidator to None to stop checking
+    '''
+    def loadRuleValidator(self):
+        objectTypes = {
+                       "zone": ["zone"],
+                       "address": ["address", "address-group", "external-list"],
+                       "application": ["application", "application-group", "application-filter"],
+                       "service": ["service", "service-group"],
+                       "profile-group": ["profile-group"],
+                       "hip-profile": ["profiles/hip-profiles"]
+                       }
+        names = {}
+        for kind in RuleValidator.KINDS:
+            # Zones only exist in a vsys, the other objects can also be shared by every vsys
+            roots = [self.getVsysXPath()]
+            if kind != "zone":
+                roots.append("/config/shared")
+            xpaths = [root + "/" + objectType + "/entry/@name" for root in roots for objectType in objectTypes[kind]]
+            if kind == "application":
+                xpaths.append("/config/predefined/application/entry/@name")
+            names[kind] = self.__getNames(" | ".join(xpaths))
+        self.ruleValidator = RuleValidator(names)
+        return self.ruleValidator
+    
+    # This method will return the names of the entries selected by an xpath
+    def __getNames(self, xpath):
+        import xml.etree.ElementTree as ET
+        url = self.baseURL + "api/?type=config&action=get&key=" + self.apiKey + "&xpath=" + xpath
+        root = ET.fromstring(self.__readWebPage(url, True))
+        return [entry.get('name') for entry in root.iter('entry')]
+    
+    # This method will return the URL used to read every object of a type ('address', 'address-group', 'service' or 'service-group')
+    # found under an xpath ('/config/shared' or the xpath of the vsys)
+    def __getObjectsURL(self, xpath, objectType):
+        return self.baseURL + "api/?type=config&action=show&key=" + self.apiKey + "&xpath=" + xpath + "/" + objectType
+    
+    
     ### Methods for reading WebPages ###
-    # This method will return the html of a provided url    
-    def __readWebPage(self, queryPage):
-        try:
-            response = urllib.urlopen(queryPage)
-            html = response.read()
-            return html
-        except httplib.BadStatusLine:
-            pass
+    # This method will return the html of a provided url, the parameters are sent with a POST when given
+    def __readWebPage(self, queryPage, idempotent=False, params=None):
+        return self.__openWebPage(queryPage, idempotent, params, True)
+    
+    # This method will return the response to a provided url as a file-like object (or its content when read is True)
+    # Idempotent requests (show, report, delete) are retried with a jittered exponential backoff when the connection fails,
+    # every request fails fast with a CircuitOpenError while the circuit breaker of the PaloAlto is open.
+    # A response that is not read here can not be retried once its reading has started.
+    # An HTTP 4xx answer (bad key, bad xpath...) is raised right away, it is not a failure of the PaloAlto.
+    def __openWebPage(self, queryPage, idempotent=False, params=None, read=False):
+        postData = None
+        if params:
+            postData = urlencode(params)
+            if not isinstance(postData, bytes):
+                postData = postData.encode('utf-8')
+        attempt = 0
+        while True:
+            if not self.circuitBreaker.allowRequest():
+                raise CircuitOpenError("The PaloAlto at '" + self.baseURL + "' is not responding, request refused by the circuit breaker")
+            recorded = False
+            try:
+                self.requestScheduler.acquire(self.requestPriority, self.requestJob)
+                response = self.__urlopen(quote(queryPage, self.urlSafeChars), postData)
+                compressed = response.info().get('Content-Encoding', "").lower() == "gzip"
+                if read:
+                    response = response.read()
+                    if compressed:
+                        response = GzipReader.decompress(response)
+                elif compressed:
+                    response = GzipReader(response)
+                self.circuitBreaker.recordSuccess()
+                recorded = True
+                return response
+            except (httplib.HTTPException, IOError) as e:
+                if isinstance(e, HTTPError) and e.code < 500:
+                    self.circuitBreaker.recordSuccess()
+                    recorded = True
+                    raise
+                self.circuitBreaker.recordFailure()
+                recorded = True
+                attempt = attempt + 1
+                if not idempotent or not self.retryPolicy.shouldRetry(attempt):
+                    raise
+                sleep(self.retryPolicy.getDelay(attempt))
+            finally:
+                # Any other error (bad gzip data, interrupted...) must not leave a trial request of the breaker running
+                if not recorded:
+                    self.circuitBreaker.releaseTrial()
+    
+    # This method will open a URL, asking for a gzip compressed response when compression is on
+    def __urlopen(self, url, postData):
+        if not self.compression:
+            return urlopen(url, postData)
+        if Request is None:
+            opener = FancyURLopener()
+            opener.addheader('Accept-Encoding', 'gzip')
+            return opener.open(url, postData)
+        return urlopen(Request(url, postData, {'Accept-Encoding': 'gzip'}))
     
     def __getWriteResponseRoot (self, resp):
         import xml.etree.ElementTree as ET
@@ -244,158 +1426,13 @@ class PaAPI:
     
     
     ### Parse XML Methods ###
-    # Return the name of a Rule
-    def __getRuleName(self, root):
-        return root.get('name')
-    
-    # This method will return the 'from' attribute from the PaloAlto API when provided the correct root (see getFireWallRule/getFireWallRulesALL as examples)
-    def __getRuleFrom(self, root):
-        retAttr = []
-        for attrs in root.iter('from'):
-            for attr in attrs:
-                retAttr.append(attr.text)
-        return retAttr
-    
-    # This method will return the 'to' attribute from the PaloAlto API when provided the correct root (see getFireWallRule/getFireWallRulesALL as examples)
-    def __getRuleTo(self, root):
-        retAttr = []
-        for attrs in root.iter('to'):
-            for attr in attrs:
-                retAttr.append(attr.text)
-        return retAttr
-    
-    # This method will return the 'source' attribute from the PaloAlto API when provided the correct root (see getFireWallRule/getFireWallRulesALL as examples)
-    def __getRuleSource(self, root):
-        retAttr = []
-        for attrs in root.iter('source'):
-            for attr in attrs:
-                retAttr.append(attr.text)
-        return retAttr
-        
-    # This method will return the 'destination' attribute from the PaloAlto API when provided the correct root (see getFireWallRule/getFireWallRulesALL as examples)
-    def __getRuleDestination(self, root):
-        retAttr = []
-        for attrs in root.iter('destination'):
-            for attr in attrs:
-                retAttr.append(attr.text)
-        return retAttr
-    
-    # This method will return the 'service' attribute from the PaloAlto API when provided the correct root (see getFireWallRule/getFireWallRulesALL as examples)
-    def __getRuleService(self, root):
-        retAttr = []
-        for attrs in root.iter('service'):
-            for attr in attrs:
-                retAttr.append(attr.text)
-        return retAttr
-    
-    # This method will return the 'application' attribute from the PaloAlto API when provided the correct root (see getFireWallRule/getFireWallRulesALL as examples)
-    def __getRuleApplication(self, root):
-        retAttr = []
-        for attrs in root.iter('application'):
-            for attr in attrs:
-                retAttr.append(attr.text)
-        return retAttr
-    
-    # This method will return the 'action' attribute from the PaloAlto API when provided the correct root (see getFireWallRule/getFireWallRulesALL as examples)
-    def __getRuleAction(self, root):
-        retAttr = ""
-        for attr in root.iter('action'):
-                retAttr = attr.text
-        return retAttr
-        
-    # This method will return the 'source-user' attribute from the PaloAlto API when provided correct root (see getFireWallRule/getFireWallRulesALL as examples)
-    def __getRuleSourceUser(self, root):
-        retAttr = []
-        for attrs in root.iter('source-user'):
-            for attr in attrs:
-                retAttr.append(attr.text)
-        return retAttr
-    
-    # This method will return the 'disable-server-response-inspection' attribute from the PaloAlto when provided correct root (see getFireWallRule/getFireWallRulesALL as examples)
-    def __getRuleDisableServerResponse(self, root):
-        retAttr = ""
-        for attr in root.iter('option'):
-            retAttr = attr[0].text
-        if retAttr:
-            return retAttr
-        else:  
-            return "no"
-    
-    # This method will return the 'negate-source' attribute from the PaloAlto when provided correct root (see getFireWallRule/getFireWallRulesALL as examples)
-    def __getRuleNegateSource(self, root):
-        retAttr = ""
-        for attr in root.iter('negate-source'):
-            retAttr = attr.text
-        if retAttr:
-            return retAttr
-        else:
-            return "no"
-    
-    # This method will return the 'negate-destination' attribute from the PaloAlto when provided correct root (see getFireWallRule/getFireWallRulesALL as examples)
-    def __getRuleNegateDestination(self, root):
-        retAttr = ""
-        for attr in root.iter('negate-destination'):
-            retAttr = attr.text
-        if retAttr:
-            return retAttr
-        else:
-            return "no"
-        
-    # This method will return the 'disabled' attribute from the PaloAlto API when provided the correct root (see getFireWallRule/getFireWallRulesALL as examples)
-    def __getRuleDisabled(self, root):
-        retAttr = ""
-        for attr in root.iter('disabled'):
-            retAttr = attr.text
-        if retAttr:
-            return retAttr
-        else:
-            return "no"
-    
-    # This method will return the 'group' attribute from the PaloAlto API when provided the correct root (see getFireWallRule/getFireWallRulesALL as examples)
-    def __getRuleGroup(self, root):
-        retAttr = []
-        for attrs in root.iter('profile-setting'):
-            for attr in attrs[0]:
-                retAttr.append(attr.text)
-        return retAttr
-    
-    # This method will return the 'hip-profiles' attribute from the PaloAlto API when provided the correct root (see getFireWallRule/getFireWallRulesALL as examples)
-    def __getRuleHipProfile(self, root):
-        retAttr = []
-        for attrs in root.iter('hip-profiles'):
-            for attr in attrs:    
-                retAttr.append(attr.text)
-        return retAttr
-    
-    # This method will return the 'log-start' attribute from the PaloAlto API when provided the correct root (see getFireWallRule/getFireWallRulesALL as examples)
-    def __getRuleLogStart(self, root):
-        retAttr = ""
-        for attr in root.iter('log-start'):
-                retAttr = attr.text
-        if retAttr:
-            return retAttr
-        else:
-            return "no"
-        
-    # This method will return the 'log-end' attribute from the PaloAlto API when provided the correct root (see getFireWallRule/getFireWallRulesALL as examples)
-    def __getRuleLogEnd(self, root):
-        retAttr = ""
-        for attr in root.iter('log-end'):
-                retAttr = attr.text
-        if retAttr:
-            return retAttr
-        else:
-            return "no"   
-    
-    # This method will return the 'description' attribute from the PaloAlto when provided correct root (see getFireWallRule/getFireWallRulesALL as examples)
-    def __getRuleDescription(self, root):
-        retAttr = ""
-        for attr in root.iter('description'):
-            retAttr = attr.text
-        if retAttr:
-            return retAttr
-        else:
-            return ""
+    # This method will return a NatRules object for every entry under root
+    def __parseNatRuleEntries(self, root):
+        return [NatRules.parseEntry(child) for child in root.iter('entry')]
+    
+    # This method will return a PbfRules object for every entry under root
+    def __parsePbfRuleEntries(self, root):
+        return [PbfRules.parseEntry(child) for child in root.iter('entry')]
     
     
     
@@ -409,26 +1446,85 @@ class PaAPI:
         return self.report
     
     def __loadReport(self, reportName):
-        root = self.__getReportRoot(reportName)
-        self.report = []
-        reportAttrs = []
-        reportAttrFields = {}
-        for child in root.iter('entry'):
-            for subchild in child:
-                reportAttrFields[subchild.tag] = subchild.text
-            reportAttrs.append(reportAttrFields)
-        Reports(
-            reportName,
-            reportAttrs
-            )
-    
-    # This method will return the root of the PaloALto report for parsing the XML file provided by getReportXML
-    def __getReportRoot(self, reportName):
-        paReport = self.__getReportXML(reportName)
+        self.report = list(self.singleFlight.do(self.getReportURL(reportName), lambda: list(self.iterReport(reportName))))
+    
+    '''
+    iterReport: will return the entries of a predefined report one at a time while the report is downloaded,
+    only the entry being parsed is kept in memory (generator of Reports objects), the report is requested by the first
+    entry asked for and the response is closed even if the entries are not all read
+    
+        iterReport args:
+            reportName => name of the report (string)
+    '''
+    def iterReport(self, reportName):
+        paReport = self.__openWebPage(self.getReportURL(reportName), True)
+        try:
+            for entry in self.iterReportEntries(reportName, paReport):
+                yield entry
+        finally:
+            paReport.close()
+    
+    '''
+    streamReport: will pass every entry of a predefined report to a function as soon as it is downloaded 
+    and return the number of entries
+    
+        streamReport args:
+            reportName => name of the report (string)
+            sink => function called with every entry, e.g. to write it to a file or a queue (function taking a Reports object)
+    '''
+    def streamReport(self, reportName, sink):
+        count = 0
+        for entry in self.iterReport(reportName):
+            sink(entry)
+            count = count + 1
+        return count
+    
+    '''
+    parseReport: will return a list of Reports objects, one for each entry of a report returned by the PaloAlto
+    
+        parseReport args:
+            reportName => name of the report (string)
+            paReport => response of the PaloAlto to the URL returned by getReportURL or getDynamicReportURL (string)
+    '''
+    def parseReport(self, reportName, paReport):
+        if not isinstance(paReport, bytes):
+            paReport = paReport.encode('utf-8')
+        return list(self.iterReportEntries(reportName, BytesIO(paReport)))
+    
+    '''
+    iterReportEntries: will parse a report incrementally and return its entries one at a time (generator of Reports objects),
+    every entry is thrown away once returned so memory stays bounded whatever the size of the report
+    
+        iterReportEntries args:
+            reportName => name of the report (string)
+            paReport => response of the PaloAlto, closed once parsed (file-like object)
+    '''
+    def iterReportEntries(self, reportName, paReport):
         import xml.etree.ElementTree as ET
-        return ET.fromstring(paReport)
+        try:
+            parents = []
+            for event, elem in ET.iterparse(paReport, events=('start', 'end')):
+                if event == 'start':
+                    parents.append(elem)
+                    continue
+                parents.pop()
+                if elem.tag == 'entry' and not [parent for parent in parents if parent.tag == 'entry']:
+                    reportAttrFields = {}
+                    for subchild in elem:
+                        reportAttrFields[subchild.tag] = subchild.text
+                    if parents:
+                        parents[-1].remove(elem)
+                    yield Reports(reportName, reportAttrFields)
+        finally:
+            paReport.close()
+    
+    '''
+    getReportURL: will return the URL used to read a predefined report, raises a ValueError if the report does not exist
     
-    def __getReportXML(self, reportName):
+        getReportURL args:
+            reportName => name of the predefined report (string)
+    '''
+    def getReportURL(self, reportName):
         reports = [
                    "bandwidth-trend", "botnet", "hruser-top-applications", "hruser-top-threats", "hruser-top-url-categories", 
                    "risk-trend", "risky-users", "spyware-infected-hosts", "threat-trend", "top-application-categories", 
@@ -444,8 +1540,7 @@ class PaAPI:
         
         if reportName in reports:
             url = self.baseURL + "api/?type=report&reporttype=predefined&reportname=" + reportName + "&key=" + self.apiKey
-            paReport = self.__readWebPage(url)
-            return paReport
+            return url
         else:
             repList = ""
             for rep in reports:
@@ -459,27 +1554,68 @@ class PaAPI:
         self.__loadDynamicReport(reportName, period, topN)
         return self.report
     
+    '''
+    recordDynamicReport: will read a dynamic report, append it to a local report store and return it
+    
+        recordDynamicReport args:
+            store => store keeping the pulled reports (ReportStore object)
+            reportName => name of the dynamic report (string)
+            period => period of the report, e.g. 'last-15-minutes' (string)
+            topN => number of entries of the report, '' to use the PaloAlto default (string)
+    '''
+    def recordDynamicReport(self, store, reportName, period, topN):
+        report = self.getDynamicReport(reportName, period, topN)
+        store.append(reportName, period, report)
+        return report
+    
     def __loadDynamicReport(self, reportName, period, topN):
-        root = self.__getDynamicReportRoot(reportName, period, topN)
-        self.report = []
-        reportAttrs = []
-        reportAttrFields = {}
-        for child in root.iter('entry'):
-            for subchild in child:
-                reportAttrFields[subchild.tag] = subchild.text
-            reportAttrs.append(reportAttrFields)
-        Reports(
-            reportName,
-            reportAttrs
-            )
-    
-    # This method will return the root of the PaloALto report for parsing the XML file provided by getReportXML
-    def __getDynamicReportRoot(self, reportName, period, topN):
-        paReport = self.__getDynamicReportXML(reportName, period, topN)
-        import xml.etree.ElementTree as ET
-        return ET.fromstring(paReport)    
+        url = self.getDynamicReportURL(reportName, period, topN)
+        self.report = list(self.singleFlight.do(url, lambda: list(self.iterDynamicReport(reportName, period, topN))))
     
-    def __getDynamicReportXML(self, reportName, period, topN):
+    '''
+    iterDynamicReport: will return the entries of a dynamic report one at a time while the report is downloaded,
+    only the entry being parsed is kept in memory (generator of Reports objects), the report is requested by the first
+    entry asked for and the response is closed even if the entries are not all read
+    
+        iterDynamicReport args:
+            reportName => name of the dynamic report (string)
+            period => period of the report, '' to use the PaloAlto default (string)
+            topN => number of entries of the report, '' to use the PaloAlto default (string)
+    '''
+    def iterDynamicReport(self, reportName, period, topN):
+        paReport = self.__openWebPage(self.getDynamicReportURL(reportName, period, topN), True)
+        try:
+            for entry in self.iterReportEntries(reportName, paReport):
+                yield entry
+        finally:
+            paReport.close()
+    
+    '''
+    streamDynamicReport: will pass every entry of a dynamic report to a function as soon as it is downloaded 
+    and return the number of entries
+    
+        streamDynamicReport args:
+            reportName => name of the dynamic report (string)
+            period => period of the report, '' to use the PaloAlto default (string)
+            topN => number of entries of the report, '' to use the PaloAlto default (string)
+            sink => function called with every entry, e.g. to write it to a file or a queue (function taking a Reports object)
+    '''
+    def streamDynamicReport(self, reportName, period, topN, sink):
+        count = 0
+        for entry in self.iterDynamicReport(reportName, period, topN):
+            sink(entry)
+            count = count + 1
+        return count
+    
+    '''
+    getDynamicReportURL: will return the URL used to read a dynamic report, raises a ValueError if an argument is not valid
+    
+        getDynamicReportURL args:
+            reportName => name of the dynamic report (string)
+            period => period of the report, '' to use the PaloAlto default (string)
+            topN => number of entries of the report, '' to use the PaloAlto default (string)
+    '''
+    def getDynamicReportURL(self, reportName, period, topN):
         reports = [
                    #"custom-dynamic-report",
                    "acc-summary", "top-app-summary", "top-application-categories-summary", "top-application-risk-summary", 
@@ -517,8 +1653,7 @@ class PaAPI:
                 raise ValueError("The topN value must be an integer")
                                 
             url = url + "&key=" + self.apiKey
-            paReport = self.__readWebPage(url)
-            return paReport
+            return url
         else:
             repList = ""
             for rep in reports:
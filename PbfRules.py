@@ -0,0 +1,255 @@
+from BaseRules import *
+class PbfRules(BaseRules):
+    '''
+    This class will be used in the creation of Policy Based Forwarding (PBF) Rule objects, see BaseRules for the
+    attributes every rule has
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+    rulebase = "pbf" # Rulebase holding the rule
+    srcUsr = [] # Rule Source User
+    app = [] # Rule Application
+    srv = [] # Rule Service
+    act = "" # Rule Action ('forward', 'forward-to-vsys', 'discard' or 'no-pbf')
+    egressIf = "" # Rule Egress Interface (forward only)
+    nextHop = "" # Rule Next Hop IP address (forward only)
+    toVsys = "" # Rule Virtual System the traffic is forwarded to (forward-to-vsys only)
+    fromType = "zone" # Rule From members type ('zone' or 'interface')
+    TAGS = [
+            "from", "source", "destination", "source-user", "application", "service", "action", "disabled", "description"
+            ] # Children of a rulebase entry written by the Rule, see ownsChild
+
+    '''
+    Constructor: will create and return a PBF Rule object
+
+        Constructor args:
+            name => name of the rule (string)
+            memFrom => from zones of the rule, or from interfaces (see fromType) (list of strings)
+            src => sources of the rule (list of strings)
+            dst => destination of the rule (list of strings)
+            srcUsr => source users of the rule (list of strings)
+            app => applications of the rule (list of strings)
+            srv => services of the rule (list of strings)
+            act => action of the rule (string => 'forward', 'forward-to-vsys', 'discard' or 'no-pbf')
+            egressIf => interface the traffic is forwarded to, only used with 'forward' (string)
+            nextHop => IP address of the next hop, '' for none, only used with 'forward' (string)
+            disable => disable the rule (string => 'yes' or 'no')
+            desc => description of the rule (string)
+            toVsys => virtual system the traffic is forwarded to, only used with 'forward-to-vsys' (string)
+            fromType => type of the from members of the rule (string => 'zone' or 'interface')
+    '''
+    def __init__(self, name, memFrom, src, dst, srcUsr, app, srv, act, egressIf, nextHop, disable, desc, toVsys="", fromType="zone"):
+        BaseRules.__init__(self, name, memFrom, src, dst, disable, desc)
+        self.setRuleFromType(fromType)
+        self.setRuleSourceUser(srcUsr)
+        self.setRuleApplication(app)
+        self.setRuleService(srv)
+        self.setRuleAction(act, egressIf, nextHop, toVsys)
+
+    '''
+    parseEntry: will return a PBF Rule object built from a rule entry returned by the PaloAlto
+
+        parseEntry args:
+            root => entry of the rule (Element object)
+    '''
+    @staticmethod
+    def parseEntry(root):
+        action = root.find('action')
+        fromType = "interface" if root.find('from/interface') is not None else "zone"
+        return PbfRules(
+                        root.get('name'),
+                        BaseRules.parseMembers(root, 'from/' + fromType),
+                        BaseRules.parseMembers(root, 'source'),
+                        BaseRules.parseMembers(root, 'destination'),
+                        BaseRules.parseMembers(root, 'source-user'),
+                        BaseRules.parseMembers(root, 'application'),
+                        BaseRules.parseMembers(root, 'service'),
+                        action[0].tag if action is not None and len(action) else "no-pbf",
+                        BaseRules.parseText(root, 'action/forward/egress-interface', ""),
+                        BaseRules.parseText(root, 'action/forward/nexthop/ip-address', ""),
+                        BaseRules.parseText(root, 'disabled', "no"),
+                        BaseRules.parseText(root, 'description', ""),
+                        BaseRules.parseText(root, 'action/forward-to-vsys', ""),
+                        fromType
+                        )
+
+
+    ### Generate Methods ###
+    '''
+    genRuleMembersXML: will return an XML string version of every attribute of the Rule (the content of its entry)
+    '''
+    def genRuleMembersXML(self):
+        retStr = self.genRuleFromMembersXML()
+        retStr = retStr + self.genRuleSourceXML()
+        retStr = retStr + self.genRuleDestinationXML()
+        retStr = retStr + self.genRuleSourceUserXML()
+        retStr = retStr + self.genRuleApplicationXML()
+        retStr = retStr + self.genRuleServiceXML()
+        retStr = retStr + self.genRuleActionXML()
+        retStr = retStr + self.genRuleDisabledXML()
+        retStr = retStr + self.genRuleDescriptionXML()
+        return retStr
+
+    '''
+    genRuleFromMembersXML: will return an XML string version of the Rule's 'from' zones or interfaces (if any exist)
+    '''
+    def genRuleFromMembersXML(self):
+        if self.memFrom:
+            return "<from>" + self.genMembersXML(self.fromType, self.memFrom) + "</from>"
+        else:
+            return ""
+
+    '''
+    genRuleSourceUserXML: will return an XML string version of the Rule's source users (if any exist)
+    '''
+    def genRuleSourceUserXML(self):
+        return self.genMembersXML("source-user", self.srcUsr)
+
+    '''
+    genRuleApplicationXML: will return an XML string version of the Rule's applications (if any exist)
+    '''
+    def genRuleApplicationXML(self):
+        return self.genMembersXML("application", self.app)
+
+    '''
+    genRuleServiceXML: will return an XML string version of the Rule's services (if any exist)
+    '''
+    def genRuleServiceXML(self):
+        return self.genMembersXML("service", self.srv)
+
+    '''
+    genRuleActionXML: will return an XML string version of the Rule's action
+    '''
+    def genRuleActionXML(self):
+        if self.act == "forward":
+            retStr = "<action><forward><egress-interface>" + self.egressIf + "</egress-interface>"
+            if self.nextHop:
+                retStr = retStr + "<nexthop><ip-address>" + self.nextHop + "</ip-address></nexthop>"
+            retStr = retStr + "</forward></action>"
+            return retStr
+        elif self.act == "forward-to-vsys":
+            return "<action><forward-to-vsys>" + self.toVsys + "</forward-to-vsys></action>"
+        else:
+            return "<action><" + self.act + "/></action>"
+
+
+    ### Get Methods ###
+    '''
+    getRuleSourceUser: will return a list of the Rule's source users
+    '''
+    def getRuleSourceUser(self):
+        return self.srcUsr
+
+    '''
+    getRuleApplication: will return a list of the Rule's applications
+    '''
+    def getRuleApplication(self):
+        return self.app
+
+    '''
+    getRuleService: will return a list of the Rule's services
+    '''
+    def getRuleService(self):
+        return self.srv
+
+    '''
+    getRuleAction: will return the Rule's action
+    '''
+    def getRuleAction(self):
+        return self.act
+
+    '''
+    getRuleEgressInterface: will return the interface the Rule forwards the traffic to
+    '''
+    def getRuleEgressInterface(self):
+        return self.egressIf
+
+    '''
+    getRuleNextHop: will return the IP address of the Rule's next hop
+    '''
+    def getRuleNextHop(self):
+        return self.nextHop
+
+    '''
+    getRuleToVsys: will return the virtual system the Rule forwards the traffic to
+    '''
+    def getRuleToVsys(self):
+        return self.toVsys
+
+    '''
+    getRuleFromType: will return the type of the Rule's from members ('zone' or 'interface')
+    '''
+    def getRuleFromType(self):
+        return self.fromType
+
+
+    ### Set Methods ###
+    '''
+    setRuleFromType: will set the type of the Rule's from members
+
+        setRuleFromType args:
+            fromType => type of the from members of the rule (string => 'zone' or 'interface')
+    '''
+    def setRuleFromType(self, fromType):
+        self.checkString(fromType)
+        if fromType not in ("zone", "interface"):
+            raise ValueError("Value must be 'zone' or 'interface'")
+        self.fromType = fromType
+
+    '''
+    setRuleSourceUser: will set the Rule's source users
+
+        setRuleSourceUser args:
+            srcUsr => source users of the rule (list of strings)
+    '''
+    def setRuleSourceUser(self, srcUsr):
+        self.checkList(srcUsr)
+        self.srcUsr = srcUsr
+
+    '''
+    setRuleApplication: will set the Rule's applications
+
+        setRuleApplication args:
+            app => applications of the rule (list of strings)
+    '''
+    def setRuleApplication(self, app):
+        self.checkList(app)
+        self.app = app
+
+    '''
+    setRuleService: will set the Rule's services
+
+        setRuleService args:
+            srv => services of the rule (list of strings)
+    '''
+    def setRuleService(self, srv):
+        self.checkList(srv)
+        self.srv = srv
+
+    '''
+    setRuleAction: will set the Rule's action
+
+        setRuleAction args:
+            act => action of the rule (string => 'forward', 'forward-to-vsys', 'discard' or 'no-pbf')
+            egressIf => interface the traffic is forwarded to, only used with 'forward' (string)
+            nextHop => IP address of the next hop, '' for none, only used with 'forward' (string)
+            toVsys => virtual system the traffic is forwarded to, only used with 'forward-to-vsys' (string)
+    '''
+    def setRuleAction(self, act, egressIf="", nextHop="", toVsys=""):
+        self.checkString(act)
+        if act not in ("forward", "forward-to-vsys", "discard", "no-pbf"):
+            raise ValueError("Value must be 'forward', 'forward-to-vsys', 'discard' or 'no-pbf'")
+        self.checkString(egressIf)
+        self.checkString(nextHop)
+        self.checkString(toVsys)
+        if act == "forward" and not egressIf:
+            raise ValueError("An egress interface is needed to forward the traffic")
+        if act == "forward-to-vsys" and not toVsys:
+            raise ValueError("A virtual system is needed to forward the traffic to")
+        self.act = act
+        self.egressIf = egressIf
+        self.nextHop = nextHop
+        self.toVsys = toVsys
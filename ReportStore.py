@@ -0,0 +1,259 @@
+import sqlite3
+import time
+class ReportStore:
+    '''
+    This class will be used to keep the reports pulled from the PaloAlto in a local sqlite database
+
+    Every pull is appended as timestamped samples: one sample per measure field (bytes, sessions...) of every report
+    entry.  The other fields of an entry (application, user, zone, port...) are its dimensions, even when they hold
+    numbers.  The measure fields of a report are given by setMeasures, DEFAULT_MEASURES is used for the other reports,
+    and every field stored for a report is saved with whether it is a measure (see getStoredFields).  Strings are stored
+    once in a dictionary table and samples only hold their numbers, so a pull repeating the same applications costs a
+    few integers per row.
+
+    Samples start at resolution 0 (one per pull), downsample merges the old ones into buckets of a coarser resolution
+    so the database stays small while long term trends can still be read back with query.
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    AGGREGATES = {"sum": "SUM", "avg": "AVG", "max": "MAX", "min": "MIN"} # Ways samples can be merged by downsample
+
+    # Fields counted by the PaloAlto reports, used for the reports without measures of their own
+    DEFAULT_MEASURES = ["bytes", "sessions", "count", "packets", "hits", "nbytes", "nsess", "nthreats", "npkts", "repeatcnt"]
+
+    path = "" # Name of the database file
+    measures = {} # report name => measure fields of the report
+    strings = {} # Cache of the dictionary table: string => number
+
+    '''
+    Constructor: will open (and create if needed) a report store
+
+        Constructor args:
+            path => name of the database file, ':memory:' for a store that is not saved (string)
+    '''
+    def __init__(self, path):
+        self.path = path
+        self.strings = {}
+        self.measures = {}
+        self.db = sqlite3.connect(path)
+        self.db.execute("CREATE TABLE IF NOT EXISTS strings (id INTEGER PRIMARY KEY, value TEXT UNIQUE NOT NULL)")
+        self.db.execute("CREATE TABLE IF NOT EXISTS dimensions (id INTEGER PRIMARY KEY, key TEXT UNIQUE NOT NULL)")
+        self.db.execute(
+                "CREATE TABLE IF NOT EXISTS samples (time INTEGER NOT NULL, resolution INTEGER NOT NULL, report INTEGER NOT NULL, "
+                "period INTEGER NOT NULL, dimension INTEGER NOT NULL, field INTEGER NOT NULL, value REAL NOT NULL)"
+                )
+        self.db.execute("CREATE INDEX IF NOT EXISTS samplesByReport ON samples (report, period, time)")
+        self.db.execute(
+                "CREATE TABLE IF NOT EXISTS fields (report INTEGER NOT NULL, field INTEGER NOT NULL, measure INTEGER NOT NULL, "
+                "PRIMARY KEY (report, field))"
+                )
+        self.db.commit()
+        for row in self.db.execute("SELECT value, id FROM strings"):
+            self.strings[row[0]] = row[1]
+
+    '''
+    setMeasures: will set the measure fields of a report, the other fields of its entries are dimensions
+
+        setMeasures args:
+            reportName => name of the report (string)
+            fields => names of the measure fields (list of strings)
+    '''
+    def setMeasures(self, reportName, fields):
+        if type(fields) is not list:
+            raise TypeError("Type must be a list")
+        self.measures[reportName] = list(fields)
+
+    '''
+    getMeasures: will return the measure fields of a report
+
+        getMeasures args:
+            reportName => name of the report (string)
+    '''
+    def getMeasures(self, reportName):
+        return self.measures.get(reportName, self.DEFAULT_MEASURES)
+
+    '''
+    close: will close the database
+    '''
+    def close(self):
+        self.db.close()
+
+    ### Methods for adding samples ###
+    '''
+    append: will add a pulled report to the store, returns the number of samples added
+
+        append args:
+            reportName => name of the report (string)
+            period => period of the report, e.g. 'last-15-minutes' (string)
+            entries => entries of the report, as returned by getReport or getDynamicReport (list of Reports objects)
+            timestamp => when the report was pulled (seconds since the epoch), now when not given (int)
+    '''
+    def append(self, reportName, period, entries, timestamp=None):
+        if timestamp is None:
+            timestamp = time.time()
+        rows = []
+        report = self.__getStringNumber(reportName)
+        periodNumber = self.__getStringNumber(period)
+        measureFields = set(self.getMeasures(reportName))
+        fields = set()
+        for entry in entries:
+            dimensions = []
+            measures = []
+            for field, value in sorted(entry.getFields().items()):
+                fields.add(field)
+                if field not in measureFields:
+                    # An empty field (e.g. <user/>) is a dimension without a value
+                    dimensions.append((field, value if value is not None else ""))
+                else:
+                    number = self.__getNumber(value)
+                    if number is not None:
+                        measures.append((field, number))
+            dimension = self.__getDimensionNumber(dimensions)
+            for measure in measures:
+                rows.append((int(timestamp), 0, report, periodNumber, dimension, self.__getStringNumber(measure[0]), measure[1]))
+        self.db.executemany("INSERT INTO samples VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        # The last pull tells what the fields are, setMeasures may have changed since the first one
+        self.db.executemany(
+                "INSERT OR REPLACE INTO fields VALUES (?, ?, ?)",
+                [(report, self.__getStringNumber(field), 1 if field in measureFields else 0) for field in sorted(fields)]
+                )
+        self.db.commit()
+        return len(rows)
+
+    '''
+    downsample: will merge the samples older than a given age into buckets of a coarser resolution, returns the number of samples removed
+
+        downsample args:
+            olderThan => age (in seconds) of the samples to merge (int)
+            resolution => size (in seconds) of the buckets, e.g. 3600 for hourly samples (int)
+            aggregate => how the samples of a bucket are merged (string => 'sum', 'avg', 'max' or 'min')
+            now => current time (seconds since the epoch), now when not given (int)
+    '''
+    def downsample(self, olderThan, resolution, aggregate="sum", now=None):
+        if aggregate not in self.AGGREGATES:
+            raise ValueError("Value must be 'sum', 'avg', 'max' or 'min'")
+        if resolution <= 0:
+            raise ValueError("The resolution must be at least one second")
+        if now is None:
+            now = time.time()
+        # Only whole buckets are merged, a bucket still receiving samples would be merged twice
+        cutoff = (int(now - olderThan) // resolution) * resolution
+        where = "WHERE time < ? AND resolution < ?"
+        before = self.db.execute("SELECT COUNT(*) FROM samples " + where, (cutoff, resolution)).fetchone()[0]
+        merged = self.db.execute(
+                "INSERT INTO samples SELECT (time / ?) * ?, ?, report, period, dimension, field, " + self.AGGREGATES[aggregate] + "(value) "
+                "FROM samples " + where + " GROUP BY time / ?, report, period, dimension, field",
+                (resolution, resolution, resolution, cutoff, resolution, resolution)
+                )
+        self.db.execute("DELETE FROM samples " + where, (cutoff, resolution))
+        self.db.commit()
+        return before - merged.rowcount
+
+    ### Methods for reading samples ###
+    '''
+    query: will return the samples of a report between two times as (time, resolution, dimensions, field, value) tuples sorted by time,
+    dimensions is a dictionary of the fields of the report entry that are not measures
+
+        query args:
+            reportName => name of the report (string)
+            period => period of the report (string)
+            start => first time to return (seconds since the epoch), the oldest sample when not given (int)
+            end => time after the last time to return (seconds since the epoch), the newest sample when not given (int)
+            field => only return the samples of this measure field, every field when not given (string)
+    '''
+    def query(self, reportName, period, start=None, end=None, field=None):
+        if reportName not in self.strings or period not in self.strings:
+            return []
+        sql = "SELECT time, resolution, dimension, field, value FROM samples WHERE report = ? AND period = ?"
+        args = [self.strings[reportName], self.strings[period]]
+        if start is not None:
+            sql = sql + " AND time >= ?"
+            args.append(int(start))
+        if end is not None:
+            sql = sql + " AND time < ?"
+            args.append(int(end))
+        if field is not None:
+            if field not in self.strings:
+                return []
+            sql = sql + " AND field = ?"
+            args.append(self.strings[field])
+        rows = self.db.execute(sql + " ORDER BY time, dimension, field", args).fetchall()
+
+        names = self.__getStrings()
+        dimensions = {}
+        samples = []
+        for row in rows:
+            if row[2] not in dimensions:
+                dimensions[row[2]] = self.__getDimensions(row[2], names)
+            samples.append((row[0], row[1], dict(dimensions[row[2]]), names[row[3]], row[4]))
+        return samples
+
+    '''
+    getReportNames: will return the names of the stored reports as (report name, period) tuples
+    '''
+    def getReportNames(self):
+        names = self.__getStrings()
+        return sorted([(names[row[0]], names[row[1]]) for row in self.db.execute("SELECT DISTINCT report, period FROM samples")])
+
+    '''
+    getStoredFields: will return the fields stored for a report as a dictionary field name => True for a measure field,
+    False for a dimension (key) field
+
+        getStoredFields args:
+            reportName => name of the report (string)
+    '''
+    def getStoredFields(self, reportName):
+        if reportName not in self.strings:
+            return {}
+        names = self.__getStrings()
+        rows = self.db.execute("SELECT field, measure FROM fields WHERE report = ?", (self.strings[reportName],))
+        return dict([(names[row[0]], row[1] == 1) for row in rows])
+
+    '''
+    getSampleCount: will return the number of stored samples
+    '''
+    def getSampleCount(self):
+        return self.db.execute("SELECT COUNT(*) FROM samples").fetchone()[0]
+
+    # This method will return the number of a string, adding it to the dictionary table the first time it is seen
+    def __getStringNumber(self, value):
+        if value not in self.strings:
+            cursor = self.db.execute("INSERT INTO strings (value) VALUES (?)", (value,))
+            self.strings[value] = cursor.lastrowid
+        return self.strings[value]
+
+    # This method will return the number of a set of (field, value) dimensions, adding it the first time it is seen
+    def __getDimensionNumber(self, dimensions):
+        key = ",".join([str(self.__getStringNumber(field)) + "=" + str(self.__getStringNumber(value)) for field, value in dimensions])
+        row = self.db.execute("SELECT id FROM dimensions WHERE key = ?", (key,)).fetchone()
+        if row:
+            return row[0]
+        return self.db.execute("INSERT INTO dimensions (key) VALUES (?)", (key,)).lastrowid
+
+    # This method will return the (field, value) dimensions of a dimension number
+    def __getDimensions(self, dimension, names):
+        key = self.db.execute("SELECT key FROM dimensions WHERE id = ?", (dimension,)).fetchone()[0]
+        dimensions = []
+        for pair in key.split(","):
+            if pair:
+                field, value = pair.split("=")
+                dimensions.append((names[int(field)], names[int(value)]))
+        return dimensions
+
+    # This method will return the dictionary table as number => string
+    def __getStrings(self):
+        names = {}
+        for value in self.strings:
+            names[self.strings[value]] = value
+        return names
+
+    # This method will return the value of a measure field, or None when it is empty or not a number
+    def __getNumber(self, value):
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
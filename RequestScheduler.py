@@ -0,0 +1,141 @@
+from collections import OrderedDict, deque
+import threading
+import time
+class RequestScheduler:
+    '''
+    This class will be used to pace the requests sent to a PaloAlto so bulk jobs can not starve interactive calls
+    or trip the API throttling of the PaloAlto
+
+    Requests take a token from a token bucket refilled with 'rate' tokens per second and holding at most 'burst'
+    tokens.  When requests have to wait for a token, interactive requests always go before bulk requests, and
+    within a priority the jobs take turns (one request each) so a job sending many requests does not delay the others.
+    A rate of 0 turns the pacing off, the requests are still counted.
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    PRIORITIES = ["interactive", "bulk"] # Priorities of the requests, highest first
+
+    rate = 0.0 # Tokens added to the bucket every second, 0 for no pacing
+    burst = 10 # Upper bound of the tokens in the bucket
+    tokens = 0.0 # Tokens in the bucket
+    updated = 0.0 # When the bucket was last refilled
+    queues = {} # priority => job => waiting requests (deque of tickets), jobs in the order of their turn
+    metrics = {} # priority => requests, total wait and longest wait (dictionary)
+
+    '''
+    Constructor: will create and return a RequestScheduler object
+
+        Constructor args:
+            rate => tokens (requests) added to the bucket every second, 0 for no pacing (float)
+            burst => upper bound of the tokens in the bucket, the number of requests that can be sent at once (int)
+    '''
+    def __init__(self, rate=0.0, burst=10):
+        if type(burst) is not int:
+            raise TypeError("Type must be an int")
+        if rate < 0:
+            raise ValueError("Value must be 0 or greater")
+        if burst < 1:
+            raise ValueError("Value must be 1 or greater")
+        self.rate = float(rate)
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.time()
+        self.queues = {}
+        self.metrics = {}
+        for priority in self.PRIORITIES:
+            self.queues[priority] = OrderedDict()
+            self.metrics[priority] = {"requests": 0, "totalWait": 0.0, "maxWait": 0.0}
+        self.tickets = 0
+        self.condition = threading.Condition()
+
+    '''
+    acquire: will wait until a request may be sent to the PaloAlto
+
+        acquire args:
+            priority => priority of the request (string => 'interactive' or 'bulk')
+            job => name of the job sending the request, jobs of the same priority take turns (string)
+    '''
+    def acquire(self, priority="interactive", job=None):
+        if priority not in self.queues:
+            raise ValueError("Value must be 'interactive' or 'bulk'")
+        start = time.time()
+        with self.condition:
+            if self.rate > 0:
+                self.tickets = self.tickets + 1
+                ticket = self.tickets
+                self.queues[priority].setdefault(job, deque()).append(ticket)
+                try:
+                    while True:
+                        if self.__getNextTicket() == ticket:
+                            self.__refill()
+                            if self.tokens >= 1:
+                                self.tokens = self.tokens - 1
+                                break
+                            self.condition.wait((1 - self.tokens) / self.rate)
+                        else:
+                            self.condition.wait()
+                finally:
+                    self.__removeTicket(priority, job, ticket)
+                    self.condition.notify_all()
+            wait = time.time() - start
+            metrics = self.metrics[priority]
+            metrics["requests"] = metrics["requests"] + 1
+            metrics["totalWait"] = metrics["totalWait"] + wait
+            metrics["maxWait"] = max(metrics["maxWait"], wait)
+
+    ### Get Methods ###
+    '''
+    getQueueDepth: will return the number of requests waiting for a token
+
+        getQueueDepth args:
+            priority => only count the requests of this priority, every request when not given (string)
+    '''
+    def getQueueDepth(self, priority=None):
+        with self.condition:
+            depth = 0
+            for queuePriority in self.queues:
+                if priority is None or queuePriority == priority:
+                    for job in self.queues[queuePriority]:
+                        depth = depth + len(self.queues[queuePriority][job])
+            return depth
+
+    '''
+    getMetrics: will return the metrics of every priority:
+    priority => {'waiting', 'requests', 'averageWait', 'maxWait'} (waits in seconds) (dictionary)
+    '''
+    def getMetrics(self):
+        with self.condition:
+            metrics = {}
+            for priority in self.PRIORITIES:
+                requests = self.metrics[priority]["requests"]
+                metrics[priority] = {
+                                     "waiting": sum([len(tickets) for tickets in self.queues[priority].values()]),
+                                     "requests": requests,
+                                     "averageWait": self.metrics[priority]["totalWait"] / requests if requests else 0.0,
+                                     "maxWait": self.metrics[priority]["maxWait"]
+                                     }
+            return metrics
+
+    # This method will return the ticket of the request whose turn it is
+    def __getNextTicket(self):
+        for priority in self.PRIORITIES:
+            for job in self.queues[priority]:
+                return self.queues[priority][job][0]
+        return None
+
+    # This method will remove a ticket from its queue, the job of the ticket goes to the end of the turns
+    def __removeTicket(self, priority, job, ticket):
+        tickets = self.queues[priority].pop(job)
+        tickets.remove(ticket)
+        if tickets:
+            self.queues[priority][job] = tickets
+
+    # This method will add the tokens earned since the last refill
+    def __refill(self):
+        now = time.time()
+        self.tokens = min(float(self.burst), self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
@@ -0,0 +1,164 @@
+import random
+import threading
+import time
+class RetryPolicy:
+    '''
+    This class will be used to decide how often and how long to wait before retrying a failed PaloAlto API call
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    retries = 3 # Number of retries after the first failed attempt
+    backoff = 1.0 # Base delay in seconds before the first retry
+    maxBackoff = 30.0 # Upper bound of the delay in seconds between two retries
+
+    '''
+    Constructor: will create and return a RetryPolicy object
+
+        Constructor args:
+            retries => number of retries after the first failed attempt (int)
+            backoff => base delay in seconds, doubled on every retry (float)
+            maxBackoff => upper bound of the delay in seconds (float)
+    '''
+    def __init__(self, retries=3, backoff=1.0, maxBackoff=30.0):
+        if type(retries) is not int:
+            raise TypeError("Type must be an int")
+        if retries < 0:
+            raise ValueError("Value must be 0 or greater")
+        if backoff < 0 or maxBackoff < 0:
+            raise ValueError("Value must be 0 or greater")
+        self.retries = retries
+        self.backoff = float(backoff)
+        self.maxBackoff = float(maxBackoff)
+
+    '''
+    shouldRetry: will return True if another attempt is allowed after the given number of failed attempts
+
+        shouldRetry args:
+            attempt => number of attempts that have already failed (int)
+    '''
+    def shouldRetry(self, attempt):
+        return attempt <= self.retries
+
+    '''
+    getDelay: will return how many seconds to wait before the next attempt
+
+    The delay grows exponentially with the attempt number and is jittered over the whole interval ("full jitter")
+    so that many clients that failed at the same moment do not all retry at the same moment.
+
+        getDelay args:
+            attempt => number of attempts that have already failed (int)
+    '''
+    def getDelay(self, attempt):
+        ceiling = min(self.maxBackoff, self.backoff * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+
+class CircuitOpenError(IOError):
+    '''
+    This exception is raised when a request is refused because the circuit breaker of the PaloAlto is open
+    '''
+
+
+class CircuitBreaker:
+    '''
+    This class will be used to stop sending requests to a PaloAlto that keeps failing
+
+    After 'threshold' consecutive failures the breaker opens and every request fails fast.  Once 'resetTimeout'
+    seconds have passed a single trial request is let through (half-open); its success closes the breaker again,
+    its failure re-opens it for another 'resetTimeout' seconds.  A trial whose outcome is never recorded (it failed
+    for another reason, see releaseTrial) does not hold the breaker half-open: after 'resetTimeout' seconds another
+    trial request is let through.
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    threshold = 5 # Consecutive failures before the breaker opens
+    resetTimeout = 30.0 # Seconds the breaker stays open before a trial request is allowed
+    state = CLOSED
+    failures = 0
+    openedAt = 0.0
+    trialStartedAt = 0.0 # When the trial request of the half-open breaker was let through
+
+    '''
+    Constructor: will create and return a CircuitBreaker object
+
+        Constructor args:
+            threshold => consecutive failures before the breaker opens (int)
+            resetTimeout => seconds to wait before letting a trial request through (float)
+    '''
+    def __init__(self, threshold=5, resetTimeout=30.0):
+        if type(threshold) is not int:
+            raise TypeError("Type must be an int")
+        if threshold < 1:
+            raise ValueError("Value must be 1 or greater")
+        self.threshold = threshold
+        self.resetTimeout = float(resetTimeout)
+        self.state = self.CLOSED
+        self.failures = 0
+        self.openedAt = 0.0
+        self.trialRunning = False
+        self.trialStartedAt = 0.0
+        self.lock = threading.Lock()
+
+    '''
+    allowRequest: will return True if a request may be sent to the PaloAlto
+    '''
+    def allowRequest(self):
+        with self.lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.time() - self.openedAt >= self.resetTimeout:
+                self.state = self.HALF_OPEN
+                self.trialRunning = False
+            if self.state == self.HALF_OPEN and self.trialRunning and time.time() - self.trialStartedAt >= self.resetTimeout:
+                self.trialRunning = False
+            if self.state == self.HALF_OPEN and not self.trialRunning:
+                self.trialRunning = True
+                self.trialStartedAt = time.time()
+                return True
+            return False
+
+    '''
+    recordSuccess: will close the breaker after a successful request
+    '''
+    def recordSuccess(self):
+        with self.lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self.trialRunning = False
+
+    '''
+    recordFailure: will count a failed request and open the breaker when the threshold is reached
+    '''
+    def recordFailure(self):
+        with self.lock:
+            self.failures = self.failures + 1
+            if self.state == self.HALF_OPEN or self.failures >= self.threshold:
+                self.state = self.OPEN
+                self.openedAt = time.time()
+                self.trialRunning = False
+
+    '''
+    releaseTrial: will let another trial request through when the trial request ended without its outcome being
+    recorded (e.g. it was cancelled or its response could not be parsed)
+    '''
+    def releaseTrial(self):
+        with self.lock:
+            self.trialRunning = False
+
+    '''
+    getState: will return the state of the breaker ('closed', 'open' or 'half-open')
+    '''
+    def getState(self):
+        return self.state
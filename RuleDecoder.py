@@ -0,0 +1,148 @@
+from Rules import *
+import multiprocessing
+import re
+import xml.etree.ElementTree as ET
+class RuleDecoder:
+    '''
+    This class will be used to decode very big rulebases (the XML of the firewall rules) on every core of the computer
+
+    The XML is split at the <entry> boundaries into chunks of chunkSize rules without being parsed, every chunk is
+    decoded by a process of a multiprocessing pool and sent back as records: tuples holding the arguments of the Rules
+    constructor, in order.  Records are small and can be pickled, the Rule objects are only built once the records
+    of every chunk are back in rulebase order.
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    ENTRY = re.compile(br"<entry[\s>/]|</entry>") # Start and end of the entry elements
+
+    processes = None # Number of processes decoding the chunks, the number of cores when None
+    chunkSize = 1000 # Number of rules decoded by a process at a time
+
+    '''
+    Constructor: will create and return a RuleDecoder object
+
+        Constructor args:
+            processes => number of processes decoding the chunks, the number of cores when not given (int)
+            chunkSize => number of rules decoded by a process at a time (int)
+    '''
+    def __init__(self, processes=None, chunkSize=1000):
+        if processes is not None and processes < 1:
+            raise ValueError("At least one process is needed")
+        if chunkSize < 1:
+            raise ValueError("The chunk size must be at least 1")
+        self.processes = processes
+        self.chunkSize = chunkSize
+
+    ### Methods for decoding rulebases ###
+    '''
+    decodeRules: will return the rules of a rulebase as a list of Rule objects, in rulebase order
+
+        decodeRules args:
+            paRules => rulebase XML, as returned by the PaloAlto to PaAPI.getFireWallRulesURL (string)
+    '''
+    def decodeRules(self, paRules):
+        return [Rules(*record) for record in self.decodeRecords(paRules)]
+
+    '''
+    decodeRecords: will return the records of the rules of a rulebase (list of tuples), see the class description
+
+        decodeRecords args:
+            paRules => rulebase XML, as returned by the PaloAlto to PaAPI.getFireWallRulesURL (string)
+    '''
+    def decodeRecords(self, paRules):
+        records = []
+        for chunk in self.__decodeChunks(self.splitEntries(paRules)):
+            records.extend(chunk)
+        return records
+
+    '''
+    decodeFiles: will decode several saved rulebases at once, the chunks of every file share the same pool,
+    returns a list of rules (list of Rule objects) per file
+
+        decodeFiles args:
+            paths => names of the files holding the rulebase XML (list of strings)
+    '''
+    def decodeFiles(self, paths):
+        chunks = []
+        counts = []
+        for path in paths:
+            ruleFile = open(path, 'rb')
+            try:
+                fileChunks = self.splitEntries(ruleFile.read())
+            finally:
+                ruleFile.close()
+            chunks.extend(fileChunks)
+            counts.append(len(fileChunks))
+
+        decoded = self.__decodeChunks(chunks)
+        rulebases = []
+        first = 0
+        for count in counts:
+            rulebases.append([Rules(*record) for chunk in decoded[first:first + count] for record in chunk])
+            first = first + count
+        return rulebases
+
+    '''
+    splitEntries: will split a rulebase XML into chunks of at most chunkSize top level entries, every chunk is a
+    small XML document (bytes) that can be decoded on its own, see decodeChunk
+
+        splitEntries args:
+            paRules => rulebase XML (string)
+    '''
+    def splitEntries(self, paRules):
+        if not isinstance(paRules, bytes):
+            paRules = paRules.encode('utf-8')
+        chunks = []
+        entries = []
+        depth = 0
+        start = 0
+        for match in self.ENTRY.finditer(paRules):
+            if match.group(0) == b"</entry>":
+                depth = depth - 1
+                end = match.end()
+            else:
+                if depth == 0:
+                    start = match.start()
+                # An entry holding only attributes (<entry name='a'/>) is closed by its own tag
+                tagEnd = paRules.index(b">", match.start())
+                if paRules[tagEnd - 1:tagEnd] != b"/":
+                    depth = depth + 1
+                    continue
+                end = tagEnd + 1
+            if depth == 0:
+                entries.append(paRules[start:end])
+                if len(entries) == self.chunkSize:
+                    chunks.append(b"<rules>" + b"".join(entries) + b"</rules>")
+                    entries = []
+        if entries:
+            chunks.append(b"<rules>" + b"".join(entries) + b"</rules>")
+        return chunks
+
+    '''
+    decodeChunk: will return the records of every entry of a chunk (list of tuples), see Rules.parseRecord
+
+        decodeChunk args:
+            chunk => XML holding rulebase entries, see splitEntries (bytes)
+    '''
+    @staticmethod
+    def decodeChunk(chunk):
+        return [Rules.parseRecord(entry) for entry in ET.fromstring(chunk).iter('entry')]
+
+    # This method will return the records of every chunk, in order, using a process pool when there is more than one chunk
+    def __decodeChunks(self, chunks):
+        if len(chunks) < 2 or self.processes == 1:
+            return [RuleDecoder.decodeChunk(chunk) for chunk in chunks]
+        pool = multiprocessing.Pool(self.processes)
+        try:
+            return pool.map(decodeRuleChunk, chunks)
+        finally:
+            pool.close()
+            pool.join()
+
+# This function is what the processes of the pool run, it has to be a module level function to be sent to them
+def decodeRuleChunk(chunk):
+    return RuleDecoder.decodeChunk(chunk)
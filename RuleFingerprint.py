@@ -0,0 +1,108 @@
+import hashlib
+class RuleFingerprint:
+    '''
+    This class will be used to find which parts of a rulebase changed without comparing every rule
+
+    Every rule position gets a leaf hash, fanout leaves are hashed together into a node covering their position range,
+    fanout nodes into a node covering a bigger range, and so on up to a single root hash.  Two fingerprints with the
+    same root cover the same rulebase, otherwise only the nodes whose hashes differ are compared further, so finding
+    a few changed rules among thousands only looks at a few hundred hashes.
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    fanout = 16 # Number of children of every node
+    levels = [] # levels[0] => leaf hashes, levels[-1] => [root hash]
+
+    '''
+    Constructor: will create and return the fingerprint of a list of values, one per rule position
+
+        Constructor args:
+            values => value of every rule position, see hashRule (list of strings)
+            fanout => number of children of every node (int)
+    '''
+    def __init__(self, values, fanout=16):
+        if type(values) is not list:
+            raise TypeError("Type must be a list")
+        if fanout < 2:
+            raise ValueError("The fanout must be at least 2")
+        self.fanout = fanout
+        self.levels = [[self.__hash(value) for value in values]]
+        while len(self.levels[-1]) > 1:
+            level = self.levels[-1]
+            self.levels.append([self.__hash(b"".join(level[start:start + fanout])) for start in range(0, len(level), fanout)])
+
+    '''
+    hashRule: will return the value representing the whole content of a rule (its XML)
+
+        hashRule args:
+            rule => rule to fingerprint (rule object)
+    '''
+    @staticmethod
+    def hashRule(rule):
+        return rule.genRuleXML()
+
+    ### Get Methods ###
+    '''
+    getRoot: will return the hash covering every rule position, None when there is no rule
+    '''
+    def getRoot(self):
+        if not self.levels[-1]:
+            return None
+        return self.levels[-1][0]
+
+    '''
+    getRuleCount: will return the number of rule positions
+    '''
+    def getRuleCount(self):
+        return len(self.levels[0])
+
+    '''
+    getChangedRanges: will return the position ranges of another fingerprint that differ from this one
+    as (first, last) tuples, positions start at 0 and both ends are included (neighbouring ranges are merged)
+
+        getChangedRanges args:
+            other => newer fingerprint of the same rulebase (RuleFingerprint object)
+    '''
+    def getChangedRanges(self, other):
+        if other.fanout != self.fanout:
+            raise ValueError("Fingerprints with different fanouts can not be compared")
+        ranges = []
+        if not other.getRuleCount():
+            return ranges
+        height = max(len(self.levels), len(other.levels))
+        pending = [(height - 1, 0)]
+        while pending:
+            level, index = pending.pop()
+            first = index * self.fanout ** level
+            if first >= other.getRuleCount():
+                continue
+            if self.__getNode(level, index) == other.__getNode(level, index) and self.__getNode(level, index) is not None:
+                continue
+            if level == 0:
+                if ranges and ranges[-1][1] == first - 1:
+                    ranges[-1] = (ranges[-1][0], first)
+                else:
+                    ranges.append((first, first))
+                continue
+            # Children are pushed last to first so positions come out in order
+            for child in range(index * self.fanout + self.fanout - 1, index * self.fanout - 1, -1):
+                pending.append((level - 1, child))
+        return ranges
+
+    # This method will return the hash of a node, None when the fingerprint has no such node
+    def __getNode(self, level, index):
+        if level >= len(self.levels):
+            return None
+        if index >= len(self.levels[level]):
+            return None
+        return self.levels[level][index]
+
+    # This method will return the digest of a value
+    def __hash(self, value):
+        if not isinstance(value, bytes):
+            value = value.encode('utf-8')
+        return hashlib.sha1(value).digest()
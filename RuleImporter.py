@@ -0,0 +1,227 @@
+from Rules import *
+import csv
+try:
+    import yaml
+except ImportError:
+    yaml = None # YAML files can only be imported when PyYAML is installed
+class RuleImporter:
+    '''
+    This class will be used to read many firewall rules from a CSV or YAML file, check them and write them to the PaloAlto
+
+    Every row (CSV) or mapping (YAML list) is a rule, the columns / keys are the arguments of the Rules constructor
+    (name, memFrom, memTo, src, dst, srv, app, act, srcUsr, disRsp, negSrc, negDst, disable, group, hipProf, logStart, logEnd, desc).
+    In CSV files the members of list arguments are separated by ';'.  Only name and act are required, see DEFAULTS.
+
+    The file is read and checked chunkSize rows at a time (a YAML file is parsed whole first, PyYAML can not stream
+    the items of a single list).  Every error is collected with its line number, nothing is
+    written to the PaloAlto unless the whole file is valid.
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    # Arguments of the Rules constructor, in order
+    FIELDS = [
+              "name", "memFrom", "memTo", "src", "dst", "srv", "app", "act", "srcUsr", "disRsp", "negSrc", "negDst",
+              "disable", "group", "hipProf", "logStart", "logEnd", "desc"
+              ]
+    LIST_FIELDS = ["memFrom", "memTo", "src", "dst", "srv", "app", "srcUsr", "group", "hipProf"]
+    # Values used for the columns missing from the file or left empty
+    DEFAULTS = {
+                "memFrom": ["any"], "memTo": ["any"], "src": ["any"], "dst": ["any"], "srv": ["any"], "app": ["any"],
+                "srcUsr": ["any"], "disRsp": "no", "negSrc": "no", "negDst": "no", "disable": "no", "group": [],
+                "hipProf": [], "logStart": "no", "logEnd": "yes", "desc": ""
+                }
+
+    path = "" # Name of the file to import
+    fileFormat = "" # 'csv' or 'yaml'
+    chunkSize = 1000 # Number of rows checked at a time
+    separator = ";" # Separator of the members of list columns in CSV files
+
+    '''
+    Constructor: will create and return a RuleImporter object, nothing is read until the rules are asked for
+
+        Constructor args:
+            path => name of the CSV or YAML file (string)
+            fileFormat => format of the file, guessed from its extension when not given (string => 'csv' or 'yaml')
+    '''
+    def __init__(self, path, fileFormat=None):
+        if fileFormat is None:
+            if path.lower().endswith((".yaml", ".yml")):
+                fileFormat = "yaml"
+            else:
+                fileFormat = "csv"
+        if fileFormat not in ("csv", "yaml"):
+            raise ValueError("Value must be 'csv' or 'yaml'")
+        if fileFormat == "yaml" and yaml is None:
+            raise ImportError("PyYAML is needed to import YAML files")
+        self.path = path
+        self.fileFormat = fileFormat
+
+    ### Methods for reading the rules ###
+    '''
+    iterChunks: will read and check the file chunkSize rows at a time and return a (rules, errors) tuple for every chunk,
+    errors are (line number, message) tuples (generator)
+    '''
+    def iterChunks(self):
+        chunk = []
+        for row in self.iterRows():
+            chunk.append(row)
+            if len(chunk) == self.chunkSize:
+                yield self.__checkChunk(chunk)
+                chunk = []
+        if chunk:
+            yield self.__checkChunk(chunk)
+
+    '''
+    validate: will read and check the whole file and return a (rules, errors) tuple, errors are (line number, message) tuples
+    '''
+    def validate(self):
+        rules = []
+        errors = []
+        names = {}
+        for chunk in self.iterChunks():
+            for rule in chunk[0]:
+                if rule[1].getRuleName() in names:
+                    errors.append((rule[0], "Rule '" + rule[1].getRuleName() + "' is already defined on line " + str(names[rule[1].getRuleName()])))
+                else:
+                    names[rule[1].getRuleName()] = rule[0]
+                    rules.append(rule[1])
+            errors.extend(chunk[1])
+        errors.sort(key=lambda error: error[0])
+        return (rules, errors)
+
+    '''
+    importRules: will write every rule of the file to the PaloAlto in batches (see PaAPI.writeFireWallRules) and return
+    the number of rules written, raises a ValueError listing every error (nothing is written) when the file is not valid
+
+    Writing a rule merges its members into a rule of the PaloAlto with the same name, so the names of the rules of the
+    PaloAlto are read first (one request) and a ValueError is raised (nothing is written) when a rule already exists.
+
+        importRules args:
+            pa => connection to the PaloAlto the rules are written to (PaAPI object)
+    '''
+    def importRules(self, pa):
+        rules, errors = self.validate()
+        if errors:
+            raise ValueError(str(len(errors)) + " invalid rows in '" + self.path + "':\n" + self.formatErrors(errors))
+        existing = set(pa.getFireWallRuleNames())
+        collisions = [rule.getRuleName() for rule in rules if rule.getRuleName() in existing]
+        if collisions:
+            raise ValueError(str(len(collisions)) + " rules of '" + self.path + "' already exist on the PaloAlto: " + ", ".join(collisions))
+        pa.writeFireWallRules(rules)
+        return len(rules)
+
+    '''
+    formatErrors: will return the errors as text, one 'line <number>: <message>' line per error
+
+        formatErrors args:
+            errors => (line number, message) tuples (list)
+    '''
+    def formatErrors(self, errors):
+        return "\n".join(["line " + str(error[0]) + ": " + error[1] for error in errors])
+
+    '''
+    iterRows: will return the rows of the file one at a time as (line number, {column => value}) tuples (generator)
+    '''
+    def iterRows(self):
+        if self.fileFormat == "yaml":
+            for row in self.__iterYAMLRows():
+                yield row
+        else:
+            for row in self.__iterCSVRows():
+                yield row
+
+    # This method will return the rows of a CSV file, the first row holds the column names
+    def __iterCSVRows(self):
+        if str is bytes:
+            csvFile = open(self.path, 'rb')
+        else:
+            csvFile = open(self.path, newline='')
+        try:
+            reader = csv.DictReader(csvFile)
+            for row in reader:
+                values = {}
+                for column in row:
+                    if column is None:
+                        values[None] = row[column]
+                    elif row[column] is not None and row[column].strip():
+                        value = row[column].strip()
+                        if column.strip() in self.LIST_FIELDS:
+                            value = [member.strip() for member in value.split(self.separator) if member.strip()]
+                        values[column.strip()] = value
+                yield (reader.line_num, values)
+        finally:
+            csvFile.close()
+
+    # This method will return the mappings of a YAML file holding a list of rules
+    def __iterYAMLRows(self):
+        yamlFile = open(self.path)
+        try:
+            loader = yaml.SafeLoader(yamlFile)
+            try:
+                document = loader.get_single_node()
+                if document is None:
+                    return
+                if not isinstance(document, yaml.SequenceNode):
+                    raise ValueError("'" + self.path + "' must hold a list of rules")
+                for node in document.value:
+                    values = loader.construct_object(node, deep=True)
+                    if isinstance(values, dict):
+                        for column in values:
+                            values[column] = self.__getYAMLValue(values[column])
+                            if column in self.LIST_FIELDS and type(values[column]) is not list:
+                                values[column] = [values[column]]
+                    yield (node.start_mark.line + 1, values)
+            finally:
+                loader.dispose()
+        finally:
+            yamlFile.close()
+
+    # This method will turn the values YAML reads as booleans or numbers (yes, no, 80) back into strings
+    def __getYAMLValue(self, value):
+        if value is True:
+            return "yes"
+        if value is False:
+            return "no"
+        if isinstance(value, list):
+            return [self.__getYAMLValue(member) for member in value]
+        if isinstance(value, (int, float)):
+            return str(value)
+        return value
+
+    # This method will return the (rules, errors) of a chunk of rows, rules are (line number, rule object) tuples
+    def __checkChunk(self, chunk):
+        rules = []
+        errors = []
+        for line, values in chunk:
+            if not isinstance(values, dict):
+                errors.append((line, "A rule must be a mapping of columns to values"))
+                continue
+            if None in values:
+                errors.append((line, "The row has more cells than there are columns"))
+                continue
+            unknown = [str(column) for column in values if column not in self.FIELDS]
+            if unknown:
+                errors.append((line, "Unknown columns: " + ", ".join(sorted(unknown))))
+                continue
+            missing = [field for field in ("name", "act") if field not in values]
+            if missing:
+                errors.append((line, "Missing columns: " + ", ".join(missing)))
+                continue
+            args = []
+            for field in self.FIELDS:
+                if field in values:
+                    args.append(values[field])
+                elif type(self.DEFAULTS[field]) is list:
+                    # Every rule gets its own list, the rules may be changed once they are imported
+                    args.append(list(self.DEFAULTS[field]))
+                else:
+                    args.append(self.DEFAULTS[field])
+            try:
+                rules.append((line, Rules(*args)))
+            except (TypeError, ValueError) as e:
+                errors.append((line, str(e)))
+        return (rules, errors)
@@ -0,0 +1,184 @@
+class RuleIndex:
+    '''
+    This class will be used to find the rules using a member (an address, zone, application, user, group...) without
+    looking at every rule
+
+    For every field of the rules, each member is mapped to the names of the rules holding it.  The index is updated
+    one rule at a time when rules are added, replaced or removed, so it never has to be rebuilt.
+    Members are mapped to names rather than to rulebase positions: a rule added, moved or deleted would shift the
+    position of every rule below it, the names never change.  findPositions turns the matches into positions.
+
+    Queries are either a (field, member) tuple or a tuple starting with 'and' / 'or' followed by other queries:
+        ("src", "web-servers")
+        ("and", ("app", "ssh"), ("or", ("memFrom", "trust"), ("memFrom", "dmz")))
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    # Attributes of a Rule that are indexed, see the Rules class for what they hold
+    FIELDS = ["memFrom", "memTo", "src", "dst", "srv", "app", "act", "srcUsr", "group", "hipProf"]
+    # Attributes of a NAT Rule that are indexed, see the NatRules class
+    NAT_FIELDS = ["memFrom", "memTo", "src", "dst", "srv", "toInterface", "srcTransAddr", "srcTransInterface", "dstTransAddr"]
+    # Attributes of a PBF Rule that are indexed, see the PbfRules class
+    PBF_FIELDS = ["memFrom", "src", "dst", "srcUsr", "app", "srv", "act", "egressIf", "nextHop", "toVsys"]
+
+    fields = [] # attributes of the rules that are indexed (FIELDS, NAT_FIELDS or PBF_FIELDS)
+    index = {} # field => member => set of rule names
+    rules = {} # rule name => rule object
+    ruleMembers = {} # rule name => field => members indexed for the rule
+
+    '''
+    Constructor: will create and return a RuleIndex object
+
+        Constructor args:
+            rules => rules to index (list of rule objects)
+            fields => attributes of the rules that are indexed, FIELDS when not given (list of strings)
+    '''
+    def __init__(self, rules=[], fields=None):
+        self.fields = list(fields or self.FIELDS)
+        self.index = {}
+        for field in self.fields:
+            self.index[field] = {}
+        self.rules = {}
+        self.ruleMembers = {}
+        for rule in rules:
+            self.addRule(rule)
+
+    ### Methods for changing the index ###
+    '''
+    addRule: will add a rule to the index, a rule already indexed with the same name is replaced
+
+        addRule args:
+            rule => rule to index (rule object)
+    '''
+    def addRule(self, rule):
+        ruleName = rule.getRuleName()
+        if ruleName in self.rules:
+            self.removeRule(ruleName)
+        members = {}
+        for field in self.fields:
+            value = getattr(rule, field, [])
+            if type(value) is not list:
+                # Optional attributes left empty (e.g. no next hop) are not members
+                value = [value] if value else []
+            members[field] = list(value)
+            for member in value:
+                self.index[field].setdefault(member, set()).add(ruleName)
+        self.rules[ruleName] = rule
+        self.ruleMembers[ruleName] = members
+
+    '''
+    updateRule: will index the current members of a rule again (after it was changed)
+
+        updateRule args:
+            rule => rule that changed (rule object)
+    '''
+    def updateRule(self, rule):
+        self.addRule(rule)
+
+    '''
+    removeRule: will remove a rule from the index, nothing happens if the rule is not indexed
+
+        removeRule args:
+            ruleName => name of the rule (string)
+    '''
+    def removeRule(self, ruleName):
+        members = self.ruleMembers.pop(ruleName, None)
+        if members is None:
+            return
+        del self.rules[ruleName]
+        for field in members:
+            for member in members[field]:
+                ruleNames = self.index[field].get(member)
+                if ruleNames is not None:
+                    ruleNames.discard(ruleName)
+                    if not ruleNames:
+                        del self.index[field][member]
+
+    ### Methods for querying the index ###
+    '''
+    find: will return the names of the rules matching a query (set of strings)
+
+        find args:
+            query => (field, member) or ('and' / 'or', query, query, ...) (tuple)
+    '''
+    def find(self, query):
+        if type(query) is not tuple or len(query) < 2:
+            raise TypeError("Type must be a tuple")
+        if query[0] in ("and", "or"):
+            # Intersecting the smallest sets first keeps AND queries cheap
+            results = sorted([self.find(subQuery) for subQuery in query[1:]], key=len)
+            matches = set(results[0])
+            for result in results[1:]:
+                if query[0] == "and":
+                    if not matches:
+                        break
+                    matches.intersection_update(result)
+                else:
+                    matches.update(result)
+            return matches
+        if query[0] not in self.index:
+            raise ValueError("Field must be one of " + ", ".join(self.fields))
+        return set(self.index[query[0]].get(query[1], ()))
+
+    '''
+    findRules: will return the rules matching a query, sorted by name (list of rule objects)
+
+        findRules args:
+            query => (field, member) or ('and' / 'or', query, query, ...) (tuple)
+    '''
+    def findRules(self, query):
+        return [self.rules[ruleName] for ruleName in sorted(self.find(query))]
+
+    '''
+    findPositions: will return the positions (starting at 0) of the rules matching a query in a rulebase, in rulebase order
+    (list of ints)
+
+        findPositions args:
+            query => (field, member) or ('and' / 'or', query, query, ...) (tuple)
+            rules => indexed rules in rulebase order (list of rule objects)
+    '''
+    def findPositions(self, query, rules):
+        matches = self.find(query)
+        return [position for position in range(len(rules)) if rules[position].getRuleName() in matches]
+
+    '''
+    findMember: will return the names of the rules using a member in any field, e.g. before deleting an object (set of strings)
+
+        findMember args:
+            member => address, zone, application, user, group... (string)
+    '''
+    def findMember(self, member):
+        matches = set()
+        for field in self.fields:
+            matches.update(self.index[field].get(member, ()))
+        return matches
+
+    '''
+    getMembers: will return every member of a field used by at least one rule
+
+        getMembers args:
+            field => indexed attribute of the rules, see fields (string)
+    '''
+    def getMembers(self, field):
+        if field not in self.index:
+            raise ValueError("Field must be one of " + ", ".join(self.fields))
+        return list(self.index[field].keys())
+
+    '''
+    hasRule: will return True if a rule is indexed
+
+        hasRule args:
+            ruleName => name of the rule (string)
+    '''
+    def hasRule(self, ruleName):
+        return ruleName in self.rules
+
+    '''
+    getRuleCount: will return the number of indexed rules
+    '''
+    def getRuleCount(self):
+        return len(self.rules)
@@ -0,0 +1,110 @@
+class RuleOrder:
+    '''
+    This class will be used to compute how to turn one rulebase order into another with as few moves as possible
+
+    The rules that keep their relative order form the longest increasing subsequence of their current positions
+    (taken in the target order), they never have to move.  Every other rule is moved once, right after the rule
+    that precedes it in the target order, which gives the minimum number of moves.
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    ruleNames = [] # Current order of the rules (list of rule names)
+
+    '''
+    Constructor: will create and return a RuleOrder object
+
+        Constructor args:
+            ruleNames => current order of the rules (list of strings)
+    '''
+    def __init__(self, ruleNames):
+        if type(ruleNames) is not list:
+            raise TypeError("Type must be a list")
+        if len(set(ruleNames)) != len(ruleNames):
+            raise ValueError("Rule names must be unique")
+        self.ruleNames = list(ruleNames)
+
+    '''
+    getRuleNames: will return the current order of the rules
+    '''
+    def getRuleNames(self):
+        return self.ruleNames
+
+    '''
+    getMoves: will return the moves turning the current order into the target order as (rule name, where, dst) tuples
+
+        getMoves args:
+            targetNames => order the rules must have once moved, the same names as the current order (list of strings)
+    '''
+    def getMoves(self, targetNames):
+        if type(targetNames) is not list:
+            raise TypeError("Type must be a list")
+        if len(targetNames) != len(self.ruleNames) or set(targetNames) != set(self.ruleNames):
+            raise ValueError("The target order must hold exactly the same rules as the current order")
+
+        positions = {}
+        for position in range(len(self.ruleNames)):
+            positions[self.ruleNames[position]] = position
+        staying = self.__getLongestIncreasingSubsequence([positions[ruleName] for ruleName in targetNames])
+
+        moves = []
+        for index in range(len(targetNames)):
+            if index in staying:
+                continue
+            if index == 0:
+                moves.append((targetNames[index], "top", None))
+            else:
+                moves.append((targetNames[index], "after", targetNames[index - 1]))
+        return moves
+
+    '''
+    applyMove: will move a rule inside the current order, the same way the PaloAlto moves it
+
+        applyMove args:
+            ruleName => name of the rule to move (string)
+            where => where to move the rule (string => 'top', 'bottom', 'before' or 'after')
+            dst => name of the rule to move before or after, only used with 'before' and 'after' (string)
+    '''
+    def applyMove(self, ruleName, where, dst=None):
+        if where not in ("top", "bottom", "before", "after"):
+            raise ValueError("Value must be 'top', 'bottom', 'before' or 'after'")
+        self.ruleNames.remove(ruleName)
+        if where == "top":
+            self.ruleNames.insert(0, ruleName)
+        elif where == "bottom":
+            self.ruleNames.append(ruleName)
+        else:
+            position = self.ruleNames.index(dst)
+            if where == "after":
+                position = position + 1
+            self.ruleNames.insert(position, ruleName)
+
+    # This method will return the set of indexes of a longest increasing subsequence of values (patience sorting, O(n log n))
+    def __getLongestIncreasingSubsequence(self, values):
+        tails = [] # tails[k] => index of the smallest tail of an increasing subsequence of length k + 1
+        previous = [None] * len(values)
+        for index in range(len(values)):
+            low = 0
+            high = len(tails)
+            while low < high:
+                middle = (low + high) // 2
+                if values[tails[middle]] < values[index]:
+                    low = middle + 1
+                else:
+                    high = middle
+            if low > 0:
+                previous[index] = tails[low - 1]
+            if low == len(tails):
+                tails.append(index)
+            else:
+                tails[low] = index
+
+        subsequence = set()
+        index = tails[-1] if tails else None
+        while index is not None:
+            subsequence.add(index)
+            index = previous[index]
+        return subsequence
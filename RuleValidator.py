@@ -0,0 +1,132 @@
+from ObjectResolver import *
+import re
+import socket
+class RuleValidator:
+    '''
+    This class will be used to check that every member of a rule exists on the PaloAlto before the rule is sent
+
+    The names of the zones, addresses, applications, services, security profile groups and HIP profiles are kept in
+    local sets (see PaAPI.loadRuleValidator), so a whole batch of rules is checked without any request and every
+    unknown member of every rule is reported at once.  A kind of name that was not loaded (None) is not checked.
+    Besides the names, addresses can be IP addresses, ranges or networks and two letter country codes.
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    KINDS = ["zone", "address", "application", "service", "profile-group", "hip-profile"]
+    # Attributes of the rules (security, NAT and PBF) holding names of each kind
+    FIELDS = [
+              ("memFrom", "zone"), ("memTo", "zone"), ("src", "address"), ("dst", "address"), ("app", "application"),
+              ("srv", "service"), ("group", "profile-group"), ("hipProf", "hip-profile"), ("srcTransAddr", "address"),
+              ("dstTransAddr", "address")
+              ]
+    # Names every PaloAlto knows without them being configured
+    PREDEFINED = {
+                  "zone": ["any"], "address": ["any"], "application": ["any"],
+                  "service": ["any", "application-default", "service-http", "service-https"],
+                  "profile-group": [], "hip-profile": ["any", "no-hip"]
+                  }
+    COUNTRY = re.compile(r"^[A-Z]{2}$") # Region (country) used as an address
+
+    names = {} # kind => set of names, None when the kind is not checked
+
+    '''
+    Constructor: will create and return a RuleValidator object
+
+        Constructor args:
+            names => names configured on the PaloAlto: kind => names, a kind left out is not checked (dictionary => list of strings)
+    '''
+    def __init__(self, names):
+        if type(names) is not dict:
+            raise TypeError("Type must be a dictionary")
+        self.names = {}
+        for kind in self.KINDS:
+            self.names[kind] = None
+        for kind in names:
+            self.setNames(kind, names[kind])
+        self.resolver = ObjectResolver()
+
+    '''
+    setNames: will replace the names of a kind
+
+        setNames args:
+            kind => kind of names, see KINDS (string)
+            names => names configured on the PaloAlto, None to stop checking the kind (list of strings)
+    '''
+    def setNames(self, kind, names):
+        if kind not in self.names:
+            raise ValueError("Kind must be one of " + ", ".join(self.KINDS))
+        if names is None:
+            self.names[kind] = None
+        else:
+            self.names[kind] = set(names) | set(self.PREDEFINED[kind])
+
+    '''
+    addName: will add a name to a kind that is checked, e.g. after creating an address object
+
+        addName args:
+            kind => kind of the name, see KINDS (string)
+            name => name configured on the PaloAlto (string)
+    '''
+    def addName(self, kind, name):
+        if kind not in self.names:
+            raise ValueError("Kind must be one of " + ", ".join(self.KINDS))
+        if self.names[kind] is not None:
+            self.names[kind].add(name)
+
+    ### Methods for checking rules ###
+    '''
+    checkRule: will return the errors of a rule, one message per unknown member (list of strings)
+
+        checkRule args:
+            rule => rule to check (rule object)
+    '''
+    def checkRule(self, rule):
+        errors = []
+        for field, kind in self.FIELDS:
+            if self.names[kind] is None:
+                continue
+            members = getattr(rule, field, [])
+            if type(members) is not list:
+                members = [members]
+            for member in members:
+                if member and member not in self.names[kind] and not (kind == "address" and self.__isAddress(member)):
+                    errors.append("Unknown " + kind + " '" + member + "'")
+        return errors
+
+    '''
+    validate: will return the errors of many rules as (rule name, message) tuples, in the order of the rules
+
+        validate args:
+            rules => rules to check (list of rule objects)
+    '''
+    def validate(self, rules):
+        errors = []
+        for rule in rules:
+            for error in self.checkRule(rule):
+                errors.append((rule.getRuleName(), error))
+        return errors
+
+    '''
+    checkRules: will raise a ValueError listing every unknown member when one of the rules is not valid
+
+        checkRules args:
+            rules => rules to check (list of rule objects)
+    '''
+    def checkRules(self, rules):
+        errors = self.validate(rules)
+        if errors:
+            raise ValueError(str(len(errors)) + " unknown members:\n" + "\n".join(["rule '" + error[0] + "': " + error[1] for error in errors]))
+
+    # This method will return True if an address member is an IP address, range, network or country instead of a name
+    def __isAddress(self, member):
+        if self.COUNTRY.match(member):
+            return True
+        try:
+            self.resolver.parseAddress(member)
+            return True
+        except (ValueError, socket.error):
+            return False
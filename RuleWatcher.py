@@ -0,0 +1,193 @@
+import re
+import threading
+class RuleWatcher:
+    '''
+    This class will be used to keep the rules loaded by a PaAPI object up to date with the changes made on the PaloAlto
+    by anyone else, without downloading the whole rulebase
+
+    Every 'interval' seconds the new entries of the config log are read (one small log query).  The names of the
+    security rules changed in the current vsys are collected and, once a commit shows up in the log, only those rules
+    are downloaded again (see PaAPI.fetchFireWallRules).  The names of the rules are read at the same time (one request),
+    rules created, renamed, moved or deleted are found by comparing them with the loaded rules.  A change to the whole
+    rulebase (many rules set at once) falls back to PaAPI.refreshFireWallRules.
+
+    Only the changes logged after the watcher started are seen, so it should be started right after the rules are loaded.
+    Given a snapshot path, the rules are saved to it after every refresh so worker processes sharing it (see
+    SharedRulebase) see the changes too.
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    VSYS = re.compile(r"(?:^|\s)vsys\s+(\S+)") # vsys of a config log path
+    RULES = re.compile(r"(?:^|\s)rulebase\s+security\s+rules(?:\s+(.*))?$") # security rules of a config log path
+
+    pa = None # PaAPI object whose rules are kept up to date
+    interval = 30.0 # Seconds between two looks at the config log
+    nlogs = 100 # Upper bound of the config log entries read by one log query
+    lastSeqno = None # Sequence number of the newest config log entry seen
+    changed = None # Names of the rules changed but not committed yet
+    changedAll = False # True when the whole rulebase changed but was not committed yet
+    refreshCount = 0 # Number of rules downloaded again
+    snapshotPath = None # Snapshot file saved after every refresh, None for no snapshot
+    error = None # Error of the last look at the config log made by the thread, None when it worked
+
+    '''
+    Constructor: will create and return a RuleWatcher object, the config log is not read until it is started or polled
+
+        Constructor args:
+            pa => connection to the PaloAlto whose rules are kept up to date (PaAPI object)
+            interval => seconds between two looks at the config log (float)
+            snapshotPath => snapshot file saved after every refresh, None for no snapshot (string)
+    '''
+    def __init__(self, pa, interval=30.0, snapshotPath=None):
+        if interval <= 0:
+            raise ValueError("The interval must be more than 0 seconds")
+        self.pa = pa
+        self.interval = float(interval)
+        self.lastSeqno = None
+        self.changed = set()
+        self.changedAll = False
+        self.refreshCount = 0
+        self.snapshotPath = snapshotPath
+        self.error = None
+        self.thread = None
+        self.stopped = threading.Event()
+
+    '''
+    start: will read the newest sequence number of the config log and look at the log every interval seconds from a thread
+    '''
+    def start(self):
+        if self.thread is not None:
+            raise ValueError("The watcher is already running")
+        if self.lastSeqno is None:
+            self.poll()
+        self.stopped.clear()
+        self.thread = threading.Thread(target=self.__run)
+        self.thread.daemon = True
+        self.thread.start()
+
+    '''
+    stop: will stop the thread and wait for it
+    '''
+    def stop(self):
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    '''
+    poll: will read the new entries of the config log once and return the names of the rules downloaded again,
+    the first poll only reads the newest sequence number
+    '''
+    def poll(self):
+        if self.lastSeqno is None:
+            entries = self.pa.getConfigLogs(None, 1)
+            self.lastSeqno = max([entry["seqno"] for entry in entries] or [0])
+            return []
+
+        committed = set()
+        committedAll = False
+        entries = [None] * self.nlogs
+        while len(entries) >= self.nlogs:
+            entries = self.pa.getConfigLogs(self.lastSeqno, self.nlogs)
+            if entries and entries[0]["seqno"] > self.lastSeqno + 1:
+                # Entries were missed (e.g. the log rolled over), the committed changes they held are not known
+                committedAll = True
+            for entry in entries:
+                self.lastSeqno = max(self.lastSeqno, entry["seqno"])
+                if entry["cmd"] == "commit":
+                    # Changes are only running (and readable) once they are committed
+                    committed.update(self.changed)
+                    committedAll = committedAll or self.changedAll
+                    self.changed = set()
+                    self.changedAll = False
+                    continue
+                ruleName = self.getRuleName(entry["path"])
+                if ruleName == "":
+                    self.changedAll = True
+                elif ruleName is not None:
+                    self.changed.add(ruleName)
+        return self.__refresh(committed, committedAll)
+
+    '''
+    getRuleName: will return the name of the security rule a config log path points to in the current vsys,
+    '' when the path points to every rule and None when it does not point to a security rule
+
+        getRuleName args:
+            path => path of a config log entry, e.g. 'vsys  vsys1 rulebase security rules  allow-web' (string)
+    '''
+    def getRuleName(self, path):
+        rules = self.RULES.search(path)
+        if rules is None:
+            return None
+        vsys = self.VSYS.search(path)
+        if vsys and self.pa.vsys and vsys.group(1) != self.pa.vsys:
+            return None
+        rest = (rules.group(1) or "").strip()
+        if not rest:
+            return ""
+        # Rule names can hold spaces, the longest loaded name the path starts with is the rule
+        words = rest.split(" ")
+        for count in range(len(words), 1, -1):
+            if self.pa.ruleIndex.hasRule(" ".join(words[:count])):
+                return " ".join(words[:count])
+        return words[0]
+
+    ### Get Methods ###
+    '''
+    getLastSeqno: will return the sequence number of the newest config log entry seen, None before the first poll
+    '''
+    def getLastSeqno(self):
+        return self.lastSeqno
+
+    '''
+    getRefreshCount: will return the number of rules downloaded again
+    '''
+    def getRefreshCount(self):
+        return self.refreshCount
+
+    '''
+    getError: will return the error of the last poll made by the thread, None when it worked
+    '''
+    def getError(self):
+        return self.error
+
+    # This method will download the committed changes
+    def __refresh(self, changed, changedAll):
+        if changedAll:
+            ranges = self.pa.refreshFireWallRules()
+            self.refreshCount = self.refreshCount + sum([last - first + 1 for first, last in ranges])
+            if ranges:
+                self.__saveSnapshot()
+            return [rule.getRuleName() for first, last in ranges for rule in self.pa.rules[first:last + 1]]
+        if not changed:
+            return []
+        names = self.pa.getFireWallRuleNames()
+        loaded = set([rule.getRuleName() for rule in self.pa.rules])
+        fetchNames = [name for name in names if name in changed or name not in loaded]
+        if fetchNames:
+            self.pa.fetchFireWallRules(fetchNames)
+        sort = [rule.getRuleName() for rule in self.pa.rules] != names
+        if sort:
+            self.pa.sortFireWallRules(names)
+        self.refreshCount = self.refreshCount + len(fetchNames)
+        if fetchNames or sort:
+            self.__saveSnapshot()
+        return fetchNames
+
+    # This method will save the rules to the snapshot file, if any
+    def __saveSnapshot(self):
+        if self.snapshotPath is not None:
+            self.pa.saveSnapshot(self.snapshotPath)
+
+    # This method is run by the thread
+    def __run(self):
+        while not self.stopped.wait(self.interval):
+            try:
+                self.poll()
+                self.error = None
+            except Exception as e:
+                self.error = e
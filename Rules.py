@@ -7,6 +7,7 @@ class Rules:
         Last Updated:
             01/29/2015
     '''
+    rulebase = "security" # Rulebase holding the rule
     name = "" # Rule name
     memFrom = [] #Rule From members
     memTo = [] # Rule To members
@@ -25,6 +26,11 @@ class Rules:
     logStart = "" # Rule Log Start (yes or no)
     logEnd = "" # Rule Log End (yes or no)
     desc = "" # Rule Description
+    # Children of a rulebase entry written by the Rule, the other ones (tags, schedule, log forwarding...) are kept when editing
+    TAGS = [
+            "from", "to", "source", "destination", "service", "application", "action", "source-user", "option",
+            "negate-source", "negate-destination", "disabled", "profile-setting", "hip-profiles", "log-start", "log-end", "description"
+            ]
 
     '''
     Constructor: will create and return a Rule object
@@ -120,7 +126,116 @@ class Rules:
         self.desc = desc
     
     
+    ### Methods for reading the entries returned by the PaloAlto ###
+    '''
+    parseEntry: will return a Rule object built from a rule entry returned by the PaloAlto
+    
+        parseEntry args:
+            root => entry of the rule (Element object)
+    '''
+    @staticmethod
+    def parseEntry(root):
+        return Rules(*Rules.parseRecord(root))
+    
+    '''
+    parseRecord: will return the arguments of the Rules constructor read from a rule entry returned by the PaloAlto, in order
+    (tuple), unlike the Rule objects records can be sent to other processes (see RuleDecoder)
+    
+        parseRecord args:
+            root => entry of the rule (Element object)
+    '''
+    @staticmethod
+    def parseRecord(root):
+        disRsp = ""
+        for attr in root.iter('option'):
+            disRsp = attr[0].text
+        group = []
+        for attrs in root.iter('profile-setting'):
+            group.extend([attr.text for attr in attrs[0]])
+        return (
+                root.get('name'),
+                Rules.__parseMembers(root, 'from'),
+                Rules.__parseMembers(root, 'to'),
+                Rules.__parseMembers(root, 'source'),
+                Rules.__parseMembers(root, 'destination'),
+                Rules.__parseMembers(root, 'service'),
+                Rules.__parseMembers(root, 'application'),
+                Rules.__parseText(root, 'action', ""),
+                Rules.__parseMembers(root, 'source-user'),
+                disRsp or "no",
+                Rules.__parseText(root, 'negate-source', "no"),
+                Rules.__parseText(root, 'negate-destination', "no"),
+                Rules.__parseText(root, 'disabled', "no"),
+                group,
+                Rules.__parseMembers(root, 'hip-profiles'),
+                Rules.__parseText(root, 'log-start', "no"),
+                Rules.__parseText(root, 'log-end', "no"),
+                Rules.__parseText(root, 'description', ""),
+                )
+    
+    # This method will return the text of the members of every tag of an entry
+    @staticmethod
+    def __parseMembers(root, tag):
+        members = []
+        for attrs in root.iter(tag):
+            members.extend([attr.text for attr in attrs])
+        return members
+    
+    # This method will return the text of the last tag of an entry, or a default value when it has none
+    @staticmethod
+    def __parseText(root, tag, default):
+        text = ""
+        for attr in root.iter(tag):
+            text = attr.text
+        return text or default
+    
+    
     ### Generate Methods ###
+    '''
+    genRuleXML: will return an XML string version of the whole Rule as a rulebase entry
+    '''
+    def genRuleXML(self):
+        retStr = "<entry name='" + self.name + "'>"
+        retStr = retStr + self.genRuleMembersXML()
+        retStr = retStr + "</entry>"
+        return retStr
+    
+    '''
+    genRuleMembersXML: will return an XML string version of every attribute of the Rule (the content of its entry)
+    '''
+    def genRuleMembersXML(self):
+        retStr = self.genRuleFromMembersXML()
+        retStr = retStr + self.genRuleToMembersXML()
+        retStr = retStr + self.genRuleSourceXML()
+        retStr = retStr + self.genRuleDestinationXML()
+        retStr = retStr + self.genRuleServiceXML()
+        retStr = retStr + self.genRuleApplicationXML()
+        retStr = retStr + self.genRuleActionXML()
+        retStr = retStr + self.genRuleSourceUserXML()
+        retStr = retStr + self.genRuleDisableServerResponseXML()
+        retStr = retStr + self.genRuleNegateSourceXML()
+        retStr = retStr + self.genRuleNegateDestinationXML()
+        retStr = retStr + self.genRuleDisabledXML()
+        retStr = retStr + self.genRuleGroupsXML()
+        retStr = retStr + self.genRuleHipProfilesXML()
+        retStr = retStr + self.genRuleLogStartXML()
+        retStr = retStr + self.genRuleLogEndXML()
+        retStr = retStr + self.genRuleDescriptionXML()
+        return retStr
+    
+    '''
+    ownsChild: will return True if a child of the Rule's entry on the PaloAlto is written by the Rule, the children the Rule
+    does not write are kept by PaAPI.editFireWallRule
+    
+        ownsChild args:
+            child => child of the entry of the rule on the PaloAlto (Element object)
+    '''
+    def ownsChild(self, child):
+        if child.tag == "profile-setting":
+            # Security profiles set one by one are kept, unless the rule sets a group in their place
+            return bool(self.group) or child.find('group') is not None
+        return child.tag in self.TAGS
+    
     '''
     genRuleNameXML: will return an XML string version of the Rule's name
     '''
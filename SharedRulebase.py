@@ -0,0 +1,103 @@
+from Snapshot import *
+import os
+import threading
+import time
+class SharedRulebase:
+    '''
+    This class will be used by worker processes to share one copy of the firewall rules instead of each loading them
+
+    One loader process loads the rules and saves them to a snapshot file (see PaAPI.saveSnapshot, or a RuleWatcher
+    given a snapshot path to save it again after every refresh).  The workers attach to the file read-only: it is
+    memory-mapped, so its pages are shared by every worker and only the rules asked for are decoded.
+
+    A snapshot is always replaced by renaming a new file over it.  At most every checkInterval seconds getRules looks
+    at the file and, when it was replaced, maps the new file and swaps it in.  The Snapshot returned by getRules is
+    never changed: a worker going through the rules keeps the version it started with, and the next call to getRules
+    returns the new version.  Old versions are unmapped once nothing uses them anymore.
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    path = "" # Name of the snapshot file
+    checkInterval = 1.0 # Upper bound of the seconds before a replaced snapshot file is seen
+    snapshot = None # Current version of the rules (Snapshot object)
+    checked = 0.0 # When the snapshot file was last looked at
+    swapCount = 0 # Number of times a new version was swapped in
+
+    '''
+    Constructor: will attach to a snapshot file and return a SharedRulebase object
+
+        Constructor args:
+            path => name of the snapshot file (string)
+            checkInterval => upper bound of the seconds before a replaced snapshot file is seen, 0 to look at every call (float)
+    '''
+    def __init__(self, path, checkInterval=1.0):
+        if checkInterval < 0:
+            raise ValueError("Value must be 0 or greater")
+        self.path = path
+        self.checkInterval = float(checkInterval)
+        self.snapshot = Snapshot(path)
+        self.checked = time.time()
+        self.swapCount = 0
+        self.lock = threading.Lock()
+
+    '''
+    refresh: will swap in the snapshot file if it was replaced and return True when it was, the current version is kept
+    when the file can not be read
+    '''
+    def refresh(self):
+        with self.lock:
+            self.checked = time.time()
+            try:
+                status = os.stat(self.path)
+            except OSError:
+                return False
+            if (status.st_ino, status.st_mtime, status.st_size) == self.snapshot.fileId:
+                return False
+            try:
+                snapshot = Snapshot(self.path)
+            except (IOError, OSError, ValueError):
+                return False
+            # The old version is not closed, workers may still be reading it
+            self.snapshot = snapshot
+            self.swapCount = self.swapCount + 1
+            return True
+
+    ### Get Methods ###
+    '''
+    getRules: will return the current version of the rules, a Snapshot used like the list of the loaded rules
+    '''
+    def getRules(self):
+        if time.time() - self.checked >= self.checkInterval:
+            self.refresh()
+        return self.snapshot
+
+    '''
+    getRule: will return the Rule object of a rule of the current version, or None when the rule is not in it
+
+        getRule args:
+            ruleName => name of the rule (string)
+    '''
+    def getRule(self, ruleName):
+        return self.getRules().getRuleByName(ruleName)
+
+    '''
+    getRuleNames: will return the names of every rule of the current version in rulebase order
+    '''
+    def getRuleNames(self):
+        return self.getRules().getRuleNames()
+
+    '''
+    getCreated: will return when the current version was saved (seconds since the epoch)
+    '''
+    def getCreated(self):
+        return self.snapshot.getCreated()
+
+    '''
+    getSwapCount: will return the number of times a new version was swapped in
+    '''
+    def getSwapCount(self):
+        return self.swapCount
@@ -0,0 +1,82 @@
+import threading
+class SingleFlight:
+    '''
+    This class will be used to share a single PaloAlto API call between the callers asking for the same thing at the
+    same moment
+
+    The first caller of a key runs the call, the callers asking for the same key before it is done wait for it and
+    get its result (or its error) instead of sending their own request.  Nothing is cached, a caller arriving once
+    the call is done starts a new one.  The result is the same object for every caller, copy it before changing it.
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    calls = {} # Calls in flight: key => done (Event object), result, error
+    callCount = 0 # Number of calls run
+    sharedCount = 0 # Number of callers that got the result of a call run for another caller
+
+    '''
+    Constructor: will create and return a SingleFlight object
+    '''
+    def __init__(self):
+        self.calls = {}
+        self.callCount = 0
+        self.sharedCount = 0
+        self.lock = threading.Lock()
+
+    '''
+    do: will return the result of a function, shared with the callers of the same key running at the same moment,
+    raises the error of the function if it failed
+
+        do args:
+            key => what the function reads, e.g. its URL (any hashable value)
+            function => function doing the call (function without arguments)
+    '''
+    def do(self, key, function):
+        with self.lock:
+            call = self.calls.get(key)
+            leader = call is None
+            if leader:
+                call = {"done": threading.Event(), "result": None, "error": None}
+                self.calls[key] = call
+                self.callCount = self.callCount + 1
+            else:
+                self.sharedCount = self.sharedCount + 1
+
+        if leader:
+            try:
+                call["result"] = function()
+            except BaseException as e:
+                call["error"] = e
+                raise
+            finally:
+                with self.lock:
+                    del self.calls[key]
+                call["done"].set()
+        else:
+            call["done"].wait()
+            if call["error"] is not None:
+                raise call["error"]
+        return call["result"]
+
+    ### Get Methods ###
+    '''
+    getInFlightCount: will return the number of calls running
+    '''
+    def getInFlightCount(self):
+        return len(self.calls)
+
+    '''
+    getCallCount: will return the number of calls run
+    '''
+    def getCallCount(self):
+        return self.callCount
+
+    '''
+    getSharedCount: will return the number of callers that got the result of a call run for another caller
+    '''
+    def getSharedCount(self):
+        return self.sharedCount
@@ -0,0 +1,326 @@
+from Rules import *
+import mmap
+import os
+import struct
+import time
+class Snapshot:
+    '''
+    This class will be used to save the firewall rules in a compact binary file and to read them back memory-mapped
+
+    File layout (little-endian):
+        header      => magic 'PARS', version, rule count, string count, offsets of the tables below, creation time
+        strings     => every distinct string once (utf-8), followed by the offset of each string
+        rules       => one record per rule in rulebase order, every value is the number of a string
+                       (list attributes are stored as a 32 bit count followed by the string numbers)
+        rule table  => offset of each rule record
+        name index  => rule numbers sorted by rule name, used to find a rule without reading the others
+
+    Nothing but the header is read when the file is opened, rules and strings are decoded when they are asked for.
+    A Snapshot can be used like the list of the loaded rules (len, index, slice, iterate), each item is a Rule object.
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    MAGIC = b"PARS"
+    VERSION = 1
+    HEADER = struct.Struct("<4sHHIIIIIIQ") # magic, version, unused, rules, strings, string data, string table, rule table, name index, created
+    NONE = 0xFFFFFFFF # String number used for members without a value
+    # Attributes of a Rule in the order of its constructor, True when the attribute is a list
+    FIELDS = [
+              ("name", False), ("memFrom", True), ("memTo", True), ("src", True), ("dst", True), ("srv", True),
+              ("app", True), ("act", False), ("srcUsr", True), ("disRsp", False), ("negSrc", False), ("negDst", False),
+              ("disable", False), ("group", True), ("hipProf", True), ("logStart", False), ("logEnd", False), ("desc", False)
+              ]
+
+    path = ""
+    ruleCount = 0
+    stringCount = 0
+    created = 0
+    fileId = None # (inode, modification time, size) of the file that was mapped
+
+    '''
+    Constructor: will open a snapshot file, only its header is read
+
+        Constructor args:
+            path => name of the snapshot file (string)
+    '''
+    def __init__(self, path):
+        self.path = path
+        snapshotFile = open(path, 'rb')
+        try:
+            status = os.fstat(snapshotFile.fileno())
+            self.fileId = (status.st_ino, status.st_mtime, status.st_size)
+            self.data = mmap.mmap(snapshotFile.fileno(), 0, access=mmap.ACCESS_READ)
+        finally:
+            snapshotFile.close()
+        try:
+            header = self.__readHeader()
+        except ValueError:
+            # Nobody gets the object to close it, and SharedRulebase.refresh opens a bad file again on every poll
+            self.data.close()
+            raise
+        self.ruleCount = header[3]
+        self.stringCount = header[4]
+        self.stringDataPos = header[5]
+        self.stringTablePos = header[6]
+        self.ruleTablePos = header[7]
+        self.nameIndexPos = header[8]
+        self.created = header[9]
+        self.strings = {}
+
+    '''
+    save: will write the rules to a snapshot file, the file is replaced atomically so readers never see half a snapshot
+
+        save args:
+            path => name of the snapshot file (string)
+            rules => rules to save, in rulebase order (list of rule objects)
+    '''
+    @staticmethod
+    def save(path, rules):
+        stringNumbers = {}
+        strings = []
+        records = []
+        for rule in rules:
+            record = []
+            for field in Snapshot.FIELDS:
+                value = getattr(rule, field[0])
+                if field[1]:
+                    record.append(struct.pack("<I", len(value)))
+                    for member in value:
+                        record.append(struct.pack("<I", Snapshot.__getStringNumber(member, stringNumbers, strings)))
+                else:
+                    record.append(struct.pack("<I", Snapshot.__getStringNumber(value, stringNumbers, strings)))
+            records.append(b"".join(record))
+
+        stringData = b"".join(strings)
+        stringOffsets = [0]
+        for string in strings:
+            stringOffsets.append(stringOffsets[-1] + len(string))
+        ruleOffsets = []
+        position = Snapshot.HEADER.size + len(stringData) + 4 * len(stringOffsets)
+        for record in records:
+            ruleOffsets.append(position)
+            position = position + len(record)
+        ruleTablePos = position
+        nameIndexPos = ruleTablePos + 4 * len(records)
+        nameIndex = sorted(range(len(rules)), key=lambda index: Snapshot.__encode(rules[index].name))
+
+        tmpPath = path + ".tmp" + str(os.getpid())
+        snapshotFile = open(tmpPath, 'wb')
+        try:
+            try:
+                snapshotFile.write(Snapshot.HEADER.pack(
+                        Snapshot.MAGIC, Snapshot.VERSION, 0, len(rules), len(strings), Snapshot.HEADER.size,
+                        Snapshot.HEADER.size + len(stringData), ruleTablePos, nameIndexPos, int(time.time())
+                        ))
+                snapshotFile.write(stringData)
+                snapshotFile.write(struct.pack("<" + str(len(stringOffsets)) + "I", *stringOffsets))
+                for record in records:
+                    snapshotFile.write(record)
+                snapshotFile.write(struct.pack("<" + str(len(ruleOffsets)) + "I", *ruleOffsets))
+                snapshotFile.write(struct.pack("<" + str(len(nameIndex)) + "I", *nameIndex))
+                # The data must be on the disk before the file is renamed, or a crash could leave an empty snapshot behind
+                snapshotFile.flush()
+                os.fsync(snapshotFile.fileno())
+            finally:
+                snapshotFile.close()
+            # os.replace also replaces an existing file on Windows, Python 2 only has os.rename (which does on POSIX)
+            if hasattr(os, "replace"):
+                os.replace(tmpPath, path)
+            else:
+                os.rename(tmpPath, path)
+        except:
+            if os.path.exists(tmpPath):
+                os.remove(tmpPath)
+            raise
+
+    '''
+    close: will unmap the snapshot file, rules already returned stay usable
+    '''
+    def close(self):
+        self.data.close()
+
+    ### Get Methods ###
+    '''
+    getCreated: will return when the snapshot was saved (seconds since the epoch)
+    '''
+    def getCreated(self):
+        return self.created
+
+    '''
+    getRuleCount: will return the number of rules in the snapshot
+    '''
+    def getRuleCount(self):
+        return self.ruleCount
+
+    '''
+    getRule: will return the Rule object at a position of the rulebase
+
+        getRule args:
+            position => position of the rule in the rulebase, starting at 0 (int)
+    '''
+    def getRule(self, position):
+        return Rules(*self.getRuleValues(position))
+
+    '''
+    getRules: will return every rule of the snapshot as a list of Rule objects
+    '''
+    def getRules(self):
+        return [self.getRule(position) for position in range(self.ruleCount)]
+
+    '''
+    getRuleValues: will return the attributes of the rule at a position, in the order of the Rules constructor (tuple)
+
+        getRuleValues args:
+            position => position of the rule in the rulebase, starting at 0 (int)
+    '''
+    def getRuleValues(self, position):
+        if position < 0 or position >= self.ruleCount:
+            raise IndexError("Rule position out of range")
+        offset = struct.unpack_from("<I", self.data, self.ruleTablePos + 4 * position)[0]
+        values = []
+        for field in self.FIELDS:
+            if field[1]:
+                count = struct.unpack_from("<I", self.data, offset)[0]
+                numbers = struct.unpack_from("<" + str(count) + "I", self.data, offset + 4)
+                values.append([self.getString(number) for number in numbers])
+                offset = offset + 4 + 4 * count
+            else:
+                values.append(self.getString(struct.unpack_from("<I", self.data, offset)[0]))
+                offset = offset + 4
+        return tuple(values)
+
+    '''
+    getRuleName: will return the name of the rule at a position without decoding the rest of the rule
+
+        getRuleName args:
+            position => position of the rule in the rulebase, starting at 0 (int)
+    '''
+    def getRuleName(self, position):
+        offset = struct.unpack_from("<I", self.data, self.ruleTablePos + 4 * position)[0]
+        return self.getString(struct.unpack_from("<I", self.data, offset)[0])
+
+    '''
+    getRuleNames: will return the names of every rule in rulebase order
+    '''
+    def getRuleNames(self):
+        return [self.getRuleName(position) for position in range(self.ruleCount)]
+
+    '''
+    findRule: will return the position of a rule using the name index, or -1 when the rule is not in the snapshot
+
+        findRule args:
+            ruleName => name of the rule (string)
+    '''
+    def findRule(self, ruleName):
+        wanted = self.__encode(ruleName)
+        low = 0
+        high = self.ruleCount
+        while low < high:
+            middle = (low + high) // 2
+            position = struct.unpack_from("<I", self.data, self.nameIndexPos + 4 * middle)[0]
+            current = self.__encode(self.getRuleName(position))
+            if current < wanted:
+                low = middle + 1
+            elif current > wanted:
+                high = middle
+            else:
+                return position
+        return -1
+
+    '''
+    getRuleByName: will return the Rule object of a rule using the name index, or None when the rule is not in the snapshot
+
+        getRuleByName args:
+            ruleName => name of the rule (string)
+    '''
+    def getRuleByName(self, ruleName):
+        position = self.findRule(ruleName)
+        if position == -1:
+            return None
+        return self.getRule(position)
+
+    '''
+    getString: will return a string of the string table
+
+        getString args:
+            number => number of the string (int)
+    '''
+    def getString(self, number):
+        if number == self.NONE:
+            return None
+        if number not in self.strings:
+            start, end = struct.unpack_from("<II", self.data, self.stringTablePos + 4 * number)
+            raw = self.data[self.stringDataPos + start:self.stringDataPos + end]
+            if str is bytes:
+                self.strings[number] = raw
+            else:
+                self.strings[number] = raw.decode('utf-8')
+        return self.strings[number]
+
+    '''
+    diff: will compare this snapshot with another one and return the (added, removed, changed) rule names
+
+        diff args:
+            other => older snapshot to compare with (Snapshot object)
+    '''
+    def diff(self, other):
+        added = []
+        changed = []
+        names = set()
+        for position in range(self.ruleCount):
+            ruleName = self.getRuleName(position)
+            names.add(ruleName)
+            otherPosition = other.findRule(ruleName)
+            if otherPosition == -1:
+                added.append(ruleName)
+            elif other.getRuleValues(otherPosition) != self.getRuleValues(position):
+                changed.append(ruleName)
+        removed = [ruleName for ruleName in other.getRuleNames() if ruleName not in names]
+        return (added, removed, changed)
+
+    # These methods let the snapshot be used like the list of the loaded rules
+    def __len__(self):
+        return self.ruleCount
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self.getRule(index) for index in range(*position.indices(self.ruleCount))]
+        if position < 0:
+            position = position + self.ruleCount
+        return self.getRule(position)
+
+    def __iter__(self):
+        for position in range(self.ruleCount):
+            yield self.getRule(position)
+
+    # This method will return the header of the snapshot, raises a ValueError when the file is not a snapshot it can read
+    def __readHeader(self):
+        if len(self.data) < self.HEADER.size:
+            raise ValueError("'" + self.path + "' is not a rulebase snapshot")
+        header = self.HEADER.unpack_from(self.data, 0)
+        if header[0] != self.MAGIC:
+            raise ValueError("'" + self.path + "' is not a rulebase snapshot")
+        if header[1] != self.VERSION:
+            raise ValueError("Snapshot version " + str(header[1]) + " is not supported")
+        return header
+
+    # This method will return the number of a string, adding it to the string table the first time it is seen
+    @staticmethod
+    def __getStringNumber(value, stringNumbers, strings):
+        if value is None:
+            return Snapshot.NONE
+        if value not in stringNumbers:
+            stringNumbers[value] = len(strings)
+            strings.append(Snapshot.__encode(value))
+        return stringNumbers[value]
+
+    # This method will return the utf-8 bytes of a string
+    @staticmethod
+    def __encode(value):
+        if isinstance(value, bytes):
+            return value
+        return value.encode('utf-8')
@@ -0,0 +1,253 @@
+from collections import OrderedDict
+from xml.sax.saxutils import escape, quoteattr
+import threading
+import time
+class UserIDBuffer:
+    '''
+    This class will be used to send many User-ID changes (IP address tags for dynamic address groups, user logins
+    and logouts) to the PaloAlto in a few big uid-message requests
+
+    Changes are buffered and only the latest change of every IP address / tag (or user / IP address) pair is kept.
+    A background thread sends them maxEntries at a time as soon as maxEntries changes are waiting or the oldest
+    waiting change is maxDelay seconds old.  When maxPending changes are waiting, the callers adding changes wait
+    until some were sent, so the buffer never grows faster than the PaloAlto takes the changes.
+
+    A failed request is not retried, its changes are lost and the error is raised to the next caller of a method
+    adding, flushing or closing.
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    pa = None # PaAPI object the changes are sent to
+    maxEntries = 1000 # Upper bound of the number of changes sent in a single request
+    maxDelay = 1.0 # Upper bound of the seconds a change waits before it is sent
+    maxPending = 10000 # Number of waiting changes that makes the callers adding changes wait
+    pending = None # Latest waiting change of every key: (kind, ...) => (operation, value)
+    firstPending = 0.0 # When the oldest waiting change was added
+    sending = 0 # Number of changes being sent
+    flushing = 0 # Number of callers waiting in flush, waiting changes are then sent right away
+    error = None # Error of the last failed request, raised to the next caller
+    closed = False
+    messageCount = 0 # Number of requests sent
+    entryCount = 0 # Number of changes sent
+
+    '''
+    Constructor: will create and return a UserIDBuffer object and start its sending thread
+
+        Constructor args:
+            pa => connection to the PaloAlto the changes are sent to (PaAPI object)
+            maxEntries => upper bound of the number of changes sent in a single request (int)
+            maxDelay => upper bound of the seconds a change waits before it is sent (float)
+            maxPending => number of waiting changes that makes the callers adding changes wait (int)
+    '''
+    def __init__(self, pa, maxEntries=1000, maxDelay=1.0, maxPending=10000):
+        if type(maxEntries) is not int or type(maxPending) is not int:
+            raise TypeError("Type must be an int")
+        if maxEntries < 1 or maxPending < maxEntries:
+            raise ValueError("maxEntries must be at least 1 and maxPending at least maxEntries")
+        if maxDelay < 0:
+            raise ValueError("Value must be 0 or greater")
+        self.pa = pa
+        self.maxEntries = maxEntries
+        self.maxDelay = float(maxDelay)
+        self.maxPending = maxPending
+        self.pending = OrderedDict()
+        self.firstPending = 0.0
+        self.sending = 0
+        self.flushing = 0
+        self.error = None
+        self.closed = False
+        self.messageCount = 0
+        self.entryCount = 0
+        self.condition = threading.Condition()
+        self.thread = threading.Thread(target=self.__run)
+        self.thread.daemon = True
+        self.thread.start()
+
+    ### Methods for adding changes ###
+    '''
+    registerIP: will tag an IP address, the IP address joins the dynamic address groups matching the tags
+
+        registerIP args:
+            ip => IP address (string)
+            tags => tags added to the IP address (list of strings)
+    '''
+    def registerIP(self, ip, tags):
+        if type(tags) is not list:
+            raise TypeError("Type must be a list")
+        self.__add([(("tag", ip, tag), ("register", None)) for tag in tags])
+
+    '''
+    unregisterIP: will remove tags from an IP address
+
+        unregisterIP args:
+            ip => IP address (string)
+            tags => tags removed from the IP address (list of strings)
+    '''
+    def unregisterIP(self, ip, tags):
+        if type(tags) is not list:
+            raise TypeError("Type must be a list")
+        self.__add([(("tag", ip, tag), ("unregister", None)) for tag in tags])
+
+    '''
+    login: will map an IP address to a user
+
+        login args:
+            user => name of the user, e.g. 'domain\\user' (string)
+            ip => IP address (string)
+            timeout => minutes before the mapping expires, the timeout of the PaloAlto when not given (int)
+    '''
+    def login(self, user, ip, timeout=None):
+        self.__add([(("user", user, ip), ("login", timeout))])
+
+    '''
+    logout: will remove the mapping of an IP address to a user
+
+        logout args:
+            user => name of the user (string)
+            ip => IP address (string)
+    '''
+    def logout(self, user, ip):
+        self.__add([(("user", user, ip), ("logout", None))])
+
+    '''
+    flush: will send every waiting change and wait until they are sent
+    '''
+    def flush(self):
+        with self.condition:
+            self.flushing = self.flushing + 1
+            self.condition.notify_all()
+            try:
+                while self.pending or self.sending:
+                    self.__raiseError()
+                    self.condition.wait()
+                self.__raiseError()
+            finally:
+                self.flushing = self.flushing - 1
+
+    '''
+    close: will send every waiting change and stop the sending thread
+    '''
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            with self.condition:
+                self.closed = True
+                self.condition.notify_all()
+            self.thread.join()
+
+    ### Get Methods ###
+    '''
+    getPendingCount: will return the number of changes waiting to be sent
+    '''
+    def getPendingCount(self):
+        return len(self.pending)
+
+    '''
+    getMessageCount: will return the number of requests sent
+    '''
+    def getMessageCount(self):
+        return self.messageCount
+
+    '''
+    getEntryCount: will return the number of changes sent
+    '''
+    def getEntryCount(self):
+        return self.entryCount
+
+    '''
+    genMessageXML: will return the uid-message sending a list of changes
+
+        genMessageXML args:
+            changes => (key, (operation, value)) tuples, see pending (list)
+    '''
+    def genMessageXML(self, changes):
+        sections = OrderedDict([("register", OrderedDict()), ("unregister", OrderedDict()), ("login", []), ("logout", [])])
+        for key, change in changes:
+            if key[0] == "tag":
+                sections[change[0]].setdefault(key[1], []).append(key[2])
+            else:
+                sections[change[0]].append((key[1], key[2], change[1]))
+
+        payload = ""
+        for operation in ("register", "unregister"):
+            if sections[operation]:
+                payload = payload + "<" + operation + ">"
+                for ip in sections[operation]:
+                    payload = payload + "<entry ip=" + quoteattr(ip) + "><tag>"
+                    for tag in sections[operation][ip]:
+                        payload = payload + "<member>" + escape(tag) + "</member>"
+                    payload = payload + "</tag></entry>"
+                payload = payload + "</" + operation + ">"
+        for operation in ("login", "logout"):
+            if sections[operation]:
+                payload = payload + "<" + operation + ">"
+                for user, ip, timeout in sections[operation]:
+                    payload = payload + "<entry name=" + quoteattr(user) + " ip=" + quoteattr(ip)
+                    if timeout is not None:
+                        payload = payload + " timeout=" + quoteattr(str(timeout))
+                    payload = payload + "/>"
+                payload = payload + "</" + operation + ">"
+        return "<uid-message><version>1.0</version><type>update</type><payload>" + payload + "</payload></uid-message>"
+
+    # This method will add changes to the buffer, waiting while the buffer is full
+    def __add(self, changes):
+        with self.condition:
+            self.__raiseError()
+            if self.closed:
+                raise ValueError("The buffer is closed")
+            for key, change in changes:
+                while len(self.pending) >= self.maxPending and key not in self.pending:
+                    self.condition.wait()
+                    self.__raiseError()
+                if not self.pending:
+                    # The sending thread waits for the first change to know when maxDelay is over
+                    self.firstPending = time.time()
+                    self.condition.notify_all()
+                # The latest change of a key replaces the waiting one and goes to the end of the buffer
+                self.pending.pop(key, None)
+                self.pending[key] = change
+            if len(self.pending) >= self.maxEntries:
+                self.condition.notify_all()
+
+    # This method will raise the error of the last failed request (once)
+    def __raiseError(self):
+        if self.error is not None:
+            error = self.error
+            self.error = None
+            raise error
+
+    # This method is run by the sending thread
+    def __run(self):
+        with self.condition:
+            while True:
+                while not self.pending and not self.closed:
+                    self.condition.wait()
+                if not self.pending:
+                    return
+                deadline = self.firstPending + self.maxDelay
+                now = time.time()
+                if len(self.pending) < self.maxEntries and now < deadline and not self.flushing and not self.closed:
+                    self.condition.wait(deadline - now)
+                    continue
+                changes = []
+                while self.pending and len(changes) < self.maxEntries:
+                    changes.append(self.pending.popitem(False))
+                self.sending = len(changes)
+                self.condition.notify_all()
+                self.condition.release()
+                try:
+                    self.pa.sendUserIDMessage(self.genMessageXML(changes))
+                except Exception as e:
+                    self.error = e
+                finally:
+                    self.condition.acquire()
+                    self.sending = 0
+                    if self.error is None:
+                        self.messageCount = self.messageCount + 1
+                        self.entryCount = self.entryCount + len(changes)
+                    self.condition.notify_all()
@@ -0,0 +1,134 @@
+import unittest
+import asyncio
+import os
+import tempfile
+from AsyncPaAPI import *
+class testAsyncPaAPI (unittest.TestCase):
+    '''
+    Class for testing the AsyncPaAPI.py Class which is part of the PaloAlto API project
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    apiKeyFile = "paconnect.conf"
+
+    # the asynchronous client must load the same rules as the blocking one
+    def test_loadFireWallRules(self):
+        pa = PaAPI (self.apiKeyFile)
+        asyncPa = asyncio.run(AsyncPaAPI.connect(self.apiKeyFile))
+        self.assertEqual([rule.getRuleName() for rule in asyncPa.getFireWallRules()], [rule.getRuleName() for rule in pa.getFireWallRules()])
+
+    # many concurrent report requests on one event loop
+    def test_concurrentDynamicReports(self):
+        async def getReports():
+            asyncPa = AsyncPaAPI (self.apiKeyFile)
+            return await asyncio.gather(*[asyncPa.getDynamicReport("top-app-summary", "last-hour", "5") for i in range(20)])
+        reports = asyncio.run(getReports())
+        self.assertEqual(len(reports), 20)
+        for report in reports:
+            for entry in report:
+                self.assertEqual(entry.getReportName(), "top-app-summary")
+
+    ## Tests against a local HTTP server, the answers of the PaloAlto are given by the tests ##
+    # runs test(asyncPa) with an AsyncPaAPI object whose requests are answered by answer(path) => (status, body)
+    def runOffline(self, answer, test):
+        self.paths = []
+        self.connections = 0
+        async def handle(reader, writer):
+            self.connections = self.connections + 1
+            while True:
+                requestLine = await reader.readline()
+                if not requestLine:
+                    break
+                while (await reader.readline()) not in (b"\r\n", b""):
+                    pass
+                self.paths.append(requestLine.split()[1].decode("utf-8"))
+                status, body = answer(self.paths[-1])
+                writer.write(("HTTP/1.1 " + status + "\r\nContent-Length: " + str(len(body)) + "\r\n\r\n").encode("utf-8") + body)
+                await writer.drain()
+            writer.close()
+        async def run():
+            server = await asyncio.start_server(handle, "127.0.0.1", 0)
+            directory = tempfile.mkdtemp()
+            apiKeyFile = os.path.join(directory, "paconnect.conf")
+            confFile = open(apiKeyFile, 'w')
+            confFile.write("baseurl=http://127.0.0.1:" + str(server.sockets[0].getsockname()[1]) + "/\napikey=KEY\nretries=2\nbackoff=0\ncommitwindow=0\ncompression=no\n")
+            confFile.close()
+            try:
+                asyncPa = AsyncPaAPI(apiKeyFile)
+                try:
+                    return await test(asyncPa)
+                finally:
+                    await asyncPa.close()
+            finally:
+                server.close()
+                await server.wait_closed()
+                os.remove(apiKeyFile)
+                os.rmdir(directory)
+        return asyncio.run(run())
+
+    def test_connectionReuse(self):
+        answer = lambda path: ("200 OK", b"<response status='success'><result><rules/></result></response>")
+        async def test(asyncPa):
+            for i in range(3):
+                await asyncPa.loadFireWallRules()
+        self.runOffline(answer, test)
+        self.assertEqual((len(self.paths), self.connections), (3, 1))
+
+    def test_clientError_notRetried(self):
+        answer = lambda path: ("403 Forbidden", b"<response status='error'/>")
+        async def test(asyncPa):
+            with self.assertRaises(HTTPError) as error:
+                await asyncPa.loadFireWallRules()
+            self.assertEqual(error.exception.code, 403)
+            return asyncPa.circuitBreaker.failures
+        self.assertEqual(self.runOffline(answer, test), 0)
+        self.assertEqual(len(self.paths), 1)
+
+    def test_writeDeleteFireWallRule_updatesLoadedRules(self):
+        answer = lambda path: ("200 OK", b"<response status='success' code='20'><msg>command succeeded</msg></response>")
+        rule = Rules("ssh", ["trust"], ["untrust"], ["admins"], ["any"], ["any"], ["ssh"], "allow", ["any"], "no", "no", "no", "no", [], [], "no", "yes", "")
+        async def test(asyncPa):
+            await asyncPa.writeFireWallRule(rule)
+            written = ([loaded.getRuleName() for loaded in asyncPa.getFireWallRules()], [found.getRuleName() for found in asyncPa.findFireWallRules(("app", "ssh"))])
+            await asyncPa.deleteFireWallRule(rule)
+            return (written, asyncPa.getFireWallRules(), asyncPa.findFireWallRules(("app", "ssh")))
+        self.assertEqual(self.runOffline(answer, test), ((["ssh"], ["ssh"]), [], []))
+
+    def test_loadFireWallRules_otherEventLoop(self):
+        answer = lambda path: ("200 OK", b"<response status='success'><result><rules/></result></response>")
+        async def test(asyncPa):
+            await asyncPa.loadFireWallRules()
+            await asyncio.get_running_loop().run_in_executor(None, asyncio.run, asyncPa.loadFireWallRules())
+            await asyncPa.loadFireWallRules()
+        self.runOffline(answer, test)
+        self.assertEqual((len(self.paths), self.connections), (3, 3))
+
+    def test_requestCommit(self):
+        def answer(path):
+            if "type=commit" in path:
+                return ("200 OK", b"<response status='success'><result><msg><line>Commit job enqueued with jobid 7</line></msg><job>7</job></result></response>")
+            return ("200 OK", b"<response status='success'><result><job><id>7</id><status>FIN</status><result>OK</result>" +
+                    b"<details><line>Configuration committed successfully</line></details></job></result></response>")
+        async def test(asyncPa):
+            asyncPa.jobPollInterval = 0.0
+            return await asyncPa.requestCommit()
+        self.assertEqual(self.runOffline(answer, test), "Configuration committed successfully")
+
+    def test_blockingMethods_notImplemented(self):
+        asyncPa = AsyncPaAPI (self.apiKeyFile)
+        with self.assertRaises(NotImplementedError):
+            asyncPa.createChangeSet()
+        with self.assertRaises(NotImplementedError):
+            asyncPa.createRuleWatcher()
+
+    def test_type_getDynamicReport_ValueErrorHandle(self):
+        asyncPa = AsyncPaAPI (self.apiKeyFile)
+        with self.assertRaises(ValueError):
+            asyncio.run(asyncPa.getDynamicReport("blah", "", ""))
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,152 @@
+import unittest
+from ChangeSet import *
+from Rules import *
+from RuleValidator import *
+class testChangeSet (unittest.TestCase):
+    '''
+    Class for testing the ChangeSet.py Class which is part of the PaloAlto API project
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    # stands in for the PaAPI object, records the requests it would send
+    class FakePaAPI:
+        def __init__(self, failures=None):
+            self.ruleValidator = None
+            self.sent = []
+            self.failures = failures or {} # request => error raised when it is sent
+
+        def send(self, request):
+            self.sent.append(request)
+            if request[0] in self.failures:
+                raise self.failures[request[0]]
+
+        def deleteFireWallRules(self, rules):
+            self.send(("delete", [rule.getRuleName() for rule in rules]))
+
+        def writeFireWallRules(self, rules):
+            self.send(("create", [rule.getRuleName() for rule in rules]))
+
+        def editFireWallRule(self, rule):
+            self.send(("edit", rule.getRuleName()))
+
+        def moveFireWallRule(self, rule, where, dst=None):
+            self.send(("move", rule.getRuleName(), where, dst))
+
+        def commitAndWait(self):
+            self.send(("commit",))
+            return "Configuration committed successfully"
+
+        def revertFireWallConfiguration(self):
+            self.send(("revert",))
+
+        def loadFireWallRules(self):
+            self.send(("load",))
+
+    # returns a change set of the fake PaAPI object deleting b, creating a and c, updating d and moving c to the top
+    def newChangeSet(self, pa):
+        changeSet = ChangeSet(pa)
+        changeSet.createRule(self.ruleA)
+        changeSet.moveRule(self.newRule("c"), "top")
+        changeSet.updateRule(self.newRule("d"))
+        changeSet.deleteRule(self.ruleB)
+        changeSet.createRule(self.newRule("c"))
+        return changeSet
+
+    def newRule(self, name):
+        return Rules(name, ["trust"], ["untrust"], ["any"], ["any"], ["any"], ["any"], "allow", ["any"], "no", "no", "no", "no", [], [], "no", "yes", "")
+
+    def setUp(self):
+        self.changeSet = ChangeSet(None)
+        self.ruleA = self.newRule("a")
+        self.ruleB = self.newRule("b")
+
+    def test_isEmpty(self):
+        self.assertTrue(self.changeSet.isEmpty())
+        self.changeSet.createRule(self.ruleA)
+        self.assertFalse(self.changeSet.isEmpty())
+
+    def test_createThenUpdateIsCreate(self):
+        self.changeSet.createRule(self.ruleA)
+        updated = self.newRule("a")
+        self.changeSet.updateRule(updated)
+        self.assertEqual(self.changeSet.getCreates(), [updated])
+        self.assertEqual(self.changeSet.getUpdates(), [])
+
+    def test_createThenDeleteCancels(self):
+        self.changeSet.createRule(self.ruleA)
+        self.changeSet.moveRule(self.ruleA, "top")
+        self.changeSet.deleteRule(self.ruleA)
+        self.assertTrue(self.changeSet.isEmpty())
+
+    def test_deleteThenCreateIsUpdate(self):
+        self.changeSet.deleteRule(self.ruleA)
+        self.changeSet.createRule(self.ruleA)
+        self.assertEqual(self.changeSet.getUpdates(), [self.ruleA])
+        self.assertEqual(self.changeSet.getDeletes(), [])
+
+    def test_updateThenDeleteIsDelete(self):
+        self.changeSet.updateRule(self.ruleA)
+        self.changeSet.deleteRule(self.ruleA)
+        self.assertEqual(self.changeSet.getDeletes(), [self.ruleA])
+        self.assertEqual(self.changeSet.getUpdates(), [])
+
+    def test_deleteDropsMovesOfRule(self):
+        self.changeSet.moveRule(self.ruleA, "after", "b")
+        self.changeSet.moveRule(self.ruleB, "top")
+        self.changeSet.deleteRule(self.ruleB)
+        self.assertEqual(self.changeSet.getMoves(), [])
+
+    def test_getMoves(self):
+        self.changeSet.moveRule(self.ruleA, "before", "b")
+        self.changeSet.moveRule(self.ruleB, "bottom")
+        self.assertEqual(self.changeSet.getMoves(), [("a", "before", "b"), ("b", "bottom", None)])
+
+    def test_commit_order(self):
+        pa = self.FakePaAPI()
+        changeSet = self.newChangeSet(pa)
+        self.assertEqual(changeSet.commit(), "Configuration committed successfully")
+        self.assertEqual(pa.sent, [("delete", ["b"]), ("create", ["a", "c"]), ("edit", "d"), ("move", "c", "top", None), ("commit",)])
+        self.assertTrue(changeSet.isEmpty())
+
+    def test_commit_rollback(self):
+        pa = self.FakePaAPI({"edit": ValueError("rule 'd' is not valid")})
+        changeSet = self.newChangeSet(pa)
+        with self.assertRaises(ValueError):
+            changeSet.commit()
+        self.assertEqual(pa.sent, [("delete", ["b"]), ("create", ["a", "c"]), ("edit", "d"), ("revert",), ("load",)])
+        self.assertFalse(changeSet.isEmpty())
+
+    def test_commit_rollbackFails(self):
+        pa = self.FakePaAPI({"commit": ValueError("commit failed"), "revert": IOError("connection refused")})
+        changeSet = self.newChangeSet(pa)
+        with self.assertRaises(ValueError) as error:
+            changeSet.commit()
+        self.assertEqual(str(error.exception), "commit failed")
+        self.assertEqual(pa.sent[-3:], [("commit",), ("revert",), ("load",)])
+
+    def test_commit_invalidRule(self):
+        pa = self.FakePaAPI()
+        pa.ruleValidator = RuleValidator({"zone": ["trust"]})
+        changeSet = ChangeSet(pa)
+        changeSet.deleteRule(self.ruleB)
+        changeSet.createRule(self.ruleA)
+        with self.assertRaises(ValueError):
+            changeSet.commit()
+        # nothing was sent, so nothing had to be reverted
+        self.assertEqual(pa.sent, [])
+        self.assertFalse(changeSet.isEmpty())
+
+    def test_where_moveRule_ValueErrorHandle(self):
+        with self.assertRaises(ValueError):
+            self.changeSet.moveRule(self.ruleA, "middle")
+
+    def test_dst_moveRule_ValueErrorHandle(self):
+        with self.assertRaises(ValueError):
+            self.changeSet.moveRule(self.ruleA, "after")
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,97 @@
+import unittest
+import threading
+import time
+from CommitScheduler import *
+class testCommitScheduler (unittest.TestCase):
+    '''
+    Class for testing the CommitScheduler.py Class which is part of the PaloAlto API project
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    def setUp(self):
+        self.commits = []
+        self.failing = False
+
+    def commit(self):
+        self.commits.append(time.time())
+        time.sleep(0.1)
+        return "Commit job " + str(len(self.commits))
+
+    def failedCommit(self):
+        raise ValueError("Validation Error")
+
+    # requests every request from its own thread, waiting delay seconds between two requests
+    def request(self, scheduler, count, delay=0.0):
+        results = []
+        threads = []
+        def run():
+            try:
+                results.append(scheduler.requestCommit(self.commit if not self.failing else self.failedCommit))
+            except ValueError as e:
+                results.append(e)
+        for n in range(count):
+            thread = threading.Thread(target=run)
+            thread.start()
+            threads.append(thread)
+            time.sleep(delay)
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_requestCommit(self):
+        scheduler = CommitScheduler(0.05)
+        self.assertEqual(scheduler.requestCommit(self.commit), "Commit job 1")
+        self.assertEqual(scheduler.getCommitCount(), 1)
+
+    def test_requestCommit_coalesced(self):
+        scheduler = CommitScheduler(0.2)
+        results = self.request(scheduler, 10, 0.01)
+        self.assertEqual(results, ["Commit job 1"] * 10)
+        self.assertEqual(scheduler.getRequestCount(), 10)
+        self.assertEqual(scheduler.getCommitCount(), 1)
+
+    def test_requestCommit_maxDelay(self):
+        scheduler = CommitScheduler(0.1, 0.2)
+        start = time.time()
+        results = self.request(scheduler, 8, 0.05)
+        # requests keep arriving inside the window, the first commit starts at maxDelay anyway
+        self.assertTrue(self.commits[0] - start < 0.3)
+        self.assertEqual(len(self.commits), 2)
+        self.assertEqual(sorted(set(results)), ["Commit job 1", "Commit job 2"])
+
+    def test_requestCommit_whileRunning(self):
+        scheduler = CommitScheduler(0.0)
+        results = self.request(scheduler, 3, 0.03)
+        # the second request arrives during the first commit, the third joins its batch
+        self.assertEqual(results, ["Commit job 1", "Commit job 2", "Commit job 2"])
+        self.assertTrue(self.commits[1] - self.commits[0] >= 0.1)
+
+    def test_requestCommit_firstCommitRuns(self):
+        scheduler = CommitScheduler(0.2)
+        results = []
+        other = threading.Thread(target=lambda: results.append(scheduler.requestCommit(lambda: "other commit")))
+        first = threading.Thread(target=lambda: results.append(scheduler.requestCommit(self.commit)))
+        first.start()
+        time.sleep(0.05)
+        other.start()
+        first.join()
+        other.join()
+        self.assertEqual(results, ["Commit job 1", "Commit job 1"])
+
+    def test_requestCommit_error(self):
+        scheduler = CommitScheduler(0.1)
+        self.failing = True
+        results = self.request(scheduler, 3)
+        self.assertEqual([str(result) for result in results], ["Validation Error"] * 3)
+        self.assertEqual(scheduler.getCommitCount(), 1)
+
+    def test_value_CommitScheduler_ValueErrorHandle(self):
+        with self.assertRaises(ValueError):
+            CommitScheduler(-1)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
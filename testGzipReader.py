@@ -0,0 +1,63 @@
+import unittest
+import gzip
+from io import BytesIO
+from GzipReader import *
+class testGzipReader (unittest.TestCase):
+    '''
+    Class for testing the GzipReader.py Class which is part of the PaloAlto API project
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    body = b"<report>" + b"".join([b"<entry><app>app" + str(n).encode('ascii') + b"</app></entry>" for n in range(5000)]) + b"</report>"
+
+    def compress(self, data):
+        compressed = BytesIO()
+        gzipFile = gzip.GzipFile(fileobj=compressed, mode='wb')
+        gzipFile.write(data)
+        gzipFile.close()
+        return compressed.getvalue()
+
+    def test_decompress(self):
+        self.assertEqual(GzipReader.decompress(self.compress(self.body)), self.body)
+
+    def test_read(self):
+        reader = GzipReader(BytesIO(self.compress(self.body)))
+        reader.chunkSize = 100
+        self.assertEqual(reader.read(), self.body)
+        self.assertEqual(reader.read(), b"")
+
+    def test_read_size(self):
+        reader = GzipReader(BytesIO(self.compress(self.body)))
+        reader.chunkSize = 100
+        chunks = []
+        while True:
+            chunk = reader.read(1000)
+            self.assertTrue(len(chunk) <= 1000)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        self.assertEqual(b"".join(chunks), self.body)
+
+    def test_read_decompressesOnlySize(self):
+        reader = GzipReader(BytesIO(self.compress(self.body)))
+        reader.chunkSize = len(self.body)
+        self.assertEqual(reader.read(10), self.body[:10])
+        self.assertTrue(reader.decompressor.unconsumed_tail)
+        self.assertEqual(reader.read(), self.body[10:])
+
+    def test_read_iterparse(self):
+        import xml.etree.ElementTree as ET
+        apps = [elem.text for event, elem in ET.iterparse(GzipReader(BytesIO(self.compress(self.body)))) if elem.tag == 'app']
+        self.assertEqual(len(apps), 5000)
+        self.assertEqual(apps[-1], "app4999")
+
+    def test_read_invalid(self):
+        with self.assertRaises(zlib.error):
+            GzipReader(BytesIO(b"<report/>")).read()
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,92 @@
+import unittest
+import xml.etree.ElementTree as ET
+from NatRules import *
+class testNatRules (unittest.TestCase):
+    '''
+    Class for testing the NatRules.py Class which is part of the PaloAlto API project
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    def newRule(self, srcTransType="dynamic-ip-and-port", srcTransAddr=["1.2.3.4"], dstTransAddr="", dstTransPort="", srcTransInterface="", srcTransBiDirectional=""):
+        return NatRules("nat", ["trust"], ["untrust"], ["10.0.0.0/8"], ["any"], "any", "ethernet1/1", srcTransType, srcTransAddr, dstTransAddr, dstTransPort, "no", "outbound", srcTransInterface,
+                        srcTransBiDirectional)
+
+    def assertSameRule(self, rule, parsed):
+        self.assertEqual(parsed.genRuleXML(), rule.genRuleXML())
+        self.assertEqual(parsed.getRuleSourceTranslationAddress(), rule.getRuleSourceTranslationAddress())
+        self.assertEqual(parsed.getRuleSourceTranslationInterface(), rule.getRuleSourceTranslationInterface())
+        self.assertEqual(parsed.getRuleSourceTranslationBiDirectional(), rule.getRuleSourceTranslationBiDirectional())
+
+    def test_genRuleNameXML(self):
+        self.assertEqual(self.newRule().genRuleNameXML(), "[@name='nat']")
+
+    def test_genRuleServiceXML(self):
+        self.assertEqual(self.newRule().genRuleServiceXML(), "<service>any</service>")
+
+    def test_genRuleSourceTranslationXML_dynamic(self):
+        self.assertEqual(self.newRule().genRuleSourceTranslationXML(), "<source-translation><dynamic-ip-and-port><translated-address><member>1.2.3.4</member></translated-address></dynamic-ip-and-port></source-translation>")
+
+    def test_genRuleSourceTranslationXML_static(self):
+        self.assertEqual(self.newRule("static-ip").genRuleSourceTranslationXML(), "<source-translation><static-ip><translated-address>1.2.3.4</translated-address></static-ip></source-translation>")
+
+    def test_genRuleSourceTranslationXML_staticBiDirectional(self):
+        self.assertEqual(self.newRule("static-ip", ["1.2.3.4"], "", "", "", "yes").genRuleSourceTranslationXML(), "<source-translation><static-ip><translated-address>1.2.3.4</translated-address><bi-directional>yes</bi-directional></static-ip></source-translation>")
+
+    def test_genRuleSourceTranslationXML_none(self):
+        self.assertEqual(self.newRule("none", []).genRuleSourceTranslationXML(), "")
+
+    def test_genRuleSourceTranslationXML_interface(self):
+        self.assertEqual(self.newRule("dynamic-ip-and-port", [], "", "", "ethernet1/1").genRuleSourceTranslationXML(), "<source-translation><dynamic-ip-and-port><interface-address><interface>ethernet1/1</interface></interface-address></dynamic-ip-and-port></source-translation>")
+
+    def test_genRuleSourceTranslationXML_interfaceAddress(self):
+        self.assertEqual(self.newRule("dynamic-ip-and-port", ["1.2.3.4/24"], "", "", "ethernet1/1").genRuleSourceTranslationXML(), "<source-translation><dynamic-ip-and-port><interface-address><interface>ethernet1/1</interface><ip>1.2.3.4/24</ip></interface-address></dynamic-ip-and-port></source-translation>")
+
+    def test_genRuleDestinationTranslationXML(self):
+        self.assertEqual(self.newRule("none", [], "10.1.1.1", "8080").genRuleDestinationTranslationXML(), "<destination-translation><translated-address>10.1.1.1</translated-address><translated-port>8080</translated-port></destination-translation>")
+
+    def test_genRuleXML(self):
+        self.assertEqual(self.newRule("none", []).genRuleXML(), "<entry name='nat'><from><member>trust</member></from><to><member>untrust</member></to><source><member>10.0.0.0/8</member></source><destination><member>any</member></destination><service>any</service><to-interface>ethernet1/1</to-interface><disabled>no</disabled><description>outbound</description></entry>")
+
+    def test_parseEntry(self):
+        for rule in [self.newRule(), self.newRule("static-ip"), self.newRule("dynamic-ip", ["1.2.3.4", "1.2.3.5"]), self.newRule("none", [], "10.1.1.1", "8080"),
+                     self.newRule("dynamic-ip-and-port", [], "", "", "ethernet1/1"), self.newRule("dynamic-ip-and-port", ["1.2.3.4/24"], "", "", "ethernet1/1"),
+                     self.newRule("static-ip", ["1.2.3.4"], "", "", "", "no")]:
+            self.assertSameRule(rule, NatRules.parseEntry(ET.fromstring(rule.genRuleXML())))
+
+    def test_rulebase(self):
+        self.assertEqual(self.newRule().rulebase, "nat")
+
+    def test_value_NatRules_ValueErrorHandle(self):
+        with self.assertRaises(ValueError):
+            self.newRule("masquerade")
+
+    def test_value_dynamicBiDirectional_ValueErrorHandle(self):
+        with self.assertRaises(ValueError):
+            self.newRule("dynamic-ip", ["1.2.3.4"], "", "", "", "yes")
+
+    def test_value_staticWithoutAddress_ValueErrorHandle(self):
+        with self.assertRaises(ValueError):
+            self.newRule("static-ip", [])
+
+    def test_value_staticManyAddresses_ValueErrorHandle(self):
+        with self.assertRaises(ValueError):
+            self.newRule("static-ip", ["1.2.3.4", "1.2.3.5"])
+
+    def test_value_dynamicWithoutAddress_ValueErrorHandle(self):
+        with self.assertRaises(ValueError):
+            self.newRule("dynamic-ip", [])
+
+    def test_value_interfaceWithoutPort_ValueErrorHandle(self):
+        with self.assertRaises(ValueError):
+            self.newRule("dynamic-ip", [], "", "", "ethernet1/1")
+
+    def test_type_setRuleSourceTranslation_TypeErrorHandle(self):
+        with self.assertRaises(TypeError):
+            self.newRule().setRuleSourceTranslation("dynamic-ip", "1.2.3.4")
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
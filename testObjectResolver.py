@@ -0,0 +1,87 @@
+import unittest
+from ObjectResolver import *
+from Rules import *
+class testObjectResolver (unittest.TestCase):
+    '''
+    Class for testing the ObjectResolver.py Class which is part of the PaloAlto API project
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    def setUp(self):
+        self.objects = ObjectResolver()
+        self.objects.setAddress("web1", "ip-netmask", "10.0.0.1")
+        self.objects.setAddress("web2", "ip-netmask", "10.0.0.2/32")
+        self.objects.setAddress("lan", "ip-netmask", "192.168.0.0/24")
+        self.objects.setAddress("dhcp", "ip-range", "192.168.1.10-192.168.1.20")
+        self.objects.setAddress("site", "fqdn", "www.example.com")
+        self.objects.setAddressGroup("web", ["web1", "web2"])
+        self.objects.setAddressGroup("inside", ["web", "lan", "dhcp", "site"])
+        self.objects.setAddressGroup("tagged", None)
+        self.objects.setService("web-ports", "tcp", "80,8000-8080")
+        self.objects.setService("dns", "udp", "53")
+        self.objects.setServiceGroup("common", ["web-ports", "dns", "service-https"])
+
+    def ip(self, value):
+        parts = [int(part) for part in value.split(".")]
+        return (parts[0] << 24) + (parts[1] << 16) + (parts[2] << 8) + parts[3]
+
+    def test_resolveAddresses_nestedGroups(self):
+        ranges, unresolved = self.objects.resolveAddresses(["inside"])
+        self.assertEqual(ranges, [
+                                  (4, self.ip("10.0.0.1"), self.ip("10.0.0.2")),
+                                  (4, self.ip("192.168.0.0"), self.ip("192.168.0.255")),
+                                  (4, self.ip("192.168.1.10"), self.ip("192.168.1.20"))
+                                  ])
+        self.assertEqual(unresolved, ["site"])
+
+    def test_resolveAddresses_literalsAndAny(self):
+        self.assertEqual(self.objects.resolveAddresses(["10.1.0.0/16"])[0], [(4, self.ip("10.1.0.0"), self.ip("10.1.255.255"))])
+        self.assertEqual(self.objects.resolveAddresses(["any"])[0], ObjectResolver.ANY_ADDRESS)
+        self.assertEqual(self.objects.resolveAddresses(["2001:db8::/127"])[0], [(6, 0x20010db8 << 96, (0x20010db8 << 96) + 1)])
+
+    def test_resolveAddresses_unresolved(self):
+        self.assertEqual(self.objects.resolveAddresses(["tagged", "nowhere"]), ([], ["nowhere", "tagged"]))
+
+    def test_resolveServices(self):
+        ranges, unresolved = self.objects.resolveServices(["common", "application-default"])
+        self.assertEqual(ranges, [("tcp", 80, 80), ("tcp", 443, 443), ("tcp", 8000, 8080), ("udp", 53, 53)])
+        self.assertEqual(unresolved, ["application-default"])
+
+    def test_resolveRule(self):
+        rule = Rules("test", ["trust"], ["untrust"], ["web"], ["any"], ["dns"], ["any"], "allow", ["any"], "no", "no", "no", "no", [], [], "no", "yes", "")
+        resolved = self.objects.resolveRule(rule)
+        self.assertEqual(resolved["src"][0], [(4, self.ip("10.0.0.1"), self.ip("10.0.0.2"))])
+        self.assertEqual(resolved["srv"], ([("udp", 53, 53)], []))
+
+    def test_changeInvalidatesGroups(self):
+        self.objects.resolveAddresses(["inside"])
+        self.objects.setAddress("web2", "ip-netmask", "10.0.0.9")
+        self.assertEqual(self.objects.resolveAddresses(["inside"])[0][0], (4, self.ip("10.0.0.1"), self.ip("10.0.0.1")))
+        self.objects.removeObject("lan")
+        self.assertEqual(self.objects.resolveAddresses(["inside"])[1], ["lan", "site"])
+
+    def test_newMemberResolvesLater(self):
+        self.objects.setAddressGroup("later", ["missing"])
+        self.assertEqual(self.objects.resolveAddresses(["later"]), ([], ["missing"]))
+        self.objects.setAddress("missing", "ip-netmask", "10.9.9.9")
+        self.assertEqual(self.objects.resolveAddresses(["later"]), ([(4, self.ip("10.9.9.9"), self.ip("10.9.9.9"))], []))
+
+    def test_cycle_ValueErrorHandle(self):
+        self.objects.setAddressGroup("a", ["b"])
+        self.objects.setAddressGroup("b", ["a"])
+        with self.assertRaises(ValueError):
+            self.objects.resolveAddresses(["a"])
+        self.objects.setServiceGroup("s", ["s"])
+        with self.assertRaises(ValueError):
+            self.objects.resolveServices(["s"])
+
+    def test_parseAddress_ValueErrorHandle(self):
+        with self.assertRaises(ValueError):
+            self.objects.parseAddress("10.0.0.300")
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
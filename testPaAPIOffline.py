@@ -0,0 +1,254 @@
+import unittest
+import os
+import tempfile
+from io import BytesIO
+from PaAPI import *
+try:
+    from urlparse import urlsplit, parse_qs
+except ImportError:
+    from urllib.parse import urlsplit, parse_qs
+class testPaAPIOffline (unittest.TestCase):
+    '''
+    Class for testing the PaAPI.py Class without a PaloAlto, the answers of the PaloAlto are given by the tests
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    # stands in for the response of the PaloAlto
+    class FakeResponse(BytesIO):
+        def info(self):
+            return {}
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.apiKeyFile = os.path.join(self.directory, "paconnect.conf")
+        confFile = open(self.apiKeyFile, 'w')
+        confFile.write("baseurl=https://offline.example/\napikey=KEY\nretries=0\ncommitwindow=0\ncompression=no\n")
+        confFile.close()
+        self.requests = []
+        self.answer = lambda params: "<response status='success'><result/></response>"
+        self.pa = self.newPaAPI()
+
+    def tearDown(self):
+        os.remove(self.apiKeyFile)
+        os.rmdir(self.directory)
+
+    # returns a PaAPI object whose requests are answered by self.answer (called with the parameters of the request)
+    def newPaAPI(self):
+        pa = PaAPI(self.apiKeyFile, None, False)
+        pa._PaAPI__urlopen = self.urlopen
+        pa.jobPollInterval = 0.0
+        return pa
+
+    def urlopen(self, url, postData):
+        params = dict([(key, values[0]) for key, values in parse_qs(urlsplit(url).query).items()])
+        if postData:
+            params.update(dict([(key, values[0]) for key, values in parse_qs(postData.decode('utf-8')).items()]))
+        self.requests.append(params)
+        answer = self.answer(params)
+        if not isinstance(answer, bytes):
+            answer = answer.encode('utf-8')
+        return self.FakeResponse(answer)
+
+    ## Commit Tests ##
+    def jobAnswer(self, polls, result, details):
+        def answer(params):
+            if params["type"] == "commit":
+                return "<response status='success'><result><msg><line>Commit job enqueued with jobid 7</line></msg><job>7</job></result></response>"
+            polls.append(params["cmd"])
+            status = "FIN" if len(polls) > 1 else "ACT"
+            return ("<response status='success'><result><job><id>7</id><type>Commit</type><status>" + status + "</status><result>" + 
+                    (result if status == "FIN" else "PEND") + "</result><details>" + "".join(["<line>" + line + "</line>" for line in details]) + 
+                    "</details></job></result></response>")
+        return answer
+
+    def test_requestCommit(self):
+        polls = []
+        self.answer = self.jobAnswer(polls, "OK", ["Configuration committed successfully"])
+        self.assertEqual(self.pa.requestCommit(), "Configuration committed successfully")
+        self.assertEqual(polls, ["<show><jobs><id>7</id></jobs></show>"] * 2)
+
+    def test_requestCommit_failed(self):
+        self.answer = self.jobAnswer([], "FAIL", ["Validation Error:", "rule 'allow' is not valid"])
+        with self.assertRaises(ValueError) as error:
+            self.pa.requestCommit()
+        self.assertTrue("rule 'allow' is not valid" in str(error.exception))
+
+    def test_requestCommit_noChanges(self):
+        self.answer = lambda params: "<response status='success' code='19'><msg>There are no changes to commit.</msg></response>"
+        self.assertEqual(self.pa.requestCommit(), "There are no changes to commit.")
+
+    def test_requestCommit_requestingObject(self):
+        self.answer = self.jobAnswer([], "OK", ["Configuration committed successfully"])
+        other = self.newPaAPI()
+        other.apiKey = "OTHER"
+        other.requestCommit()
+        self.assertEqual(set([params["key"] for params in self.requests]), set(["OTHER"]))
+
+    def test_changeSetCommit_failedJob(self):
+        jobAnswer = self.jobAnswer([], "FAIL", ["Validation Error:", "rule 'a' is not valid"])
+        def answer(params):
+            if params["type"] == "config" or params.get("cmd", "").startswith("<load>"):
+                return "<response status='success' code='20'><msg>command succeeded</msg></response>"
+            return jobAnswer(params)
+        self.answer = answer
+        changeSet = self.pa.createChangeSet()
+        changeSet.createRule(self.newRule("a"))
+        with self.assertRaises(ValueError) as error:
+            changeSet.commit()
+        self.assertTrue("rule 'a' is not valid" in str(error.exception))
+        self.assertEqual(self.requests[-2]["cmd"], "<load><config><from>running-config.xml</from></config></load>")
+        self.assertEqual(self.requests[-1]["xpath"], self.pa.getRulesXPath())
+        self.assertFalse(changeSet.isEmpty())
+
+    ## Edit Tests ##
+    # answers the given entry to the get requests and accepts the other ones
+    def entryAnswer(self, entry):
+        def answer(params):
+            if params["action"] == "get":
+                return "<response status='success'><result>" + entry + "</result></response>"
+            return "<response status='success' code='20'><msg>command succeeded</msg></response>"
+        return answer
+
+    def test_editFireWallRule_keepsUnmodeledChildren(self):
+        self.answer = self.entryAnswer("<entry name='a'><from><member>any</member></from><tag><member>web</member></tag>" +
+                                       "<log-setting>syslog</log-setting><profile-setting><profiles><virus><member>default</member></virus>" +
+                                       "</profiles></profile-setting></entry>")
+        self.pa.editFireWallRule(self.newRule("a"))
+        self.assertEqual((self.requests[0]["action"], self.requests[1]["action"]), ("get", "edit"))
+        self.assertEqual(self.requests[0]["xpath"], self.requests[1]["xpath"])
+        element = self.requests[1]["element"]
+        self.assertTrue(element.startswith("<entry name='a'>" + self.newRule("a").genRuleMembersXML()))
+        self.assertTrue(element.endswith("<tag><member>web</member></tag><log-setting>syslog</log-setting><profile-setting><profiles><virus>" +
+                                         "<member>default</member></virus></profiles></profile-setting></entry>"))
+        self.assertEqual(element.count("<from>"), 1)
+
+    def test_editFireWallRule_replacesProfileGroup(self):
+        self.answer = self.entryAnswer("<entry name='a'><profile-setting><group><member>old</member></group></profile-setting></entry>")
+        self.pa.editFireWallRule(self.newRule("a"))
+        self.assertEqual(self.requests[1]["element"], self.newRule("a").genRuleXML())
+
+    def test_editFireWallRule_keepsNatType(self):
+        rule = NatRules("out", ["trust"], ["untrust"], ["any"], ["any"], "any", "", "static-ip", ["1.2.3.4"], "", "", "no", "", "", "yes")
+        self.answer = self.entryAnswer("<entry name='out'><nat-type>ipv4</nat-type><source-translation><static-ip><translated-address>1.2.3.5" +
+                                       "</translated-address></static-ip></source-translation></entry>")
+        self.pa.editFireWallRule(rule)
+        self.assertEqual(self.requests[1]["xpath"], self.pa.getRulesXPath(None, "nat") + "/entry[@name='out']")
+        self.assertEqual(self.requests[1]["element"], rule.genRuleXML()[:-len("</entry>")] + "<nat-type>ipv4</nat-type></entry>")
+
+    ## Object Tests ##
+    def test_loadFireWallObjects_shared(self):
+        entries = {
+                   "/config/shared/address": "<entry name='dns'><ip-netmask>10.0.0.53</ip-netmask></entry><entry name='web'><ip-netmask>10.0.0.80</ip-netmask></entry>",
+                   "/config/shared/service": "<entry name='dns-udp'><protocol><udp><port>53</port></udp></protocol></entry>",
+                   "/config/shared/service-group": "<entry name='infra'><members><member>dns-udp</member></members></entry>",
+                   self.pa.getVsysXPath() + "/address": "<entry name='web'><ip-netmask>10.1.0.80</ip-netmask></entry>",
+                   self.pa.getVsysXPath() + "/address-group": "<entry name='servers'><static><member>web</member><member>dns</member></static></entry>"
+                   }
+        self.answer = lambda params: "<response status='success'><result>" + entries.get(params["xpath"], "") + "</result></response>"
+        objects = self.pa.loadFireWallObjects()
+        self.assertEqual(objects.resolveAddresses(["web"]), objects.resolveAddresses(["10.1.0.80"]))
+        self.assertEqual(objects.resolveAddresses(["servers"]), objects.resolveAddresses(["10.0.0.53", "10.1.0.80"]))
+        self.assertEqual(objects.resolveServices(["infra"]), ([("udp", 53, 53)], []))
+
+    def test_loadFireWallObjects_sameNameAddressAndService(self):
+        entries = {
+                   self.pa.getVsysXPath() + "/address": "<entry name='dns'><ip-netmask>10.0.0.53</ip-netmask></entry>",
+                   self.pa.getVsysXPath() + "/service": "<entry name='dns'><protocol><udp><port>53</port></udp></protocol></entry>"
+                   }
+        self.answer = lambda params: "<response status='success'><result>" + entries.get(params["xpath"], "") + "</result></response>"
+        objects = self.pa.loadFireWallObjects()
+        self.assertEqual(objects.resolveAddresses(["dns"]), objects.resolveAddresses(["10.0.0.53"]))
+        self.assertEqual(objects.resolveServices(["dns"]), ([("udp", 53, 53)], []))
+
+    ## NAT and PBF Tests ##
+    def test_findFireWallRules_nat(self):
+        self.answer = lambda params: ("<response status='success'><result><rules>" +
+                                      "<entry name='out'><from><member>trust</member></from><to><member>untrust</member></to><source><member>any</member></source>" +
+                                      "<destination><member>any</member></destination><service>any</service><source-translation><dynamic-ip-and-port><interface-address>" +
+                                      "<interface>ethernet1/1</interface></interface-address></dynamic-ip-and-port></source-translation></entry>" +
+                                      "</rules></result></response>")
+        self.pa.loadNatRules()
+        self.assertEqual([rule.getRuleName() for rule in self.pa.findFireWallRules(("srcTransInterface", "ethernet1/1"), "nat")], ["out"])
+        self.assertEqual(self.pa.findFireWallRulesUsing("ethernet1/1"), [])
+        self.answer = lambda params: "<response status='success' code='20'><msg>command succeeded</msg></response>"
+        self.pa.deleteFireWallRule(self.pa.getNatRule("out"))
+        self.assertEqual(self.pa.findFireWallRulesUsing("ethernet1/1", "nat"), [])
+
+    ## Report Tests ##
+    def test_iterReport_closesResponse(self):
+        responses = []
+        self.pa._PaAPI__urlopen = lambda url, postData: responses.append(self.urlopen(url, postData)) or responses[-1]
+        self.answer = lambda params: "<response status='success'><result><report><entry><app>ssh</app></entry><entry><app>web</app></entry></report></result></response>"
+        for entries in (self.pa.iterReport("top-applications"), self.pa.iterDynamicReport("top-app-summary", "last-hour", "5")):
+            self.assertEqual(responses, [])
+            self.assertEqual(next(entries).getFields(), {"app": "ssh"})
+            entries.close()
+            self.assertTrue(responses.pop().closed)
+
+    ## Vsys Tests ##
+    # answers the vsys names and the security rules of each vsys (vsys name => rule names)
+    def vsysAnswer(self, vsysRules):
+        def answer(params):
+            if params["xpath"] == "/config/devices/entry/vsys/entry/@name":
+                return "<response status='success'><result>" + "".join(["<entry name='" + vsys + "'/>" for vsys in sorted(vsysRules)]) + "</result></response>"
+            for vsys in vsysRules:
+                if params["xpath"] == self.pa.getRulesXPath(vsys):
+                    return "<response status='success'><result><rules>" + "".join([self.newRule(name).genRuleXML() for name in vsysRules[vsys]]) + "</rules></result></response>"
+            return "<response status='success'><result/></response>"
+        return answer
+
+    def newRule(self, name):
+        return Rules(name, ["trust"], ["untrust"], ["any"], ["any"], ["any"], ["ssh"], "allow", ["any"], "no", "no", "no", "no", [], [], "no", "yes", "")
+
+    def test_getVsysXPath(self):
+        self.assertEqual(self.pa.getVsysXPath(), "/config/devices/entry/vsys/entry")
+        self.assertEqual(self.pa.getVsysXPath("vsys3"), "/config/devices/entry/vsys/entry[@name='vsys3']")
+        self.pa.vsys = "vsys2"
+        self.assertEqual(self.pa.getVsysXPath(), "/config/devices/entry/vsys/entry[@name='vsys2']")
+        self.assertEqual(self.pa.getRulesXPath(None, "nat"), "/config/devices/entry/vsys/entry[@name='vsys2']/rulebase/nat/rules")
+
+    def test_loadAllFireWallRules(self):
+        self.answer = self.vsysAnswer({"vsys1": ["a", "b"], "vsys2": ["c"], "vsys3": []})
+        vsysRules = self.pa.loadAllFireWallRules(2)
+        self.assertEqual(dict([(vsys, [rule.getRuleName() for rule in vsysRules[vsys]]) for vsys in vsysRules]), {"vsys1": ["a", "b"], "vsys2": ["c"], "vsys3": []})
+        self.assertEqual(self.pa.getVsys(), "vsys1")
+        self.assertEqual([rule.getRuleName() for rule in self.pa.findFireWallRules(("app", "ssh"))], ["a", "b"])
+        self.assertEqual(self.pa.findFireWallRulePositions(("app", "ssh")), [0, 1])
+
+    def test_setVsys_usesLoadedRules(self):
+        self.answer = self.vsysAnswer({"vsys1": ["a"], "vsys2": ["c"]})
+        self.pa.loadAllFireWallRules()
+        self.pa.objects = ObjectResolver()
+        self.pa.natRules.append(NatRules("nat", [], [], [], [], "any", "", "none", [], "", "", "no", ""))
+        requests = len(self.requests)
+        self.pa.setVsys("vsys2")
+        self.assertEqual(len(self.requests), requests)
+        self.assertEqual([rule.getRuleName() for rule in self.pa.getFireWallRules()], ["c"])
+        self.assertEqual([rule.getRuleName() for rule in self.pa.findFireWallRules(("app", "ssh"))], ["c"])
+        self.assertEqual((self.pa.objects, self.pa.natRules), (None, []))
+
+    def test_setVsys_loadsNewVsys(self):
+        self.answer = self.vsysAnswer({"vsys4": ["d"]})
+        self.pa.setVsys("vsys4")
+        self.assertEqual(self.requests[-1]["xpath"], self.pa.getRulesXPath("vsys4"))
+        self.assertEqual([rule.getRuleName() for rule in self.pa.vsysRules["vsys4"]], ["d"])
+
+    def test_getFireWallRules_vsysNotLoaded(self):
+        self.answer = self.vsysAnswer({"vsys1": ["a"], "vsys2": ["c"]})
+        self.pa.loadAllFireWallRules()
+        with self.assertRaises(ValueError) as error:
+            self.pa.getFireWallRules("vsys9")
+        self.assertTrue("vsys9" in str(error.exception))
+
+    def test_setVsys_resetsValidator(self):
+        self.pa.vsysRules["vsys2"] = []
+        self.pa.ruleValidator = RuleValidator({"zone": ["trust"]})
+        self.pa.setVsys("vsys2")
+        self.assertEqual(self.pa.ruleValidator, None)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,70 @@
+import unittest
+import xml.etree.ElementTree as ET
+from PbfRules import *
+class testPbfRules (unittest.TestCase):
+    '''
+    Class for testing the PbfRules.py Class which is part of the PaloAlto API project
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    def newRule(self, act="forward", egressIf="ethernet1/3", nextHop="10.9.9.1", toVsys="", fromType="zone"):
+        return PbfRules("pbf", ["trust"], ["10.0.0.0/8"], ["any"], ["any"], ["any"], ["any"], act, egressIf, nextHop, "no", "", toVsys, fromType)
+
+    def test_genRuleFromMembersXML(self):
+        self.assertEqual(self.newRule().genRuleFromMembersXML(), "<from><zone><member>trust</member></zone></from>")
+
+    def test_genRuleFromMembersXML_interface(self):
+        self.assertEqual(self.newRule("discard", "", "", "", "interface").genRuleFromMembersXML(), "<from><interface><member>trust</member></interface></from>")
+
+    def test_genRuleActionXML_forward(self):
+        self.assertEqual(self.newRule().genRuleActionXML(), "<action><forward><egress-interface>ethernet1/3</egress-interface><nexthop><ip-address>10.9.9.1</ip-address></nexthop></forward></action>")
+
+    def test_genRuleActionXML_forwardWithoutNextHop(self):
+        self.assertEqual(self.newRule("forward", "ethernet1/3", "").genRuleActionXML(), "<action><forward><egress-interface>ethernet1/3</egress-interface></forward></action>")
+
+    def test_genRuleActionXML_discard(self):
+        self.assertEqual(self.newRule("discard", "", "").genRuleActionXML(), "<action><discard/></action>")
+
+    def test_genRuleActionXML_forwardToVsys(self):
+        self.assertEqual(self.newRule("forward-to-vsys", "", "", "vsys2").genRuleActionXML(), "<action><forward-to-vsys>vsys2</forward-to-vsys></action>")
+
+    def test_genRuleXML(self):
+        self.assertEqual(self.newRule("no-pbf", "", "").genRuleXML(), "<entry name='pbf'><from><zone><member>trust</member></zone></from><source><member>10.0.0.0/8</member></source><destination><member>any</member></destination><source-user><member>any</member></source-user><application><member>any</member></application><service><member>any</member></service><action><no-pbf/></action><disabled>no</disabled></entry>")
+
+    def test_parseEntry(self):
+        for rule in [self.newRule(), self.newRule("forward", "ethernet1/3", ""), self.newRule("forward-to-vsys", "", "", "vsys2"), self.newRule("discard", "", ""), self.newRule("no-pbf", "", ""),
+                     self.newRule("no-pbf", "", "", "", "interface")]:
+            parsed = PbfRules.parseEntry(ET.fromstring(rule.genRuleXML()))
+            self.assertEqual(parsed.genRuleXML(), rule.genRuleXML())
+            self.assertEqual(parsed.getRuleToVsys(), rule.getRuleToVsys())
+            self.assertEqual(parsed.getRuleFromType(), rule.getRuleFromType())
+
+    def test_rulebase(self):
+        self.assertEqual(self.newRule().rulebase, "pbf")
+
+    def test_value_PbfRules_ValueErrorHandle(self):
+        with self.assertRaises(ValueError):
+            self.newRule("allow")
+
+    def test_value_setRuleAction_ValueErrorHandle(self):
+        with self.assertRaises(ValueError):
+            self.newRule().setRuleAction("forward")
+
+    def test_value_forwardToVsysWithoutVsys_ValueErrorHandle(self):
+        with self.assertRaises(ValueError):
+            self.newRule("forward-to-vsys", "", "")
+
+    def test_value_setRuleFromType_ValueErrorHandle(self):
+        with self.assertRaises(ValueError):
+            self.newRule().setRuleFromType("vsys")
+
+    def test_type_setRuleService_TypeErrorHandle(self):
+        with self.assertRaises(TypeError):
+            self.newRule().setRuleService("any")
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,96 @@
+import unittest
+import os
+import shutil
+import tempfile
+from Reports import *
+from ReportStore import *
+class testReportStore (unittest.TestCase):
+    '''
+    Class for testing the ReportStore.py Class which is part of the PaloAlto API project
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    def newReport(self, sslBytes, dnsBytes):
+        return [
+                Reports("top-applications-summary", {"name": "ssl", "bytes": str(sslBytes), "sessions": "2"}),
+                Reports("top-applications-summary", {"name": "dns", "bytes": str(dnsBytes), "sessions": "1"})
+                ]
+
+    def setUp(self):
+        self.store = ReportStore(":memory:")
+        for minute in range(8):
+            self.store.append("top-applications-summary", "last-15-minutes", self.newReport(10 * minute, 1), 900 * minute)
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_append(self):
+        self.assertEqual(self.store.append("top-applications-summary", "last-hour", self.newReport(1, 2), 0), 4)
+        self.assertEqual(self.store.getSampleCount(), 36)
+
+    def test_query(self):
+        samples = self.store.query("top-applications-summary", "last-15-minutes", 900, 1800, "bytes")
+        self.assertEqual(samples, [(900, 0, {"name": "ssl"}, "bytes", 10.0), (900, 0, {"name": "dns"}, "bytes", 1.0)])
+
+    def test_append_emptyField(self):
+        self.store.append("top-app-summary", "last-hour", [Reports("top-app-summary", {"app": "ssl", "user": None, "bytes": "10"})], 0)
+        self.assertEqual(self.store.query("top-app-summary", "last-hour"), [(0, 0, {"app": "ssl", "user": ""}, "bytes", 10.0)])
+
+    def test_append_numericDimension(self):
+        # A port is a dimension even though it is a number
+        entries = [Reports("top-ports", {"port": "443", "sessions": "5"}), Reports("top-ports", {"port": "53", "sessions": "2"})]
+        self.assertEqual(self.store.append("top-ports", "last-hour", entries, 0), 2)
+        self.assertEqual(self.store.query("top-ports", "last-hour"), [(0, 0, {"port": "443"}, "sessions", 5.0), (0, 0, {"port": "53"}, "sessions", 2.0)])
+
+    def test_setMeasures(self):
+        self.store.setMeasures("top-rules", ["hit-count"])
+        self.store.append("top-rules", "last-hour", [Reports("top-rules", {"rule": "allow", "hit-count": "7", "count": "3"})], 0)
+        self.assertEqual(self.store.query("top-rules", "last-hour"), [(0, 0, {"count": "3", "rule": "allow"}, "hit-count", 7.0)])
+
+    def test_getStoredFields(self):
+        self.store.setMeasures("top-rules", ["hit-count"])
+        self.store.append("top-rules", "last-hour", [Reports("top-rules", {"rule": "allow", "hit-count": "7", "count": "3"})], 0)
+        self.assertEqual(self.store.getStoredFields("top-rules"), {"rule": False, "hit-count": True, "count": False})
+        self.assertEqual(self.store.getStoredFields("top-applications-summary"), {"name": False, "bytes": True, "sessions": True})
+        self.assertEqual(self.store.getStoredFields("top-url-summary"), {})
+
+    def test_query_unknownReport(self):
+        self.assertEqual(self.store.query("top-url-summary", "last-15-minutes"), [])
+
+    def test_getReportNames(self):
+        self.store.append("top-url-summary", "last-hour", [Reports("top-url-summary", {"url": "a", "count": "3"})], 0)
+        self.assertEqual(self.store.getReportNames(), [("top-applications-summary", "last-15-minutes"), ("top-url-summary", "last-hour")])
+
+    def test_downsample(self):
+        removed = self.store.downsample(3600, 3600, "sum", 7200)
+        self.assertEqual(removed, 12)
+        samples = self.store.query("top-applications-summary", "last-15-minutes", None, None, "bytes")
+        self.assertEqual([sample for sample in samples if sample[0] < 3600], [(0, 3600, {"name": "ssl"}, "bytes", 60.0), (0, 3600, {"name": "dns"}, "bytes", 4.0)])
+        self.assertEqual(len([sample for sample in samples if sample[1] == 0]), 8)
+
+    def test_downsample_average(self):
+        self.store.downsample(0, 7200, "avg", 7200)
+        samples = self.store.query("top-applications-summary", "last-15-minutes", None, None, "bytes")
+        self.assertEqual(samples, [(0, 7200, {"name": "ssl"}, "bytes", 35.0), (0, 7200, {"name": "dns"}, "bytes", 1.0)])
+
+    def test_reopen(self):
+        path = os.path.join(tempfile.mkdtemp(), "reports.db")
+        store = ReportStore(path)
+        store.append("top-applications-summary", "last-hour", self.newReport(5, 6), 0)
+        store.close()
+        store = ReportStore(path)
+        self.assertEqual(len(store.query("top-applications-summary", "last-hour")), 4)
+        self.assertEqual(store.getStoredFields("top-applications-summary"), {"name": False, "bytes": True, "sessions": True})
+        store.close()
+        shutil.rmtree(os.path.dirname(path))
+
+    def test_value_downsample_ValueErrorHandle(self):
+        with self.assertRaises(ValueError):
+            self.store.downsample(3600, 3600, "median")
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,86 @@
+import unittest
+import threading
+import time
+from RequestScheduler import *
+class testRequestScheduler (unittest.TestCase):
+    '''
+    Class for testing the RequestScheduler.py Class which is part of the PaloAlto API project
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    # sends count requests of a priority and job from their own threads, returns the threads and the order they got their tokens
+    def send(self, scheduler, requests, order):
+        threads = []
+        for priority, job, name in requests:
+            def run(priority=priority, job=job, name=name):
+                scheduler.acquire(priority, job)
+                order.append(name)
+            thread = threading.Thread(target=run)
+            thread.start()
+            threads.append(thread)
+            # every request is queued before the next one
+            while scheduler.getQueueDepth() < len(threads) - len(order):
+                time.sleep(0.001)
+        return threads
+
+    def test_acquire_noRate(self):
+        scheduler = RequestScheduler()
+        start = time.time()
+        for n in range(1000):
+            scheduler.acquire()
+        self.assertTrue(time.time() - start < 0.5)
+        self.assertEqual(scheduler.getMetrics()["interactive"]["requests"], 1000)
+
+    def test_acquire_rate(self):
+        scheduler = RequestScheduler(50, 5)
+        start = time.time()
+        for n in range(15):
+            scheduler.acquire()
+        # 5 requests from the burst, 10 paced at 50 per second
+        self.assertTrue(0.15 <= time.time() - start < 0.5)
+
+    def test_acquire_priority(self):
+        scheduler = RequestScheduler(20, 1)
+        scheduler.acquire()
+        order = []
+        threads = self.send(scheduler, [("bulk", None, "bulk1"), ("bulk", None, "bulk2"), ("interactive", None, "interactive")], order)
+        for thread in threads:
+            thread.join()
+        self.assertEqual(order, ["interactive", "bulk1", "bulk2"])
+
+    def test_acquire_fairShare(self):
+        scheduler = RequestScheduler(50, 1)
+        scheduler.acquire()
+        order = []
+        requests = [("bulk", "import", "import" + str(n)) for n in range(4)] + [("bulk", "report", "report" + str(n)) for n in range(2)]
+        threads = self.send(scheduler, requests, order)
+        for thread in threads:
+            thread.join()
+        self.assertEqual(order, ["import0", "report0", "import1", "report1", "import2", "import3"])
+
+    def test_getMetrics(self):
+        scheduler = RequestScheduler(20, 1)
+        scheduler.acquire("bulk")
+        scheduler.acquire("bulk")
+        metrics = scheduler.getMetrics()
+        self.assertEqual(metrics["bulk"]["requests"], 2)
+        self.assertEqual(metrics["bulk"]["waiting"], 0)
+        self.assertTrue(metrics["bulk"]["maxWait"] >= 0.03)
+        self.assertEqual(metrics["interactive"], {"waiting": 0, "requests": 0, "averageWait": 0.0, "maxWait": 0.0})
+
+    def test_value_acquire_ValueErrorHandle(self):
+        with self.assertRaises(ValueError):
+            RequestScheduler().acquire("urgent")
+
+    def test_value_RequestScheduler_ValueErrorHandle(self):
+        with self.assertRaises(ValueError):
+            RequestScheduler(-1)
+        with self.assertRaises(ValueError):
+            RequestScheduler(10, 0)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,96 @@
+import unittest
+from RetryPolicy import *
+class testRetryPolicy (unittest.TestCase):
+    '''
+    Class for testing the RetryPolicy.py Classes which are part of the PaloAlto API project
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    ## RetryPolicy Tests ##
+    def test_shouldRetry(self):
+        policy = RetryPolicy(2, 1.0, 30.0)
+        self.assertTrue(policy.shouldRetry(1))
+        self.assertTrue(policy.shouldRetry(2))
+        self.assertFalse(policy.shouldRetry(3))
+
+    def test_getDelay(self):
+        policy = RetryPolicy(10, 1.0, 8.0)
+        for attempt in range(1, 11):
+            ceiling = min(8.0, 2 ** (attempt - 1))
+            for i in range(50):
+                delay = policy.getDelay(attempt)
+                self.assertTrue(0 <= delay <= ceiling)
+
+    def test_type_RetryPolicy_TypeErrorHandle(self):
+        with self.assertRaises(TypeError):
+            RetryPolicy("3")
+
+    def test_value_RetryPolicy_ValueErrorHandle(self):
+        with self.assertRaises(ValueError):
+            RetryPolicy(-1)
+
+    ## CircuitBreaker Tests ##
+    def test_breakerOpensAfterThreshold(self):
+        breaker = CircuitBreaker(3, 60.0)
+        for i in range(2):
+            breaker.recordFailure()
+        self.assertTrue(breaker.allowRequest())
+        breaker.recordFailure()
+        self.assertEqual(breaker.getState(), "open")
+        self.assertFalse(breaker.allowRequest())
+
+    def test_breakerSuccessResetsFailures(self):
+        breaker = CircuitBreaker(2, 60.0)
+        breaker.recordFailure()
+        breaker.recordSuccess()
+        breaker.recordFailure()
+        self.assertEqual(breaker.getState(), "closed")
+
+    def test_breakerHalfOpenAllowsSingleTrial(self):
+        breaker = CircuitBreaker(1, 60.0)
+        breaker.recordFailure()
+        breaker.openedAt = breaker.openedAt - 61.0
+        self.assertTrue(breaker.allowRequest())
+        self.assertEqual(breaker.getState(), "half-open")
+        self.assertFalse(breaker.allowRequest())
+        breaker.recordSuccess()
+        self.assertEqual(breaker.getState(), "closed")
+        self.assertTrue(breaker.allowRequest())
+
+    def test_breakerHalfOpenFailureReopens(self):
+        breaker = CircuitBreaker(1, 60.0)
+        breaker.recordFailure()
+        breaker.openedAt = breaker.openedAt - 61.0
+        self.assertTrue(breaker.allowRequest())
+        breaker.recordFailure()
+        self.assertEqual(breaker.getState(), "open")
+        self.assertFalse(breaker.allowRequest())
+
+    def test_breakerReleaseTrial(self):
+        breaker = CircuitBreaker(1, 60.0)
+        breaker.recordFailure()
+        breaker.openedAt = breaker.openedAt - 61.0
+        self.assertTrue(breaker.allowRequest())
+        breaker.releaseTrial()
+        self.assertEqual(breaker.getState(), "half-open")
+        self.assertTrue(breaker.allowRequest())
+        self.assertFalse(breaker.allowRequest())
+
+    def test_breakerTrialTimeout(self):
+        breaker = CircuitBreaker(1, 60.0)
+        breaker.recordFailure()
+        breaker.openedAt = breaker.openedAt - 61.0
+        self.assertTrue(breaker.allowRequest())
+        self.assertFalse(breaker.allowRequest())
+        breaker.trialStartedAt = breaker.trialStartedAt - 61.0
+        self.assertTrue(breaker.allowRequest())
+
+    def test_CircuitOpenError_isIOError(self):
+        self.assertTrue(issubclass(CircuitOpenError, IOError))
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
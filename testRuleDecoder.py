@@ -0,0 +1,109 @@
+import unittest
+import os
+import tempfile
+from RuleDecoder import *
+from PaAPI import *
+class testRuleDecoder (unittest.TestCase):
+    '''
+    Class for testing the RuleDecoder.py Class which is part of the PaloAlto API project
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    def entry(self, n):
+        return (
+                "<entry name='rule" + str(n) + "'><from><member>trust</member></from><to><member>untrust</member></to>"
+                "<source><member>10.0." + str(n) + ".0/24</member></source><destination><member>any</member></destination>"
+                "<service><member>service-http</member></service><application><member>web-browsing</member></application>"
+                "<source-user><member>any</member></source-user><action>allow</action>"
+                "<profile-setting><group><member>bellus</member></group></profile-setting><log-end>yes</log-end>"
+                "<description>Rule " + str(n) + "</description></entry>"
+                )
+
+    def record(self, n):
+        return (
+                "rule" + str(n), ["trust"], ["untrust"], ["10.0." + str(n) + ".0/24"], ["any"], ["service-http"], ["web-browsing"],
+                "allow", ["any"], "no", "no", "no", "no", ["bellus"], [], "no", "yes", "Rule " + str(n)
+                )
+
+    def rulebase(self, count):
+        return "<response status='success'><result><rules>" + "".join([self.entry(n) for n in range(count)]) + "</rules></result></response>"
+
+    def test_splitEntries(self):
+        chunks = RuleDecoder(chunkSize=3).splitEntries(self.rulebase(7))
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(chunks[2], b"<rules>" + self.entry(6).encode('utf-8') + b"</rules>")
+
+    def test_splitEntries_empty(self):
+        self.assertEqual(RuleDecoder().splitEntries("<response status='success'><result><rules/></result></response>"), [])
+
+    def test_splitEntries_selfClosed(self):
+        chunks = RuleDecoder(chunkSize=2).splitEntries("<rules><entry name='a'/><entry name='b'><from/></entry><entry name='c'/></rules>")
+        self.assertEqual(chunks, [b"<rules><entry name='a'/><entry name='b'><from/></entry></rules>", b"<rules><entry name='c'/></rules>"])
+
+    def test_decodeRecords_defaults(self):
+        record = RuleDecoder().decodeRecords("<rules><entry name='a'><action>deny</action></entry></rules>")[0]
+        self.assertEqual(record, ("a", [], [], [], [], [], [], "deny", [], "no", "no", "no", "no", [], [], "no", "no", ""))
+
+    # RuleDecoder sends records out of its processes and PaAPI builds the rules itself, both read the entries with Rules.parseRecord
+    def test_decodeRules_sameAsPaAPI(self):
+        paRules = (
+                   "<response status='success'><result><rules>" + self.entry(1) +
+                   "<entry name='options'><from><member>trust</member><member>dmz</member></from><to><member>untrust</member></to>"
+                   "<source><member>admins</member></source><destination><member>10.1.1.1</member></destination><service><member>any</member></service>"
+                   "<application><member>ssh</member><member>ping</member></application><source-user><member>corp\\admin</member></source-user>"
+                   "<hip-profiles><member>managed</member></hip-profiles><action>deny</action><option><disable-server-response-inspection>yes"
+                   "</disable-server-response-inspection></option><negate-source>yes</negate-source><negate-destination>yes</negate-destination>"
+                   "<disabled>yes</disabled><log-start>yes</log-start><log-end>no</log-end><description/></entry>"
+                   "<entry name='defaults'><action>allow</action><log-end/></entry>"
+                   "</rules></result></response>"
+                   )
+        directory = tempfile.mkdtemp()
+        apiKeyFile = os.path.join(directory, "paconnect.conf")
+        confFile = open(apiKeyFile, 'w')
+        confFile.write("baseurl=https://offline.example/\napikey=KEY\n")
+        confFile.close()
+        try:
+            parsed = PaAPI(apiKeyFile, None, False).parseFireWallRules(paRules)
+        finally:
+            os.remove(apiKeyFile)
+            os.rmdir(directory)
+        decoded = RuleDecoder(1).decodeRules(paRules)
+        self.assertEqual(len(decoded), 3)
+        self.assertEqual([vars(rule) for rule in decoded], [vars(rule) for rule in parsed])
+
+    def test_decodeRecords(self):
+        self.assertEqual(RuleDecoder(1, 10).decodeRecords(self.rulebase(25)), [self.record(n) for n in range(25)])
+
+    def test_decodeRules_pool(self):
+        rules = RuleDecoder(2, 10).decodeRules(self.rulebase(45))
+        self.assertEqual([rule.getRuleName() for rule in rules], ["rule" + str(n) for n in range(45)])
+        self.assertEqual(rules[44].getRuleSource(), ["10.0.44.0/24"])
+
+    def test_decodeFiles(self):
+        directory = tempfile.mkdtemp()
+        paths = [os.path.join(directory, "rules" + str(count) + ".xml") for count in (5, 0, 12)]
+        try:
+            for path, count in zip(paths, (5, 0, 12)):
+                ruleFile = open(path, 'w')
+                ruleFile.write(self.rulebase(count))
+                ruleFile.close()
+            rulebases = RuleDecoder(2, 4).decodeFiles(paths)
+            self.assertEqual([len(rules) for rules in rulebases], [5, 0, 12])
+            self.assertEqual(rulebases[2][11].getRuleName(), "rule11")
+        finally:
+            for path in paths:
+                os.remove(path)
+            os.rmdir(directory)
+
+    def test_value_RuleDecoder_ValueErrorHandle(self):
+        with self.assertRaises(ValueError):
+            RuleDecoder(0)
+        with self.assertRaises(ValueError):
+            RuleDecoder(chunkSize=0)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,68 @@
+import unittest
+import random
+from RuleFingerprint import *
+class testRuleFingerprint (unittest.TestCase):
+    '''
+    Class for testing the RuleFingerprint.py Class which is part of the PaloAlto API project
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    values = ["rule" + str(n) for n in range(1000)]
+
+    # changed position ranges, the slow way
+    def changedRanges(self, old, new):
+        ranges = []
+        for position in range(len(new)):
+            if position >= len(old) or old[position] != new[position]:
+                if ranges and ranges[-1][1] == position - 1:
+                    ranges[-1] = (ranges[-1][0], position)
+                else:
+                    ranges.append((position, position))
+        return ranges
+
+    def test_getRoot_same(self):
+        self.assertEqual(RuleFingerprint(list(self.values)).getRoot(), RuleFingerprint(list(self.values)).getRoot())
+
+    def test_getRoot_empty(self):
+        self.assertEqual(RuleFingerprint([]).getRoot(), None)
+
+    def test_getChangedRanges_none(self):
+        self.assertEqual(RuleFingerprint(list(self.values)).getChangedRanges(RuleFingerprint(list(self.values))), [])
+
+    def test_getChangedRanges(self):
+        new = list(self.values)
+        new[17] = "edited"
+        new[18] = "edited"
+        new[900] = "edited"
+        self.assertEqual(RuleFingerprint(list(self.values)).getChangedRanges(RuleFingerprint(new)), [(17, 18), (900, 900)])
+
+    def test_getChangedRanges_appended(self):
+        new = self.values + ["new"]
+        self.assertEqual(RuleFingerprint(list(self.values)).getChangedRanges(RuleFingerprint(new)), [(1000, 1000)])
+
+    def test_getChangedRanges_removed(self):
+        self.assertEqual(RuleFingerprint(list(self.values)).getChangedRanges(RuleFingerprint(self.values[:990])), [])
+
+    def test_getChangedRanges_random(self):
+        random.seed(39)
+        for i in range(100):
+            old = [str(random.randint(0, 3)) for n in range(random.randint(0, 300))]
+            new = [str(random.randint(0, 3)) if random.random() < 0.05 else value for value in old]
+            new = new[:random.randint(0, len(new))] + [str(random.randint(0, 3)) for n in range(random.randint(0, 20))]
+            fingerprint = RuleFingerprint(old, random.randint(2, 8))
+            self.assertEqual(fingerprint.getChangedRanges(RuleFingerprint(new, fingerprint.fanout)), self.changedRanges(old, new))
+
+    def test_value_getChangedRanges_ValueErrorHandle(self):
+        with self.assertRaises(ValueError):
+            RuleFingerprint(list(self.values), 4).getChangedRanges(RuleFingerprint(list(self.values), 8))
+
+    def test_type_RuleFingerprint_TypeErrorHandle(self):
+        with self.assertRaises(TypeError):
+            RuleFingerprint("rules")
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
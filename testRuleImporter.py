@@ -0,0 +1,103 @@
+import unittest
+import os
+import shutil
+import tempfile
+from RuleImporter import *
+class testRuleImporter (unittest.TestCase):
+    '''
+    Class for testing the RuleImporter.py Class which is part of the PaloAlto API project
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    # PaAPI stand-in recording the rules it is asked to write
+    class FakePa:
+        def __init__(self, names=None):
+            self.written = []
+            self.names = names or []
+        def getFireWallRuleNames(self):
+            return self.names
+        def writeFireWallRules(self, rules):
+            self.written.append(rules)
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def writeFile(self, name, content):
+        path = os.path.join(self.directory, name)
+        newFile = open(path, 'w')
+        newFile.write(content)
+        newFile.close()
+        return path
+
+    def test_validate_csv(self):
+        path = self.writeFile("rules.csv", "name,act,src,app\nweb,allow,10.0.0.0/8;10.1.0.0/16,web-browsing\nblock,deny,,\n")
+        rules, errors = RuleImporter(path).validate()
+        self.assertEqual(errors, [])
+        self.assertEqual(rules[0].getRuleSource(), ["10.0.0.0/8", "10.1.0.0/16"])
+        self.assertEqual(rules[1].getRuleSource(), ["any"])
+        self.assertEqual(rules[1].getRuleLogEnd(), "yes")
+
+    def test_validate_csvErrors(self):
+        path = self.writeFile("rules.csv", "name,act,disable\na,allow,no\nb,drop,no\nc,allow,maybe\na,allow,no\n,allow,no\n")
+        importer = RuleImporter(path)
+        importer.chunkSize = 2
+        rules, errors = importer.validate()
+        self.assertEqual([rule.getRuleName() for rule in rules], ["a"])
+        self.assertEqual([error[0] for error in errors], [3, 4, 5, 6])
+        self.assertTrue("already defined on line 2" in errors[2][1])
+
+    def test_validate_unknownColumn(self):
+        path = self.writeFile("rules.csv", "name,act,color\na,allow,red\n")
+        self.assertEqual(RuleImporter(path).validate()[1], [(2, "Unknown columns: color")])
+
+    def test_importRules(self):
+        path = self.writeFile("rules.csv", "name,act\n" + "".join(["rule" + str(n) + ",allow\n" for n in range(50)]))
+        pa = self.FakePa()
+        self.assertEqual(RuleImporter(path).importRules(pa), 50)
+        self.assertEqual(len(pa.written), 1)
+        self.assertEqual(len(pa.written[0]), 50)
+
+    def test_importRules_nothingWrittenOnError(self):
+        path = self.writeFile("rules.csv", "name,act\na,allow\nb,maybe\n")
+        pa = self.FakePa()
+        with self.assertRaises(ValueError):
+            RuleImporter(path).importRules(pa)
+        self.assertEqual(pa.written, [])
+
+    def test_importRules_existingRule(self):
+        path = self.writeFile("rules.csv", "name,act\na,allow\nb,allow\n")
+        pa = self.FakePa(["b", "c"])
+        with self.assertRaises(ValueError) as error:
+            RuleImporter(path).importRules(pa)
+        self.assertTrue("already exist on the PaloAlto: b" in str(error.exception))
+        self.assertEqual(pa.written, [])
+
+    def test_validate_defaultsNotShared(self):
+        path = self.writeFile("rules.csv", "name,act\na,allow\nb,allow\n")
+        rules = RuleImporter(path).validate()[0]
+        rules[0].getRuleSource().append("10.0.0.0/8")
+        self.assertEqual(rules[1].getRuleSource(), ["any"])
+        self.assertEqual(RuleImporter.DEFAULTS["src"], ["any"])
+
+    @unittest.skipIf(yaml is None, "PyYAML is not installed")
+    def test_validate_yaml(self):
+        path = self.writeFile("rules.yaml", "- name: ssh\n  act: allow\n  app: ssh\n  logStart: yes\n  srv: [22]\n- name: bad\n  act: allow\n  negSrc: maybe\n")
+        rules, errors = RuleImporter(path).validate()
+        self.assertEqual(rules[0].getRuleApplication(), ["ssh"])
+        self.assertEqual(rules[0].getRuleLogStart(), "yes")
+        self.assertEqual(rules[0].getRuleService(), ["22"])
+        self.assertEqual([error[0] for error in errors], [6])
+
+    def test_value_RuleImporter_ValueErrorHandle(self):
+        with self.assertRaises(ValueError):
+            RuleImporter("rules.xls", "xls")
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
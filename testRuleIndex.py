@@ -0,0 +1,109 @@
+import unittest
+import random
+from Rules import *
+from NatRules import *
+from PbfRules import *
+from RuleIndex import *
+class testRuleIndex (unittest.TestCase):
+    '''
+    Class for testing the RuleIndex.py Class which is part of the PaloAlto API project
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    def newRule(self, name, src, app, memFrom=["trust"]):
+        return Rules(name, memFrom, ["untrust"], src, ["any"], ["any"], app, "allow", ["any"], "no", "no", "no", "no", [], [], "no", "yes", "")
+
+    def setUp(self):
+        self.rules = [
+                      self.newRule("web", ["web-servers"], ["web-browsing", "ssl"]),
+                      self.newRule("ssh", ["admins"], ["ssh"], ["dmz"]),
+                      self.newRule("both", ["web-servers", "admins"], ["ssh"])
+                      ]
+        self.index = RuleIndex(self.rules)
+
+    def test_find(self):
+        self.assertEqual(self.index.find(("src", "web-servers")), set(["web", "both"]))
+
+    def test_find_unknownMember(self):
+        self.assertEqual(self.index.find(("src", "nobody")), set())
+
+    def test_find_and(self):
+        self.assertEqual(self.index.find(("and", ("src", "admins"), ("app", "ssh"), ("memFrom", "trust"))), set(["both"]))
+
+    def test_find_nested(self):
+        query = ("or", ("app", "ssl"), ("and", ("app", "ssh"), ("memFrom", "dmz")))
+        self.assertEqual(self.index.find(query), set(["web", "ssh"]))
+
+    def test_findPositions(self):
+        self.assertEqual(self.index.findPositions(("app", "ssh"), self.rules), [1, 2])
+        self.index.removeRule("web")
+        self.assertEqual(self.index.findPositions(("src", "web-servers"), self.rules[1:]), [1])
+
+    def test_findMember(self):
+        self.assertEqual(self.index.findMember("admins"), set(["ssh", "both"]))
+
+    def test_updateRule(self):
+        self.rules[0].setRuleSource(["admins"])
+        self.index.updateRule(self.rules[0])
+        self.assertEqual(self.index.find(("src", "web-servers")), set(["both"]))
+        self.assertEqual(self.index.find(("src", "admins")), set(["web", "ssh", "both"]))
+
+    def test_removeRule(self):
+        self.index.removeRule("both")
+        self.assertEqual(self.index.find(("app", "ssh")), set(["ssh"]))
+        self.assertEqual(self.index.getRuleCount(), 2)
+
+    def test_incrementalMatchesRebuild(self):
+        random.seed(34)
+        members = ["m" + str(n) for n in range(8)]
+        index = RuleIndex()
+        rules = {}
+        for i in range(300):
+            name = "rule" + str(random.randint(0, 30))
+            if random.random() < 0.3:
+                index.removeRule(name)
+                rules.pop(name, None)
+            else:
+                rules[name] = self.newRule(name, random.sample(members, 2), random.sample(members, 2))
+                index.addRule(rules[name])
+        rebuilt = RuleIndex(list(rules.values()))
+        for member in members:
+            self.assertEqual(index.findMember(member), rebuilt.findMember(member))
+            self.assertEqual(index.find(("src", member)), rebuilt.find(("src", member)))
+
+    def test_natFields(self):
+        rules = [
+                 NatRules("out", ["trust"], ["untrust"], ["10.0.0.0/8"], ["any"], "any", "", "dynamic-ip-and-port", [], "", "", "no", "", "ethernet1/1"),
+                 NatRules("web", ["untrust"], ["untrust"], ["any"], ["1.2.3.4"], "service-http", "", "none", [], "10.1.1.1", "", "no", "")
+                 ]
+        index = RuleIndex(rules, RuleIndex.NAT_FIELDS)
+        self.assertEqual(index.find(("srcTransInterface", "ethernet1/1")), set(["out"]))
+        self.assertEqual(index.find(("and", ("memTo", "untrust"), ("dstTransAddr", "10.1.1.1"))), set(["web"]))
+        self.assertEqual(index.findMember("10.1.1.1"), set(["web"]))
+        self.assertEqual(index.getMembers("toInterface"), [])
+
+    def test_pbfFields(self):
+        rules = [
+                 PbfRules("isp2", ["trust"], ["10.2.0.0/16"], ["any"], ["any"], ["any"], ["any"], "forward", "ethernet1/3", "10.9.9.1", "no", ""),
+                 PbfRules("lab", ["trust"], ["10.3.0.0/16"], ["any"], ["any"], ["any"], ["any"], "forward-to-vsys", "", "", "no", "", "vsys2")
+                 ]
+        index = RuleIndex(rules, RuleIndex.PBF_FIELDS)
+        self.assertEqual(index.find(("egressIf", "ethernet1/3")), set(["isp2"]))
+        self.assertEqual(index.find(("toVsys", "vsys2")), set(["lab"]))
+        with self.assertRaises(ValueError):
+            index.find(("group", "any"))
+
+    def test_value_find_ValueErrorHandle(self):
+        with self.assertRaises(ValueError):
+            self.index.find(("color", "red"))
+
+    def test_type_find_TypeErrorHandle(self):
+        with self.assertRaises(TypeError):
+            self.index.find("src")
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
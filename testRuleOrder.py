@@ -0,0 +1,75 @@
+import unittest
+import random
+from RuleOrder import *
+class testRuleOrder (unittest.TestCase):
+    '''
+    Class for testing the RuleOrder.py Class which is part of the PaloAlto API project
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    # length of the longest increasing subsequence, the slow way
+    def longestIncreasing(self, values):
+        lengths = []
+        for i in range(len(values)):
+            lengths.append(1 + max([lengths[j] for j in range(i) if values[j] < values[i]] + [0]))
+        return max(lengths + [0])
+
+    def applyMoves(self, ruleNames, moves):
+        order = RuleOrder(ruleNames)
+        for move in moves:
+            order.applyMove(move[0], move[1], move[2])
+        return order.getRuleNames()
+
+    def test_getMoves_sameOrder(self):
+        self.assertEqual(RuleOrder(["a", "b", "c"]).getMoves(["a", "b", "c"]), [])
+
+    def test_getMoves_toTop(self):
+        self.assertEqual(RuleOrder(["a", "b", "c"]).getMoves(["c", "a", "b"]), [("c", "top", None)])
+
+    def test_getMoves_after(self):
+        self.assertEqual(RuleOrder(["a", "b", "c", "d"]).getMoves(["a", "c", "d", "b"]), [("b", "after", "d")])
+
+    def test_getMoves_reversed(self):
+        ruleNames = ["a", "b", "c", "d", "e"]
+        moves = RuleOrder(ruleNames).getMoves(list(reversed(ruleNames)))
+        self.assertEqual(len(moves), 4)
+        self.assertEqual(self.applyMoves(ruleNames, moves), list(reversed(ruleNames)))
+
+    def test_getMoves_randomAreMinimal(self):
+        random.seed(29)
+        for i in range(200):
+            ruleNames = ["rule" + str(n) for n in range(random.randint(0, 40))]
+            target = list(ruleNames)
+            random.shuffle(target)
+            moves = RuleOrder(ruleNames).getMoves(target)
+            self.assertEqual(self.applyMoves(ruleNames, moves), target)
+            self.assertEqual(len(moves), len(ruleNames) - self.longestIncreasing([ruleNames.index(name) for name in target]))
+
+    def test_applyMove_before(self):
+        order = RuleOrder(["a", "b", "c"])
+        order.applyMove("c", "before", "a")
+        self.assertEqual(order.getRuleNames(), ["c", "a", "b"])
+
+    def test_applyMove_bottom(self):
+        order = RuleOrder(["a", "b", "c"])
+        order.applyMove("a", "bottom")
+        self.assertEqual(order.getRuleNames(), ["b", "c", "a"])
+
+    def test_value_getMoves_ValueErrorHandle(self):
+        with self.assertRaises(ValueError):
+            RuleOrder(["a", "b"]).getMoves(["a", "c"])
+
+    def test_value_RuleOrder_ValueErrorHandle(self):
+        with self.assertRaises(ValueError):
+            RuleOrder(["a", "a"])
+
+    def test_type_RuleOrder_TypeErrorHandle(self):
+        with self.assertRaises(TypeError):
+            RuleOrder("abc")
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
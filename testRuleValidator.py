@@ -0,0 +1,66 @@
+import unittest
+from RuleValidator import *
+from Rules import *
+from NatRules import *
+class testRuleValidator (unittest.TestCase):
+    '''
+    Class for testing the RuleValidator.py Class which is part of the PaloAlto API project
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    def setUp(self):
+        self.validator = RuleValidator({
+                                        "zone": ["trust", "untrust"], "address": ["web-servers"], "application": ["web-browsing", "ssl"],
+                                        "service": ["tcp-8443"], "profile-group": ["bellus"], "hip-profile": []
+                                        })
+
+    def newRule(self, name, memTo, src, app, group):
+        return Rules(name, ["trust"], memTo, src, ["any"], ["application-default"], app, "allow", ["any"], "no", "no", "no", "no", group, [], "no", "yes", "")
+
+    def test_checkRule(self):
+        self.assertEqual(self.validator.checkRule(self.newRule("web", ["untrust"], ["web-servers"], ["web-browsing", "ssl"], ["bellus"])), [])
+
+    def test_checkRule_addresses(self):
+        rule = self.newRule("web", ["untrust"], ["10.0.0.1", "10.0.0.0/24", "10.0.0.1-10.0.0.9", "2001:db8::/32", "US"], ["any"], [])
+        self.assertEqual(self.validator.checkRule(rule), [])
+
+    def test_checkRule_unknown(self):
+        rule = self.newRule("web", ["dmz"], ["web-server", "10.0.0.300"], ["ssh"], ["bellus", "strict"])
+        self.assertEqual(self.validator.checkRule(rule), [
+                                                          "Unknown zone 'dmz'", "Unknown address 'web-server'", "Unknown address '10.0.0.300'",
+                                                          "Unknown application 'ssh'", "Unknown profile-group 'strict'"
+                                                          ])
+
+    def test_checkRule_notLoaded(self):
+        validator = RuleValidator({"zone": ["trust"]})
+        self.assertEqual(validator.checkRule(self.newRule("web", ["trust"], ["anything"], ["ssh"], ["strict"])), [])
+
+    def test_checkRule_nat(self):
+        rule = NatRules("nat", ["trust"], ["untrust"], ["web-servers"], ["any"], "tcp-8443", "", "dynamic-ip-and-port", ["outside"], "", "", "no", "")
+        self.assertEqual(self.validator.checkRule(rule), ["Unknown address 'outside'"])
+
+    def test_addName(self):
+        self.validator.addName("address", "new-servers")
+        self.assertEqual(self.validator.checkRule(self.newRule("web", ["untrust"], ["new-servers"], ["any"], [])), [])
+
+    def test_checkRules(self):
+        rules = [self.newRule("good", ["untrust"], ["web-servers"], ["ssl"], []), self.newRule("bad", ["dmz"], ["web-servers"], ["ssh"], [])]
+        self.assertEqual(self.validator.validate(rules), [("bad", "Unknown zone 'dmz'"), ("bad", "Unknown application 'ssh'")])
+        with self.assertRaises(ValueError):
+            self.validator.checkRules(rules)
+        self.validator.checkRules(rules[:1])
+
+    def test_value_setNames_ValueErrorHandle(self):
+        with self.assertRaises(ValueError):
+            self.validator.setNames("user", [])
+
+    def test_type_RuleValidator_TypeErrorHandle(self):
+        with self.assertRaises(TypeError):
+            RuleValidator(["trust"])
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
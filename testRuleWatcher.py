@@ -0,0 +1,166 @@
+import unittest
+from RuleWatcher import *
+from RuleIndex import *
+from Rules import *
+class testRuleWatcher (unittest.TestCase):
+    '''
+    Class for testing the RuleWatcher.py Class which is part of the PaloAlto API project
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    # stands in for the PaAPI object, the PaloAlto is a list of rule names and a config log
+    class FakePaAPI:
+        def __init__(self, names):
+            self.vsys = "vsys1"
+            self.logs = []
+            self.names = list(names)
+            self.rules = [testRuleWatcher.newRule(name) for name in names]
+            self.ruleIndex = RuleIndex(self.rules)
+            self.fetched = []
+            self.refreshed = 0
+            self.snapshots = []
+
+        def log(self, cmd, path=""):
+            self.logs.append({"seqno": len(self.logs) + 1, "cmd": cmd, "path": path})
+
+        def getConfigLogs(self, afterSeqno=None, nlogs=100):
+            if afterSeqno is None:
+                return self.logs[-nlogs:]
+            return [entry for entry in self.logs if entry["seqno"] > afterSeqno][:nlogs]
+
+        def getFireWallRuleNames(self):
+            return list(self.names)
+
+        def fetchFireWallRules(self, ruleNames):
+            self.fetched.extend(ruleNames)
+            for ruleName in ruleNames:
+                if not self.ruleIndex.hasRule(ruleName):
+                    self.rules.append(testRuleWatcher.newRule(ruleName))
+                    self.ruleIndex.addRule(self.rules[-1])
+
+        def sortFireWallRules(self, ruleNames):
+            loaded = dict([(rule.getRuleName(), rule) for rule in self.rules])
+            self.rules = [loaded[ruleName] for ruleName in ruleNames if ruleName in loaded]
+            self.ruleIndex = RuleIndex(self.rules)
+
+        def refreshFireWallRules(self):
+            self.refreshed = self.refreshed + 1
+            return [(0, len(self.rules) - 1)]
+
+        def saveSnapshot(self, path):
+            self.snapshots.append((path, [rule.getRuleName() for rule in self.rules]))
+
+    @staticmethod
+    def newRule(name):
+        return Rules(name, ["trust"], ["untrust"], ["any"], ["any"], ["any"], ["any"], "allow", ["any"], "no", "no", "no", "no", [], [], "no", "yes", "")
+
+    def setUp(self):
+        self.pa = self.FakePaAPI(["allow web", "allow", "deny"])
+        self.pa.log("commit")
+        self.watcher = RuleWatcher(self.pa, 10)
+        self.watcher.poll()
+
+    def test_getRuleName(self):
+        self.assertEqual(self.watcher.getRuleName("vsys  vsys1 rulebase security rules  deny"), "deny")
+        self.assertEqual(self.watcher.getRuleName("vsys  vsys1 rulebase security rules  deny source"), "deny")
+        self.assertEqual(self.watcher.getRuleName("vsys  vsys1 rulebase security rules  allow web action"), "allow web")
+        self.assertEqual(self.watcher.getRuleName("vsys  vsys1 rulebase security rules  allow action"), "allow")
+        self.assertEqual(self.watcher.getRuleName("vsys  vsys1 rulebase security rules  new-rule"), "new-rule")
+        self.assertEqual(self.watcher.getRuleName("vsys  vsys1 rulebase security rules"), "")
+
+    def test_getRuleName_other(self):
+        self.assertEqual(self.watcher.getRuleName("vsys  vsys1 address  web"), None)
+        self.assertEqual(self.watcher.getRuleName("vsys  vsys1 rulebase nat rules  deny"), None)
+        self.assertEqual(self.watcher.getRuleName("vsys  vsys2 rulebase security rules  deny"), None)
+
+    def test_poll_baseline(self):
+        self.assertEqual(self.watcher.getLastSeqno(), 1)
+        self.assertEqual(self.watcher.poll(), [])
+
+    def test_poll_uncommitted(self):
+        self.pa.log("edit", "vsys  vsys1 rulebase security rules  deny")
+        self.assertEqual(self.watcher.poll(), [])
+        self.pa.log("commit")
+        self.assertEqual(self.watcher.poll(), ["deny"])
+
+    def test_poll_committed(self):
+        self.pa.log("edit", "vsys  vsys1 rulebase security rules  deny")
+        self.pa.log("edit", "vsys  vsys1 address  web")
+        self.pa.log("rename", "vsys  vsys1 rulebase security rules  allow")
+        self.pa.names[1] = "allow-all"
+        self.pa.log("commit")
+        self.pa.log("edit", "vsys  vsys1 rulebase security rules  allow web")
+        self.assertEqual(self.watcher.poll(), ["allow-all", "deny"])
+        self.assertEqual([rule.getRuleName() for rule in self.pa.rules], ["allow web", "allow-all", "deny"])
+        self.pa.log("commit")
+        self.assertEqual(self.watcher.poll(), ["allow web"])
+        self.assertEqual(self.watcher.getRefreshCount(), 3)
+
+    def test_poll_moved(self):
+        self.pa.log("move", "vsys  vsys1 rulebase security rules  deny")
+        self.pa.names = ["deny", "allow web", "allow"]
+        self.pa.log("commit")
+        self.watcher.poll()
+        self.assertEqual([rule.getRuleName() for rule in self.pa.rules], ["deny", "allow web", "allow"])
+
+    def test_poll_paged(self):
+        self.watcher.nlogs = 10
+        for n in range(25):
+            self.pa.log("edit", "vsys  vsys1 address  a" + str(n))
+        self.pa.log("edit", "vsys  vsys1 rulebase security rules  deny")
+        self.pa.log("commit")
+        self.assertEqual(self.watcher.poll(), ["deny"])
+        self.assertEqual(self.watcher.getLastSeqno(), 28)
+
+    def test_poll_moreThanNlogs(self):
+        # The PaloAlto may send more entries than asked for, they are all read
+        self.watcher.nlogs = 10
+        self.pa.getConfigLogs = lambda afterSeqno=None, nlogs=100: [entry for entry in self.pa.logs if entry["seqno"] > afterSeqno]
+        self.pa.log("edit", "vsys  vsys1 rulebase security rules  deny")
+        for n in range(25):
+            self.pa.log("edit", "vsys  vsys1 address  a" + str(n))
+        self.pa.log("commit")
+        self.assertEqual(self.watcher.poll(), ["deny"])
+        self.assertEqual(self.watcher.getLastSeqno(), 28)
+        self.assertEqual(self.pa.refreshed, 0)
+
+    def test_poll_missedEntries(self):
+        # Newest entries first: the oldest entries after the last seqno are missed, every rule is read again
+        self.watcher.nlogs = 10
+        self.pa.getConfigLogs = lambda afterSeqno=None, nlogs=100: [entry for entry in self.pa.logs if entry["seqno"] > afterSeqno][-nlogs:]
+        self.pa.log("edit", "vsys  vsys1 rulebase security rules  deny")
+        self.pa.log("commit")
+        for n in range(25):
+            self.pa.log("edit", "vsys  vsys1 address  a" + str(n))
+        self.assertEqual(self.watcher.poll(), ["allow web", "allow", "deny"])
+        self.assertEqual(self.pa.refreshed, 1)
+        self.assertEqual(self.watcher.getLastSeqno(), 28)
+
+    def test_poll_wholeRulebase(self):
+        self.pa.log("set", "vsys  vsys1 rulebase security rules")
+        self.pa.log("commit")
+        self.assertEqual(self.watcher.poll(), ["allow web", "allow", "deny"])
+        self.assertEqual(self.pa.refreshed, 1)
+
+    def test_poll_snapshot(self):
+        self.watcher.snapshotPath = "rules.snap"
+        self.pa.log("edit", "vsys  vsys1 address  web")
+        self.pa.log("commit")
+        self.watcher.poll()
+        self.assertEqual(self.pa.snapshots, [])
+        self.pa.log("move", "vsys  vsys1 rulebase security rules  deny")
+        self.pa.names = ["deny", "allow web", "allow"]
+        self.pa.log("commit")
+        self.watcher.poll()
+        self.assertEqual(self.pa.snapshots, [("rules.snap", ["deny", "allow web", "allow"])])
+
+    def test_value_RuleWatcher_ValueErrorHandle(self):
+        with self.assertRaises(ValueError):
+            RuleWatcher(self.pa, 0)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
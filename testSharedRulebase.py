@@ -0,0 +1,64 @@
+import unittest
+import os
+import tempfile
+from SharedRulebase import *
+class testSharedRulebase (unittest.TestCase):
+    '''
+    Class for testing the SharedRulebase.py Class which is part of the PaloAlto API project
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    def newRule(self, name):
+        return Rules(name, ["trust"], ["untrust"], ["any"], ["any"], ["any"], ["any"], "allow", ["any"], "no", "no", "no", "no", [], [], "no", "yes", "")
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "rules.snap")
+        Snapshot.save(self.path, [self.newRule("rule" + str(n)) for n in range(10)])
+        self.rulebase = SharedRulebase(self.path, 0)
+
+    def tearDown(self):
+        for name in os.listdir(self.directory):
+            os.remove(os.path.join(self.directory, name))
+        os.rmdir(self.directory)
+
+    def test_getRules(self):
+        self.assertEqual(len(self.rulebase.getRules()), 10)
+        self.assertEqual(self.rulebase.getRules()[3].getRuleName(), "rule3")
+        self.assertEqual(self.rulebase.getRule("rule5").getRuleName(), "rule5")
+        self.assertEqual(self.rulebase.getRule("missing"), None)
+
+    def test_swap(self):
+        old = self.rulebase.getRules()
+        Snapshot.save(self.path, [self.newRule("new")] + [self.newRule("rule" + str(n)) for n in range(10)])
+        new = self.rulebase.getRules()
+        self.assertEqual(self.rulebase.getSwapCount(), 1)
+        self.assertEqual(self.rulebase.getRuleNames()[0], "new")
+        # The version taken before the swap does not change
+        self.assertEqual(len(old), 10)
+        self.assertEqual(old[0].getRuleName(), "rule0")
+        self.assertEqual(len(new), 11)
+        self.assertFalse(self.rulebase.refresh())
+
+    def test_checkInterval(self):
+        rulebase = SharedRulebase(self.path, 3600)
+        Snapshot.save(self.path, [self.newRule("new")])
+        self.assertEqual(len(rulebase.getRules()), 10)
+        self.assertTrue(rulebase.refresh())
+        self.assertEqual(len(rulebase.getRules()), 1)
+
+    def test_refresh_missing(self):
+        os.remove(self.path)
+        self.assertFalse(self.rulebase.refresh())
+        self.assertEqual(len(self.rulebase.getRules()), 10)
+
+    def test_value_SharedRulebase_ValueErrorHandle(self):
+        with self.assertRaises(ValueError):
+            SharedRulebase(self.path, -1)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,74 @@
+import unittest
+import threading
+import time
+from SingleFlight import *
+class testSingleFlight (unittest.TestCase):
+    '''
+    Class for testing the SingleFlight.py Class which is part of the PaloAlto API project
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    def setUp(self):
+        self.calls = 0
+        self.flight = SingleFlight()
+
+    def slowCall(self):
+        self.calls = self.calls + 1
+        time.sleep(0.2)
+        return ["entry"]
+
+    def failedCall(self):
+        time.sleep(0.2)
+        raise IOError("Connection refused")
+
+    # runs do from count threads at the same moment, returns the results (or errors)
+    def run_threads(self, key, function, count):
+        results = []
+        def run():
+            try:
+                results.append(self.flight.do(key, function))
+            except IOError as e:
+                results.append(e)
+        threads = [threading.Thread(target=run) for n in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_do(self):
+        self.assertEqual(self.flight.do("report", lambda: 42), 42)
+        self.assertEqual(self.flight.getInFlightCount(), 0)
+
+    def test_do_shared(self):
+        results = self.run_threads("report", self.slowCall, 10)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(results, [["entry"]] * 10)
+        self.assertEqual(self.flight.getCallCount(), 1)
+        self.assertEqual(self.flight.getSharedCount(), 9)
+
+    def test_do_keys(self):
+        threads = [threading.Thread(target=self.run_threads, args=(key, self.slowCall, 3)) for key in ("a", "b")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.calls, 2)
+
+    def test_do_notCached(self):
+        self.flight.do("report", self.slowCall)
+        self.flight.do("report", self.slowCall)
+        self.assertEqual(self.calls, 2)
+
+    def test_do_error(self):
+        results = self.run_threads("report", self.failedCall, 5)
+        self.assertEqual([str(result) for result in results], ["Connection refused"] * 5)
+        self.assertEqual(self.flight.getInFlightCount(), 0)
+        self.assertEqual(self.flight.do("report", lambda: 42), 42)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
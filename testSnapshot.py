@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+import unittest
+import os
+import mmap
+import tempfile
+from Snapshot import *
+class testSnapshot (unittest.TestCase):
+    '''
+    Class for testing the Snapshot.py Class which is part of the PaloAlto API project
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    def newRule(self, name, src, desc):
+        return Rules(name, ["trust", "untrust"], ["untrust"], src, ["any"], ["service-http"], ["web-browsing"], "allow", ["any"], "no", "no", "no", "no", ["bellus"], [], "no", "yes", desc)
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "rules.snap")
+        self.rules = [self.newRule("rule" + str(n), ["10.0." + str(n) + ".0/24", "any"], "Rule " + str(n)) for n in range(50)]
+        self.rules.append(self.newRule("empty", [], ""))
+        self.rules.append(self.newRule("blank", [None], "caf\xc3\xa9" if str is bytes else u"caf\xe9"))
+        Snapshot.save(self.path, self.rules)
+        self.snapshot = Snapshot(self.path)
+
+    def tearDown(self):
+        self.snapshot.close()
+        for name in os.listdir(self.directory):
+            os.remove(os.path.join(self.directory, name))
+        os.rmdir(self.directory)
+
+    def values(self, rule):
+        return tuple([getattr(rule, field[0]) for field in Snapshot.FIELDS])
+
+    def test_getRules(self):
+        self.assertEqual(self.snapshot.getRuleCount(), len(self.rules))
+        self.assertEqual([self.values(rule) for rule in self.snapshot.getRules()], [self.values(rule) for rule in self.rules])
+
+    def test_getRuleNames(self):
+        self.assertEqual(self.snapshot.getRuleNames(), [rule.getRuleName() for rule in self.rules])
+
+    def test_findRule(self):
+        for position in range(len(self.rules)):
+            self.assertEqual(self.snapshot.findRule(self.rules[position].getRuleName()), position)
+        self.assertEqual(self.snapshot.findRule("missing"), -1)
+
+    def test_sequence(self):
+        self.assertEqual(len(self.snapshot), len(self.rules))
+        self.assertEqual(self.snapshot[-1].getRuleName(), "blank")
+        self.assertEqual([rule.getRuleName() for rule in self.snapshot[1:3]], ["rule1", "rule2"])
+        self.assertEqual([rule.getRuleName() for rule in self.snapshot], [rule.getRuleName() for rule in self.rules])
+        self.assertEqual(self.values(self.snapshot.getRuleByName("rule7")), self.values(self.rules[7]))
+        self.assertEqual(self.snapshot.getRuleByName("missing"), None)
+
+    def test_stringsAreShared(self):
+        # "trust", "any", "allow", "no"... are only stored once
+        self.assertTrue(self.snapshot.stringCount < 4 * len(self.rules))
+
+    def test_diff(self):
+        older = Snapshot(self.path)
+        changed = self.newRule("rule1", ["any"], "Rule 1")
+        Snapshot.save(self.path, [changed] + [rule for rule in self.rules if rule.getRuleName() not in ("rule1", "rule2")] + [self.newRule("new", [], "")])
+        newer = Snapshot(self.path)
+        self.assertEqual(newer.diff(older), (["new"], ["rule2"], ["rule1"]))
+        newer.close()
+        older.close()
+
+    def test_save_manyMembers(self):
+        # more members than a 16 bit count can hold
+        addresses = ["10." + str(n // 65536) + "." + str(n // 256 % 256) + "." + str(n % 256) for n in range(70000)]
+        Snapshot.save(self.path, [self.newRule("big", addresses, "")])
+        snapshot = Snapshot(self.path)
+        self.assertEqual(snapshot.getRule(0).getRuleSource(), addresses)
+        snapshot.close()
+        self.assertEqual(os.listdir(self.directory), ["rules.snap"])
+
+    def test_value_Snapshot_ValueErrorHandle(self):
+        badPath = os.path.join(self.directory, "bad.snap")
+        badFile = open(badPath, 'wb')
+        badFile.write(b"not a snapshot at all, just some bytes")
+        badFile.close()
+        with self.assertRaises(ValueError):
+            Snapshot(badPath)
+
+    def test_value_Snapshot_closesMapping(self):
+        badPath = os.path.join(self.directory, "bad.snap")
+        badFile = open(badPath, 'wb')
+        badFile.write(b"not a snapshot at all, just some bytes")
+        badFile.close()
+        realMmap = mmap.mmap
+        mapped = []
+        mmap.mmap = lambda *args, **kwargs: mapped.append(realMmap(*args, **kwargs)) or mapped[-1]
+        try:
+            with self.assertRaises(ValueError):
+                Snapshot(badPath)
+        finally:
+            mmap.mmap = realMmap
+        with self.assertRaises(ValueError):
+            mapped[0].read(1)
+
+    def test_getRule_IndexErrorHandle(self):
+        with self.assertRaises(IndexError):
+            self.snapshot.getRule(len(self.rules))
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,116 @@
+import unittest
+import threading
+import time
+from UserIDBuffer import *
+class testUserIDBuffer (unittest.TestCase):
+    '''
+    Class for testing the UserIDBuffer.py Class which is part of the PaloAlto API project
+
+        Authors:
+            David Rice riceda@potsdam.edu
+        Last Updated:
+            10/19/2026
+    '''
+
+    # stands in for the PaAPI object, keeps the messages instead of sending them
+    class FakePaAPI:
+        def __init__(self, delay=0.0, error=None):
+            self.messages = []
+            self.delay = delay
+            self.error = error
+
+        def sendUserIDMessage(self, message):
+            time.sleep(self.delay)
+            if self.error:
+                raise self.error
+            self.messages.append(message)
+            return "success"
+
+    def message(self, payload):
+        return "<uid-message><version>1.0</version><type>update</type><payload>" + payload + "</payload></uid-message>"
+
+    def test_genMessageXML(self):
+        pa = self.FakePaAPI()
+        buf = UserIDBuffer(pa, maxDelay=10)
+        buf.registerIP("10.0.0.1", ["web", "db"])
+        buf.unregisterIP("10.0.0.2", ["web"])
+        buf.login("corp\\alice", "10.0.0.3", 60)
+        buf.logout("corp\\bob", "10.0.0.4")
+        buf.close()
+        self.assertEqual(pa.messages, [self.message(
+                "<register><entry ip=\"10.0.0.1\"><tag><member>web</member><member>db</member></tag></entry></register>"
+                "<unregister><entry ip=\"10.0.0.2\"><tag><member>web</member></tag></entry></unregister>"
+                "<login><entry name=\"corp\\alice\" ip=\"10.0.0.3\" timeout=\"60\"/></login>"
+                "<logout><entry name=\"corp\\bob\" ip=\"10.0.0.4\"/></logout>"
+                )])
+
+    def test_latestChange(self):
+        pa = self.FakePaAPI()
+        buf = UserIDBuffer(pa, maxDelay=10)
+        buf.registerIP("10.0.0.1", ["web"])
+        buf.unregisterIP("10.0.0.1", ["web"])
+        buf.login("corp\\alice", "10.0.0.3")
+        buf.logout("corp\\alice", "10.0.0.3")
+        self.assertEqual(buf.getPendingCount(), 2)
+        buf.close()
+        self.assertEqual(pa.messages, [self.message(
+                "<unregister><entry ip=\"10.0.0.1\"><tag><member>web</member></tag></entry></unregister>"
+                "<logout><entry name=\"corp\\alice\" ip=\"10.0.0.3\"/></logout>"
+                )])
+
+    def test_maxEntries(self):
+        pa = self.FakePaAPI()
+        buf = UserIDBuffer(pa, 10, 10)
+        for n in range(25):
+            buf.registerIP("10.0.0." + str(n), ["web"])
+        time.sleep(0.2)
+        # two full messages are sent right away, the last 5 changes wait for maxDelay
+        self.assertEqual(buf.getMessageCount(), 2)
+        buf.close()
+        self.assertEqual(buf.getMessageCount(), 3)
+        self.assertEqual(buf.getEntryCount(), 25)
+
+    def test_maxDelay(self):
+        pa = self.FakePaAPI()
+        buf = UserIDBuffer(pa, 10, 0.1)
+        buf.registerIP("10.0.0.1", ["web"])
+        time.sleep(0.4)
+        self.assertEqual(len(pa.messages), 1)
+        buf.close()
+
+    def test_maxPending(self):
+        pa = self.FakePaAPI(0.2)
+        buf = UserIDBuffer(pa, 5, 0, 5)
+        start = time.time()
+        for n in range(15):
+            buf.registerIP("10.0.0." + str(n), ["web"])
+            self.assertTrue(buf.getPendingCount() <= 5)
+        # adding waited for the first message to be sent
+        self.assertTrue(time.time() - start >= 0.15)
+        buf.close()
+        self.assertEqual(buf.getEntryCount(), 15)
+
+    def test_error(self):
+        buf = UserIDBuffer(self.FakePaAPI(error=ValueError("invalid entry")), maxDelay=0)
+        buf.registerIP("10.0.0.1", ["web"])
+        with self.assertRaises(ValueError):
+            buf.flush()
+        buf.close()
+        self.assertEqual(buf.getMessageCount(), 0)
+
+    def test_value_UserIDBuffer_ValueErrorHandle(self):
+        with self.assertRaises(ValueError):
+            UserIDBuffer(self.FakePaAPI(), 10, 1.0, 5)
+        buf = UserIDBuffer(self.FakePaAPI())
+        buf.close()
+        with self.assertRaises(ValueError):
+            buf.registerIP("10.0.0.1", ["web"])
+
+    def test_type_registerIP_TypeErrorHandle(self):
+        buf = UserIDBuffer(self.FakePaAPI())
+        with self.assertRaises(TypeError):
+            buf.registerIP("10.0.0.1", "web")
+        buf.close()
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file